@@ -0,0 +1,102 @@
+"""
+Measures how long LyricManager's command-line interface takes to import, i.e. its cold-start time, and guards against
+heavy third-party packages being imported up-front.
+
+Lyric fetchers, aligners and their dependencies are only imported once they're used. If a change causes any of them to
+be imported regardless, this benchmark reports it and exits with a non-zero exit code.
+
+Execute from the repository root:
+    python benchmarks/benchmark_import_time.py
+    python benchmarks/benchmark_import_time.py --repetitions 20 --max-milliseconds 250
+"""
+# Python
+import sys
+import json
+import statistics
+import subprocess
+from pathlib import Path
+from argparse import ArgumentParser
+
+# 3rd Party
+
+
+# 1st Party
+
+
+path_to_repository = Path(__file__).absolute().parent.parent
+
+# Packages which must not be imported merely by importing the command-line interface
+packages_imported_on_use = [
+    "lyricsgenius",
+    "lyrics_extractor",
+    "jsonpickle",
+    "jsons",
+    "requests",
+    "tqdm",
+    "src.lyric.fetchers.lyric_fetcher_pypi_lyricsgenius",
+    "src.lyric.fetchers.lyric_fetcher_pypi_lyrics_extractor",
+    "src.lyric.fetchers.lyric_fetcher_local_file",
+]
+
+# Executed in a fresh interpreter, so nothing has been imported beforehand
+code_measure_import = """
+import sys, json, time
+time_start = time.perf_counter()
+import lyric_manager_cli
+time_elapsed = time.perf_counter() - time_start
+print(json.dumps({"seconds": time_elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure_import() -> tuple[float, list[str]]:
+    """ Returns the time taken to import the command-line interface, and all modules imported as a consequence. """
+    completed_process = subprocess.run(
+        [sys.executable, "-c", code_measure_import],
+        cwd=path_to_repository,
+        capture_output=True,
+        text=True,
+        check=True)
+
+    result = json.loads(completed_process.stdout.splitlines()[-1])
+
+    return result["seconds"], result["modules"]
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measures the import time of LyricManager's command-line interface.")
+    parser.add_argument("--repetitions", type=int, default=10)
+    parser.add_argument("--max-milliseconds", type=float, default=None,
+        help="Fail if the median import time exceeds this many milliseconds.")
+    arguments = parser.parse_args()
+
+    durations = []
+    modules_imported = set()
+
+    for _ in range(arguments.repetitions):
+        seconds, modules = measure_import()
+        durations.append(seconds * 1000.0)
+        modules_imported.update(modules)
+
+    median = statistics.median(durations)
+
+    print(f"Import of lyric_manager_cli over {arguments.repetitions} repetitions:")
+    print(f"  median {median:8.1f} ms")
+    print(f"  min    {min(durations):8.1f} ms")
+    print(f"  max    {max(durations):8.1f} ms")
+
+    failed = False
+
+    imported_too_early = [package for package in packages_imported_on_use if package in modules_imported]
+    if imported_too_early:
+        print(f"Imported up-front, but should only be imported on use: {', '.join(imported_too_early)}")
+        failed = True
+
+    if arguments.max_milliseconds is not None and median > arguments.max_milliseconds:
+        print(f"Median import time exceeds {arguments.max_milliseconds} ms.")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
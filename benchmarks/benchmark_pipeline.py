@@ -0,0 +1,326 @@
+"""
+Measures the throughput and peak memory of each of LyricManager's lyric processing stages, on a synthetic library.
+
+No network access, lyric aligner or GPU is required. The synthetic library is generated from a fixed seed, and consists
+of fake audio file paths, each accompanied by:
+    - A local lyric file (.txt), with '[Verse]'-style tags and '{lyrics|N}' multipliers.
+    - A NUSAutoLyrixAlign-style timing file (.nusalaoffline), with injected 'BREATH*' and dropped words.
+
+Stages are measured in the order LyricManager processes a song, each receiving the output of the previous stage:
+    fetch           LyricFetcherLocalFile reading and sanitizing the local lyric files
+    sanitize        LyricSanitizer with Genius' rules on raw lyrics, including a trailing 'Embed'
+    expand          LyricExpander expanding multipliers, and splitting the lyrics into lines
+    prepare         LyricMatcher converting lyric lines into alignment ready words
+    parse_timings   Reading and parsing the timing files
+    match_greedy    LyricMatcher matching timings to words, using LyricMatchingMethod.Greedy
+    match_global    LyricMatcher matching timings to words, using LyricMatchingMethod.GlobalAlignment
+    export          LyricAlignTask.convert_best_aligment_lyrics_to_dict() and Json serialization
+
+Throughput is the best of several repetitions, and peak memory is measured in a separate, traced repetition, as tracing
+slows down execution. Results can be saved and compared against those of another commit.
+
+Execute from the repository root:
+    python benchmarks/benchmark_pipeline.py
+    python benchmarks/benchmark_pipeline.py --songs 500 --output before.json
+    python benchmarks/benchmark_pipeline.py --songs 500 --baseline before.json
+"""
+# Python
+import sys
+import json
+import random
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+from time import perf_counter
+from pathlib import Path
+from dataclasses import dataclass
+from argparse import ArgumentParser
+from typing import Any, Callable, Optional
+
+# 3rd Party
+
+
+# 1st Party
+path_to_repository = Path(__file__).absolute().parent.parent
+sys.path.insert(0, str(path_to_repository))
+
+from src.developer_options import DeveloperOptions
+from src.lyric import LyricExpander, LyricMatcher, LyricSanitizer, SanitizationRules
+from src.lyric.aligners import WordTimings
+from src.lyric.dataclasses_and_types import LyricAlignTask, LyricMatchingMethod
+from src.lyric.fetchers.lyric_fetcher_local_file import LyricFetcherLocalFile
+
+
+vocabulary = (
+    "love heart night baby fire dance dream time away never forever tonight feel light world run home "
+    "rain sky burning hold tell know little down up stay gone cold gold wild free falling alone together "
+    "don't can't I'm you're we're ain't talkin' movin' glancin' oh yeah hey whoa"
+).split()
+
+section_names = ["Intro", "Verse 1", "Pre-Chorus", "Chorus", "Verse 2", "Bridge", "Outro"]
+
+
+def generate_line(rng: random.Random) -> str:
+    words = rng.choices(vocabulary, k=rng.randint(4, 10))
+    words[0] = words[0].capitalize()
+
+    # Punctuation and hyphenation, which the matcher must split off and re-attach
+    if rng.random() < 0.3:
+        words[-1] += rng.choice([",", "!", "?", "..."])
+    if rng.random() < 0.15:
+        index = rng.randrange(len(words) - 1)
+        words[index:index + 2] = [f"{words[index]}-{words[index + 1]}"]
+    if rng.random() < 0.1:
+        words[0] = f"({words[0]}"
+        words[-1] = f"{words[-1]})"
+
+    return " ".join(words)
+
+
+def generate_lyrics(rng: random.Random) -> str:
+    """ Returns lyrics in the form of a local lyric file, with section tags and multipliers. """
+    sections = []
+
+    chorus = "\n".join(generate_line(rng) for _ in range(4))
+
+    for section_name in section_names:
+        lines = [f"[{section_name}]"]
+
+        if section_name == "Chorus":
+            lines.append(f"{{{chorus}|{rng.randint(2, 4)}}}")
+        else:
+            lines.extend(generate_line(rng) for _ in range(rng.randint(3, 8)))
+
+            # A short repeated phrase, occasionally nested inside another multiplier
+            if rng.random() < 0.5:
+                phrase = generate_line(rng)
+                if rng.random() < 0.3:
+                    phrase = f"{generate_line(rng)} {{{phrase}|2}}"
+                lines.append(f"{{{phrase}|{rng.randint(2, 8)}}}")
+
+        sections.append("\n".join(lines))
+
+    return "\n\n".join(sections)
+
+
+def generate_lyrics_genius_raw(rng: random.Random, lyrics: str) -> str:
+    """ Returns the lyrics as raw lyrics from Genius would look, i.e. with curly apostrophes and a trailing 'Embed'. """
+    lyrics = lyrics.replace("'", "’")
+    return f"{lyrics}You might also like{rng.randint(1, 99)}Embed"
+
+
+def generate_timings(rng: random.Random, words_alignment_ready: list[str]) -> str:
+    """ Returns timings of the given words, as NUSAutoLyrixAlign would produce them.
+
+    As NUSAutoLyrixAlign does, 'BREATH*' is occasionally inserted and words are occasionally skipped.
+    """
+    lines = []
+    time = rng.uniform(5.0, 20.0)
+
+    def add(word: str):
+        nonlocal time
+        duration = rng.uniform(0.1, 0.6)
+        lines.append(f"{time:.2f} {time + duration:.2f} {word}")
+        time += duration
+
+    for word in words_alignment_ready:
+        if rng.random() < 0.05:
+            add("BREATH*")
+
+        if rng.random() < 0.03:
+            continue
+
+        add(word.upper())
+
+    return "\n".join(lines)
+
+
+@dataclass
+class SyntheticSong:
+    path_to_audio_file: Path
+    lyrics_genius_raw: str
+
+
+def generate_library(path_to_library: Path, amount_songs: int, seed: int) -> list[SyntheticSong]:
+    """ Writes a local lyric file and a timing file for each song to the given directory. Audio files aren't written. """
+    rng = random.Random(seed)
+    expander = LyricExpander()
+    matcher = LyricMatcher(DeveloperOptions.json_schema_version)
+    sanitizer = LyricSanitizer(LyricFetcherLocalFile.sanitization_rules)
+
+    songs = []
+
+    for index in range(amount_songs):
+        path_to_audio_file = path_to_library / f"Artist {index % 97} - Song {index}.mp3"
+
+        lyrics = generate_lyrics(rng)
+        path_to_audio_file.with_suffix(".txt").write_text(lyrics, encoding="utf-8")
+
+        # Timings are generated from the same alignment ready words the pipeline produces
+        lyrics_sanitized = sanitizer.sanitize(lyrics)
+        lines_expanded = [line for line in expander.expand_lyrics(path_to_audio_file.stem, lyrics_sanitized).splitlines() if line]
+        words_alignment_ready = [lyric.word_alignment for lyric in matcher.convert_lyrics_string_to_match_lyrics(lines_expanded)]
+
+        path_to_audio_file.with_suffix(".nusalaoffline").write_text(generate_timings(rng, words_alignment_ready))
+
+        songs.append(SyntheticSong(path_to_audio_file, generate_lyrics_genius_raw(rng, lyrics)))
+
+    return songs
+
+
+@dataclass
+class Stage:
+    """ A processing stage, measured by applying process() to each of the inputs returned by prepare_inputs(). """
+    name: str
+    prepare_inputs: Callable[[], list[Any]]
+    process: Callable[[Any], Any]
+
+
+@dataclass
+class StageResult:
+    name: str
+    songs_per_second: float
+    peak_memory_bytes: int
+
+
+def measure_stage(stage: Stage, repetitions: int) -> tuple[StageResult, list[Any]]:
+    """ Returns the stage's best throughput and peak memory, along with its outputs. """
+    seconds_best = float("inf")
+
+    for _ in range(repetitions):
+        inputs = stage.prepare_inputs()
+
+        time_start = perf_counter()
+        outputs = [stage.process(input) for input in inputs]
+        seconds_best = min(seconds_best, perf_counter() - time_start)
+
+    inputs = stage.prepare_inputs()
+
+    tracemalloc.start()
+    memory_baseline, _ = tracemalloc.get_traced_memory()
+    outputs = [stage.process(input) for input in inputs]
+    _, memory_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return StageResult(stage.name, len(inputs) / seconds_best, memory_peak - memory_baseline), outputs
+
+
+def measure_pipeline(songs: list[SyntheticSong], repetitions: int) -> list[StageResult]:
+    fetcher = LyricFetcherLocalFile(path_to_working_dir=songs[0].path_to_audio_file.parent if songs else None)
+    sanitizer_genius = LyricSanitizer(SanitizationRules(remove_trailing_embed=True))
+    expander = LyricExpander()
+    matcher = LyricMatcher(DeveloperOptions.json_schema_version)
+
+    def fetch(song: SyntheticSong):
+        task = LyricAlignTask(song.path_to_audio_file)
+        task.lyric_payload = fetcher.fetch_lyrics(task)
+        return task
+
+    def expand(task: LyricAlignTask):
+        task.lyric_text_expanded = expander.expand_lyrics(task.filename, task.lyric_payload.text_sanitized)
+        task.lyric_lines_expanded = [line for line in task.lyric_text_expanded.splitlines() if line]
+        return task
+
+    def parse_timings(task: LyricAlignTask):
+        text = task.path_to_audio_file.with_suffix(".nusalaoffline").read_text()
+        return WordTimings.from_text(text)
+
+    def match(matching_method: LyricMatchingMethod):
+        def match_song(task_and_timings: tuple[LyricAlignTask, WordTimings]):
+            task, word_timings = task_and_timings
+
+            # Matching applies timings to the structured lyrics, so each repetition starts from fresh ones
+            lyrics_structured = matcher.convert_lyrics_string_to_match_lyrics(task.lyric_lines_expanded)
+            task.lyrics_aligned_automated, task.match_result_automated = \
+                matcher.match_aligned_lyrics_with_structured_lyrics(word_timings, lyrics_structured, matching_method)
+            return task
+        return match_song
+
+    def export(task: LyricAlignTask):
+        return json.dumps(task.convert_best_aligment_lyrics_to_dict())
+
+    results = []
+
+    def run(stage: Stage) -> list[Any]:
+        result, outputs = measure_stage(stage, repetitions)
+        results.append(result)
+        print(f"  {result.name:<14} {result.songs_per_second:10.1f} songs/s {result.peak_memory_bytes / 2**20:10.2f} MiB")
+        return outputs
+
+    tasks = run(Stage("fetch", lambda: songs, fetch))
+    run(Stage("sanitize", lambda: [song.lyrics_genius_raw for song in songs], sanitizer_genius.sanitize))
+    tasks = run(Stage("expand", lambda: tasks, expand))
+    run(Stage("prepare", lambda: [task.lyric_lines_expanded for task in tasks], matcher.convert_lyrics_string_to_match_lyrics))
+    word_timings = run(Stage("parse_timings", lambda: tasks, parse_timings))
+
+    # Matching includes the 'prepare' stage, see match()
+    run(Stage("match_greedy", lambda: list(zip(tasks, word_timings)), match(LyricMatchingMethod.Greedy)))
+    tasks = run(Stage("match_global", lambda: list(zip(tasks, word_timings)), match(LyricMatchingMethod.GlobalAlignment)))
+    run(Stage("export", lambda: tasks, export))
+
+    return results
+
+
+def get_git_commit() -> Optional[str]:
+    try:
+        completed_process = subprocess.run(["git", "rev-parse", "--short", "HEAD"],
+            cwd=path_to_repository, capture_output=True, text=True, check=True)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return completed_process.stdout.strip()
+
+
+def print_comparison(results: list[StageResult], path_to_baseline: Path):
+    baseline = json.loads(path_to_baseline.read_text())
+    baseline_stages = {stage["name"]: stage for stage in baseline["stages"]}
+
+    print(f"Compared with {path_to_baseline} (commit {baseline.get('commit')}, {baseline.get('songs')} songs):")
+
+    for result in results:
+        baseline_stage = baseline_stages.get(result.name)
+        if baseline_stage is None:
+            print(f"  {result.name:<14} not in baseline")
+            continue
+
+        change_throughput = result.songs_per_second / baseline_stage["songs_per_second"] - 1.0
+        change_memory = (result.peak_memory_bytes - baseline_stage["peak_memory_bytes"]) / 2**20
+        print(f"  {result.name:<14} {change_throughput:+10.1%} songs/s {change_memory:+10.2f} MiB")
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measures the throughput and peak memory of LyricManager's processing stages.")
+    parser.add_argument("--songs", type=int, default=100)
+    parser.add_argument("--repetitions", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", type=Path, default=None, help="Save the results as Json to this path.")
+    parser.add_argument("--baseline", type=Path, default=None, help="Compare the results with previously saved results.")
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as path_to_temp_dir:
+        print(f"Generating synthetic library of {arguments.songs} songs (seed {arguments.seed})...")
+        songs = generate_library(Path(path_to_temp_dir), arguments.songs, arguments.seed)
+
+        print(f"Best of {arguments.repetitions} repetitions:")
+        results = measure_pipeline(songs, arguments.repetitions)
+
+    if arguments.output:
+        output = {
+            "commit": get_git_commit(),
+            "python": platform.python_version(),
+            "songs": arguments.songs,
+            "seed": arguments.seed,
+            "repetitions": arguments.repetitions,
+            "stages": [result.__dict__ for result in results]
+        }
+        arguments.output.write_text(json.dumps(output, indent=4))
+
+    if arguments.baseline:
+        print_comparison(results, arguments.baseline)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -66,6 +66,14 @@ build_exe_options = {
     #     "scipy.optimize",
     #     "scipy.integrate"
     # ],
+    # Lyric fetchers and aligners are imported by name when first used, which cx_Freeze can't discover by itself.
+    "includes": [
+        "src.lyric.fetchers.lyric_fetcher_local_file",
+        "src.lyric.fetchers.lyric_fetcher_pypi_lyricsgenius",
+        "src.lyric.fetchers.lyric_fetcher_pypi_lyrics_extractor",
+        "src.lyric.aligners.lyric_aligner_disabled",
+        "src.lyric.aligners.lyric_aligner_NUS_autolyrixalign_offline",
+    ],
     # exclude packages that are not really needed
     "excludes": [
         "tkinter",
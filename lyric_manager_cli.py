@@ -4,7 +4,6 @@ from pathlib import Path
 from argparse import ArgumentParser
 
 # 3rd Party
-from omegaconf import OmegaConf, SCMode
 
 # 1st Party
 from src.lyric_manager_base import LyricManagerBase
@@ -33,9 +32,29 @@ class LyricManagerCommandLineInterface(LyricManagerBase):
 
         settings: Settings = self._read_settings(parsed_arguments.path_to_settings_file)
 
-        super().__init__(settings.data.output.path_to_working_directory, settings.data.output.path_to_reports)
+        super().__init__(
+            settings.data.output.path_to_working_directory,
+            settings.data.output.path_to_reports,
+            settings.check_for_new_version)
+
+        if parsed_arguments.migrate_lyric_cache:
+            self.migrate_lyric_cache()
+            return
+
+        if parsed_arguments.resanitize_lyric_cache:
+            self.resanitize_lyric_cache(settings)
+            return
 
         loop_wrapper = ProgressItemGeneratorCLI()
+
+        if parsed_arguments.watch:
+            self.watch_and_align_lyrics(settings, loop_wrapper)
+            return
+
+        if parsed_arguments.job_queue:
+            self.work_on_job_queue(settings, loop_wrapper, parsed_arguments.job_queue)
+            return
+
         self.fetch_and_align_lyrics(settings, loop_wrapper)
 
 
@@ -45,11 +64,22 @@ class LyricManagerCommandLineInterface(LyricManagerBase):
         # Immediately convert the single positional argument into an absolute pathlib.Path
         parser.add_argument("path_to_settings_file", nargs="?", default="./settings_example.yaml", type=lambda p: Path(p).absolute())
         parser.add_argument('--version', action='version', version=f'LyricManager {DeveloperOptions.version}')
+        parser.add_argument('--migrate-lyric-cache', action='store_true',
+            help="Import cached lyric sidecar files in the working directory into the Sqlite lyric cache, then exit.")
+        parser.add_argument('--resanitize-lyric-cache', action='store_true',
+            help="Re-sanitize all cached lyrics of the configured lyric sources without accessing them, then exit.")
+        parser.add_argument('--watch', action='store_true',
+            help="Keep running, and fetch and align lyrics of audio files as they're added to the folders to process.")
+        parser.add_argument('--job-queue', metavar='NAME',
+            help="Share the tasks with other workers, e.g. on other machines, running with the same job queue NAME and "
+                 "the same, shared, working directory.")
 
         return parser
     
 
     def _read_settings(self, path_to_settings_file: Path):
+        # Imported here, so --help and --version needn't import omegaconf
+        from omegaconf import OmegaConf, SCMode
 
         omegaconf_lyricmanager_settings_schema = OmegaConf.structured(Settings)
         lyricmanager_settings_from_disk = OmegaConf.load(path_to_settings_file)
@@ -27,6 +27,7 @@ from src.components.github_repository_version_check import GithubRepositoryVersi
 from src.gui import GuiWorker
 from src.gui import LoggingHandlerSignal
 from src.gui import ProgressItemGeneratorGUI
+from src.gui import TaskResultSinkGUI
 from src.gui import QListWidgetDragAndDrop
 from src.gui import ComboBoxEnum
 from src.gui import WidgetQCheckBoxWithEnum
@@ -40,7 +41,7 @@ from src.lyric_processing_config import Settings
 from src.lyric_processing_config import FileCopyMode
 from src.lyric.dataclasses_and_types import LyricFetcherType
 from src.lyric.dataclasses_and_types import LyricAlignerType
-from src.lyric.dataclasses_and_types import LyricAlignTask
+from src.results import TaskResult
 
 
 class LyricManagerGraphicUserInterface(LyricManagerBase, QtCore.QObject):
@@ -106,7 +107,8 @@ class LyricManagerGraphicUserInterface(LyricManagerBase, QtCore.QObject):
         work_directory = self.q_settings.value("WorkingDirectory", "./WorkingDirectory")
         reports_directory = self.q_settings.value("ReportsDirectory", "./Reports")
 
-        LyricManagerBase.__init__(self, work_directory, reports_directory)
+        # The Gui performs its own check for a newer version, see show_dialog_message_box_if_new_version_has_been_released()
+        LyricManagerBase.__init__(self, work_directory, reports_directory, check_for_new_version=False)
         QtCore.QObject.__init__(self)
         
 
@@ -558,14 +560,16 @@ class LyricManagerGraphicUserInterface(LyricManagerBase, QtCore.QObject):
         # TODO: Re-visit if passing in this worker in the single-threaded context is the best single threaded approach.
         worker = GuiWorker(None)
         loop_wrapper = ProgressItemGeneratorGUI(worker.signals.progress, worker.signals.task_description)
+        task_result_sinks = [TaskResultSinkGUI(worker.signals.task_completed)]
+
+        # Results are added to the processed table one by one, as soon as each song has been processed
+        self._clear_processed_songs_table()
+        worker.signals.task_completed.connect(self._add_processed_table_row)
 
         if DeveloperOptions.is_multithreading_enabled():
             # Multi-threaded
-            worker.set_fn(self.fetch_and_align_lyrics, settings, loop_wrapper)
+            worker.set_fn(self.fetch_and_align_lyrics, settings, loop_wrapper, task_result_sinks)
 
-            # When execution finishes, have the worker pass on the results to this thread to update the process table
-            worker.signals.finished.connect(self._update_processed_table)
-            
             self._connect_worker_to_gui_progress_bar_widget(worker)
 
             # thread_pool.start() also accepts PyCallable, but this wouldn't provide built-in signals or added parameters
@@ -573,8 +577,7 @@ class LyricManagerGraphicUserInterface(LyricManagerBase, QtCore.QObject):
             self.thread_pool.start(worker)
         else:
             # Single-threaded
-            lyric_alignment_tasks = self.fetch_and_align_lyrics(settings, loop_wrapper)
-            self._update_processed_table(lyric_alignment_tasks)
+            self.fetch_and_align_lyrics(settings, loop_wrapper, task_result_sinks)
 
 
     def _connect_worker_to_gui_progress_bar_widget(self, worker: GuiWorker):
@@ -621,37 +624,35 @@ class LyricManagerGraphicUserInterface(LyricManagerBase, QtCore.QObject):
         self.widget_songs_processed.model().removeRows(0, self.widget_songs_processed.rowCount())
 
 
-    def _update_processed_table(self, lyric_align_tasks: list[LyricAlignTask]):
-        """ Updates the processed table GUI widget communicating the % of matched lyrics and overall result of the given tasks. """
+    def _add_processed_table_row(self, task_result: TaskResult):
+        """ Appends a row to the processed table GUI widget communicating the % of matched lyrics and overall result of the given task. """
 
-        self._clear_processed_songs_table()
-
-        self.widget_songs_processed.setRowCount(len(lyric_align_tasks))
+        index = self.widget_songs_processed.rowCount()
+        self.widget_songs_processed.insertRow(index)
 
         index_filename = 0
         index_progress = 1
         index_note = 2
 
-        for index, task in enumerate(lyric_align_tasks):
-            item_filename = QTableWidgetItem(task.filename)
+        item_filename = QTableWidgetItem(task_result.filename)
 
-            # How to embed a progress bar
-            # https://stackoverflow.com/questions/54285057/how-to-include-a-column-of-progress-bars-within-a-qtableview
-            progress_bar = QProgressBar()
-            progress_bar.setValue(task.match_result_automated.match_percentage)
-            progress_bar.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter) # Place progress bar text inside of itself.
+        # How to embed a progress bar
+        # https://stackoverflow.com/questions/54285057/how-to-include-a-column-of-progress-bars-within-a-qtableview
+        progress_bar = QProgressBar()
+        progress_bar.setValue(task_result.match_result_automated.match_percentage)
+        progress_bar.setAlignment(QtCore.Qt.AlignmentFlag.AlignHCenter) # Place progress bar text inside of itself.
 
-            progress_bar_animation_disabled = """
-                QProgressBar { border: 1px solid grey; border-radius: 0px; text-align: center; }
-                QProgressBar::chunk {background-color: #3add36; width: 1px;}
-            """
-            progress_bar.setStyleSheet(progress_bar_animation_disabled)
+        progress_bar_animation_disabled = """
+            QProgressBar { border: 1px solid grey; border-radius: 0px; text-align: center; }
+            QProgressBar::chunk {background-color: #3add36; width: 1px;}
+        """
+        progress_bar.setStyleSheet(progress_bar_animation_disabled)
 
-            item_note = QTableWidgetItem(task.get_user_friendly_result())
+        item_note = QTableWidgetItem(task_result.description)
 
-            self.widget_songs_processed.setItem(index, index_filename, item_filename)
-            self.widget_songs_processed.setCellWidget(index, index_progress, progress_bar)
-            self.widget_songs_processed.setItem(index, index_note, item_note)
+        self.widget_songs_processed.setItem(index, index_filename, item_filename)
+        self.widget_songs_processed.setCellWidget(index, index_progress, progress_bar)
+        self.widget_songs_processed.setItem(index, index_note, item_note)
 
 
 
@@ -766,11 +767,26 @@ class LyricManagerGraphicUserInterface(LyricManagerBase, QtCore.QObject):
 
         To keep user-pestering to a bare minimum, we keep track of which latest version of LyricManager we're aware of.
         Only if the user has yet to be informed of a new release do we provide them with a dialogue about this.
-        
+
+        The check accesses the network, so it's performed in the thread pool, and the dialogue is presented once it
+        completes. This avoids the Gui becoming unresponsive during start-up.
         """
         latest_known_release = self.q_settings.value("LatestKnownRelease", DeveloperOptions.version)
-        newer_release = GithubRepositoryVersionCheck.get_newer_version_if_available(latest_known_release)
+        path_to_cache = self.path_to_working_directory / self.filename_latest_release_check
+
+        def get_newer_release():
+            try:
+                return GithubRepositoryVersionCheck.get_newer_version_if_available(latest_known_release, path_to_cache)
+            except Exception:
+                logging.exception("Checking for a newer release of LyricManager failed.")
+                return None
+
+        worker = GuiWorker(get_newer_release)
+        worker.signals.finished.connect(self._show_dialog_message_box_new_version)
+        self.thread_pool.start(worker)
+
 
+    def _show_dialog_message_box_new_version(self, newer_release: Optional[str]):
         # If the latest release is already 'known', even if potentially newer, we don't inform the user
         if newer_release is None:
             return
@@ -2,8 +2,7 @@
 from typing import Iterable
 
 # 3rd Party
-import tqdm
-from tqdm.contrib.logging import logging_redirect_tqdm # Move into Cli
+# tqdm is imported on use, so the command-line interface starts quickly when only e.g. its --help is requested.
 
 # 1st Party
 
@@ -25,6 +24,9 @@ class ProgressItemGeneratorCLI():
         that sets the reference of the progress_bar as part of this call.
         """
 
+        import tqdm
+        from tqdm.contrib.logging import logging_redirect_tqdm # Move into Cli
+
         with logging_redirect_tqdm():
             # Retain a reference so its decription can be updated.
             self.progress_bar_current = tqdm.tqdm(elements, **kwargs)
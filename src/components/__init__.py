@@ -9,4 +9,30 @@ from .object_factory import ObjectFactory
 from .miscellaneous import percentage
 from .miscellaneous import get_percentage_and_amount_string
 
-from .github_repository_version_check import GithubRepositoryVersionCheck
\ No newline at end of file
+from .github_repository_version_check import GithubRepositoryVersionCheck
+
+from .library_index import LibraryIndex
+from .library_index import IndexedAudioFile
+
+from .library_scanner import LibraryScanner
+from .library_scanner import ScanRules
+
+from .audio_file_watcher import AudioFileWatcherInterface
+from .audio_file_watcher import AudioFileWatcherWatchdog
+from .audio_file_watcher import AudioFileWatcherPolling
+from .audio_file_watcher import create_audio_file_watcher
+
+from .output_fingerprints import OutputFingerprints
+from .output_fingerprints import OutputRecord
+
+from .file_lock import FileLock
+
+from .rate_limiter import RateLimit
+from .rate_limiter import RateLimiter
+
+from .metrics import Metrics
+from .metrics import Histogram
+
+from .audio_tag_reader import read_artist_and_title
+
+from .job_queue import JobQueue
@@ -0,0 +1,247 @@
+# Python
+import os
+import queue
+import logging
+import threading
+from pathlib import Path
+from time import monotonic
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional
+
+# 3rd Party
+# watchdog is an optional dependency, imported on use. Without it, folders are watched by polling.
+
+
+# 1st Party
+from .library_scanner import LibraryScanner
+
+
+class AudioFileWatcherInterface(ABC):
+    """ Watches folders for audio files being added or changed, and reports them in batches.
+
+    Copying a single audio file, let alone an album, produces a burst of file system events. Changes are therefore
+    debounced: a batch is only reported once no further changes have occurred for debounce_seconds, or - should
+    changes never settle - once its oldest change is max_batch_delay_seconds old.
+
+    Only audio files which LibraryScanner would find when scanning the watched folders are reported.
+    """
+
+    def __init__(self,
+                 paths_to_watch: list[Path],
+                 recursive: bool,
+                 library_scanner: LibraryScanner,
+                 debounce_seconds: float = 5.0):
+        # Individual files can't be watched, only the folders containing them
+        self.paths_to_watch = []
+        for path in paths_to_watch:
+            if path.is_dir():
+                self.paths_to_watch.append(path)
+            else:
+                logging.info(f"Only folders can be watched. Not watching: {path}")
+
+        self.recursive = recursive
+        self.library_scanner = library_scanner
+
+        self.debounce_seconds = debounce_seconds
+        self.max_batch_delay_seconds = debounce_seconds * 10
+
+        # Paths of changed files and folders, put by the watching thread
+        self.queue_changed: queue.Queue[Path] = queue.Queue()
+
+
+    @abstractmethod
+    def start(self):
+        raise NotImplementedError()
+
+
+    @abstractmethod
+    def stop(self):
+        raise NotImplementedError()
+
+
+    def get_batches(self, event_stop: threading.Event) -> Iterator[list[Path]]:
+        """ Yields the audio files added or changed since the previous batch, until event_stop is set. """
+        # Changed paths, and when they were first and last reported as changed
+        pending: dict[Path, float] = {}
+        time_first_change = 0.0
+        time_last_change = 0.0
+
+        while not event_stop.is_set():
+            try:
+                # Wakes up regularly to check event_stop
+                path_changed = self.queue_changed.get(timeout=min(self.debounce_seconds, 0.5))
+            except queue.Empty:
+                path_changed = None
+
+            now = monotonic()
+
+            if path_changed is not None:
+                if not pending:
+                    time_first_change = now
+                pending[path_changed] = now
+                time_last_change = now
+
+            if not pending:
+                continue
+
+            # Checked on every change too, as changes arriving more often than the timeout above never let get() time out
+            if now - time_last_change < self.debounce_seconds and now - time_first_change < self.max_batch_delay_seconds:
+                continue
+
+            paths_to_audio_files = self._get_audio_files(pending)
+            pending = {}
+
+            if paths_to_audio_files:
+                yield paths_to_audio_files
+
+
+    def _get_path_to_root(self, path: Path) -> Optional[Path]:
+        """ Returns the most specific watched folder containing the path, if any. """
+        paths_to_root = [path_to_watch for path_to_watch in self.paths_to_watch if path.is_relative_to(path_to_watch)]
+
+        return max(paths_to_root, key=lambda path_to_root: len(path_to_root.parts), default=None)
+
+
+    def _get_audio_files(self, paths_changed: Iterable[Path]) -> list[Path]:
+        """ Returns the audio files to process, given changed files and folders. Changed folders are scanned. """
+        paths_to_audio_files = set()
+
+        for path_changed in paths_changed:
+            path_to_root = self._get_path_to_root(path_changed)
+            if not path_to_root:
+                continue
+
+            # A folder moved into a watched folder only reports the folder itself as changed, not its contents
+            if path_changed.is_dir():
+                paths_candidates = self.library_scanner.scan([path_changed], self.recursive)
+            elif path_changed.is_file():
+                paths_candidates = [path_changed]
+            else:
+                # Deleted, or moved elsewhere, since it was reported
+                continue
+
+            for path_candidate in paths_candidates:
+                if self.library_scanner.is_included(path_candidate, path_to_root, self.recursive):
+                    paths_to_audio_files.add(path_candidate)
+
+        return sorted(paths_to_audio_files)
+
+
+class AudioFileWatcherWatchdog(AudioFileWatcherInterface):
+    """ Watches folders using the watchdog package, i.e. via inotify on Linux, FSEvents on macOS, and
+    ReadDirectoryChangesW on Windows. Changes are reported by the operating system as they occur.
+    """
+
+    def __init__(self, paths_to_watch: list[Path], recursive: bool, library_scanner: LibraryScanner, debounce_seconds: float = 5.0):
+        super().__init__(paths_to_watch, recursive, library_scanner, debounce_seconds)
+        self.observer = None
+
+
+    def dispatch(self, event):
+        """ Receives every file system event from watchdog, in its observer thread. """
+        if event.event_type in ("created", "modified", "closed"):
+            path_changed = event.src_path
+        elif event.event_type == "moved":
+            path_changed = event.dest_path
+        else:
+            return
+
+        # Modifying a file also modifies its folder, which needn't be re-scanned
+        if event.is_directory and event.event_type == "modified":
+            return
+
+        self.queue_changed.put(Path(os.fsdecode(path_changed)))
+
+
+    def start(self):
+        from watchdog.observers import Observer
+
+        self.observer = Observer()
+
+        # The watcher itself acts as watchdog's event handler, as it only requires a dispatch() function
+        for path_to_watch in self.paths_to_watch:
+            self.observer.schedule(self, str(path_to_watch), recursive=self.recursive)
+
+        self.observer.start()
+
+
+    def stop(self):
+        if self.observer:
+            self.observer.stop()
+            self.observer.join()
+            self.observer = None
+
+
+class AudioFileWatcherPolling(AudioFileWatcherInterface):
+    """ Watches folders by regularly scanning them, and comparing each audio file's modification time and size.
+
+    Unlike AudioFileWatcherWatchdog, each poll scans all watched folders. Excluded folders are skipped, as when scanning.
+    """
+
+    def __init__(self,
+                 paths_to_watch: list[Path],
+                 recursive: bool,
+                 library_scanner: LibraryScanner,
+                 debounce_seconds: float = 5.0,
+                 polling_interval_seconds: float = 30.0):
+        super().__init__(paths_to_watch, recursive, library_scanner, debounce_seconds)
+        self.polling_interval_seconds = polling_interval_seconds
+
+        self.thread = None
+        self.event_stopped = threading.Event()
+
+
+    def _take_snapshot(self) -> dict[Path, tuple[int, int]]:
+        snapshot = {}
+
+        for path_to_audio_file in self.library_scanner.scan(self.paths_to_watch, self.recursive):
+            try:
+                stat = os.stat(path_to_audio_file)
+            except OSError:
+                continue
+
+            snapshot[path_to_audio_file] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+
+    def _poll(self):
+        snapshot_previous = self._take_snapshot()
+
+        while not self.event_stopped.wait(self.polling_interval_seconds):
+            snapshot = self._take_snapshot()
+
+            for path_to_audio_file, modification in snapshot.items():
+                if snapshot_previous.get(path_to_audio_file) != modification:
+                    self.queue_changed.put(path_to_audio_file)
+
+            snapshot_previous = snapshot
+
+
+    def start(self):
+        self.event_stopped.clear()
+        self.thread = threading.Thread(target=self._poll, name="AudioFileWatcherPolling", daemon=True)
+        self.thread.start()
+
+
+    def stop(self):
+        if self.thread:
+            self.event_stopped.set()
+            self.thread.join()
+            self.thread = None
+
+
+def create_audio_file_watcher(paths_to_watch: list[Path],
+                              recursive: bool,
+                              library_scanner: LibraryScanner,
+                              debounce_seconds: float = 5.0,
+                              polling_interval_seconds: float = 30.0) -> AudioFileWatcherInterface:
+    """ Returns a watchdog based watcher if the optional watchdog package is installed, otherwise a polling one. """
+    try:
+        import watchdog.observers
+    except ImportError:
+        logging.info(f"The optional package 'watchdog' isn't installed. Watching folders by scanning them every "
+                     f"{polling_interval_seconds} seconds instead.")
+        return AudioFileWatcherPolling(paths_to_watch, recursive, library_scanner, debounce_seconds, polling_interval_seconds)
+
+    return AudioFileWatcherWatchdog(paths_to_watch, recursive, library_scanner, debounce_seconds)
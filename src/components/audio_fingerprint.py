@@ -0,0 +1,75 @@
+# Python
+import os
+import hashlib
+from pathlib import Path
+
+# 3rd Party
+
+
+# 1st Party
+
+
+# Number of bytes sampled from the start, middle, and end of the audio data
+_sample_size = 64 * 1024
+
+
+def _get_audio_data_range(path_to_audio_file: Path, file) -> tuple[int, int]:
+    """ Returns the start and end offsets of an audio file's audio data, i.e. excluding ID3 tags if it's an mp3 file.
+
+    Tags are excluded, as editing them - e.g. correcting a typo in the title - doesn't change the audio.
+    """
+    file.seek(0, 2)
+    position_start = 0
+    position_end = file.tell()
+
+    if path_to_audio_file.suffix.lower() != ".mp3":
+        return position_start, position_end
+
+    file.seek(0)
+    header = file.read(10)
+
+    # ID3v2 tag at the start of the file, whose size is stored in 7 bits per byte, and excludes its header and footer
+    if len(header) == 10 and header[:3] == b"ID3" and not any(byte & 0x80 for byte in header[6:10]):
+        size = 0
+        for byte in header[6:10]:
+            size = (size << 7) | byte
+
+        has_footer = header[3] == 4 and header[5] & 0x10
+        position_start = min(position_end, 10 + size + (10 if has_footer else 0))
+
+    # ID3v1 tag in the final 128 bytes of the file
+    if position_end - position_start >= 128:
+        file.seek(position_end - 128)
+        if file.read(3) == b"TAG":
+            position_end -= 128
+
+    return position_start, position_end
+
+
+def compute_audio_fingerprint(path_to_audio_file: Path) -> str:
+    """ Returns a fingerprint of an audio file's audio data, which is unaffected by renaming, moving, or re-tagging it.
+
+    Rather than hashing all of the audio data, which for a library means reading every byte of it, only the size of the
+    audio data and three samples of it are hashed. Two different audio files with equal sizes, and equal data at the
+    start, middle, and end, are therefore indistinguishable - which, for encoded audio, is vanishingly unlikely.
+    """
+    hasher = hashlib.sha256()
+
+    with open(path_to_audio_file, "rb") as file:
+        position_start, position_end = _get_audio_data_range(path_to_audio_file, file)
+        size = position_end - position_start
+
+        hasher.update(size.to_bytes(8, "little"))
+
+        if size <= 3 * _sample_size:
+            positions_sample = [position_start]
+            size_sample = size
+        else:
+            positions_sample = [position_start, position_start + (size - _sample_size) // 2, position_end - _sample_size]
+            size_sample = _sample_size
+
+        for position_sample in positions_sample:
+            file.seek(position_sample)
+            hasher.update(file.read(size_sample))
+
+    return hasher.hexdigest()
@@ -0,0 +1,191 @@
+# Python
+import re
+import logging
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+# 3rd Party
+# eyed3 is imported on use, as it's only needed for the rare tags the header-only parser below doesn't support.
+
+
+# 1st Party
+
+
+# Artist and title frame IDs, per ID3v2 major version. ID3v2.2 uses three character frame IDs.
+_frame_ids_artist = {2: b"TP1", 3: b"TPE1", 4: b"TPE1"}
+_frame_ids_title  = {2: b"TT2", 3: b"TIT2", 4: b"TIT2"}
+
+# Text encodings, given by the first byte of each text frame
+_text_encodings = {0: "latin1", 1: "utf_16", 2: "utf_16_be", 3: "utf_8"}
+
+# ID3v1 fields are padded with spaces or null bytes, which eyed3 strips along with any other whitespace
+_id3v1_strip_chars = b" \t\n\r\x0b\x0c\x00"
+
+_re_comp_frame_id = re.compile(rb"[A-Z0-9]{3,4}")
+
+
+class _UnsupportedTag(Exception):
+    """ Raised for tags the header-only parser doesn't support, which are then read by eyed3 instead. """
+    pass
+
+
+def _decode_syncsafe(data: bytes) -> int:
+    """ Decodes an integer stored in 7 bits per byte, as used by ID3v2 for sizes. """
+    if any(byte & 0x80 for byte in data):
+        raise _UnsupportedTag("Invalid synchsafe integer")
+
+    value = 0
+    for byte in data:
+        value = (value << 7) | byte
+
+    return value
+
+
+def _decode_text_frame(data: bytes) -> str:
+    """ Decodes a text frame the way eyed3 does, i.e. keeping all values, but stripping trailing null characters. """
+    if not data:
+        return ""
+
+    encoding = _text_encodings.get(data[0])
+    if not encoding:
+        raise _UnsupportedTag(f"Unknown text encoding: {data[0]}")
+
+    text_data = data[1:]
+
+    # Odd-length UTF-16 data with a superfluous trailing null byte is common
+    if encoding.startswith("utf_16") and len(text_data) % 2 != 0 and text_data[-1:] == b"\x00":
+        text_data = text_data[:-1]
+
+    try:
+        return str(text_data, encoding).rstrip("\x00")
+    except UnicodeDecodeError as error:
+        raise _UnsupportedTag(f"Unable to decode text frame: {error}")
+
+
+def _read_id3v2_artist_and_title(file: BinaryIO, header: bytes) -> tuple[Optional[str], Optional[str]]:
+    """ Reads the artist and title frames of an ID3v2 tag, seeking past all other frames without reading them. """
+    version_major = header[3]
+    flags = header[5]
+
+    if version_major not in (2, 3, 4):
+        raise _UnsupportedTag(f"Unsupported ID3v2 version: 2.{version_major}")
+
+    # Unsynchronisation alters the frame data, and ID3v2.2 uses this flag for its (never specified) compression
+    if flags & 0x80 or (version_major == 2 and flags & 0x40):
+        raise _UnsupportedTag("Unsynchronised or compressed tag")
+
+    position_end = len(header) + _decode_syncsafe(header[6:10])
+
+    # The extended header's size excludes its own size field in ID3v2.3, but includes it in ID3v2.4
+    if version_major > 2 and flags & 0x40:
+        data_size = file.read(4)
+        if len(data_size) != 4:
+            raise _UnsupportedTag("Truncated extended header")
+
+        if version_major == 3:
+            file.seek(int.from_bytes(data_size, "big"), 1)
+        else:
+            file.seek(_decode_syncsafe(data_size) - 4, 1)
+
+    if version_major == 2:
+        length_id, length_header = 3, 6
+    else:
+        length_id, length_header = 4, 10
+
+    frame_id_artist = _frame_ids_artist[version_major]
+    frame_id_title = _frame_ids_title[version_major]
+
+    artist = None
+    title = None
+
+    while file.tell() + length_header <= position_end and (artist is None or title is None):
+        frame_header = file.read(length_header)
+        frame_id = frame_header[:length_id]
+
+        # Padding follows the final frame
+        if len(frame_header) != length_header or frame_id[:1] == b"\x00":
+            break
+
+        if not _re_comp_frame_id.fullmatch(frame_id):
+            raise _UnsupportedTag(f"Invalid frame ID: {frame_id}")
+
+        if version_major == 2:
+            frame_size = int.from_bytes(frame_header[3:6], "big")
+        elif version_major == 3:
+            frame_size = int.from_bytes(frame_header[4:8], "big")
+        else:
+            # Some writers incorrectly store ID3v2.4 frame sizes as plain integers, which is detected as invalid here
+            frame_size = _decode_syncsafe(frame_header[4:8])
+
+        if file.tell() + frame_size > position_end:
+            raise _UnsupportedTag(f"Frame {frame_id} exceeds the tag")
+
+        if frame_id not in (frame_id_artist, frame_id_title):
+            file.seek(frame_size, 1)
+            continue
+
+        # Compressed, encrypted, grouped or unsynchronised frames, or those with a data length indicator
+        if version_major > 2 and frame_header[9]:
+            raise _UnsupportedTag(f"Unsupported flags of frame {frame_id}")
+
+        text = _decode_text_frame(file.read(frame_size))
+
+        # As with eyed3, a repeated frame's first occurrence is used
+        if frame_id == frame_id_artist and artist is None:
+            artist = text
+        elif frame_id == frame_id_title and title is None:
+            title = text
+
+    return artist, title
+
+
+def _read_id3v1_artist_and_title(file: BinaryIO) -> tuple[Optional[str], Optional[str]]:
+    """ Reads the artist and title of an ID3v1 tag, which is stored in the final 128 bytes of the file. """
+    file.seek(0, 2)
+    if file.tell() < 128:
+        return None, None
+
+    file.seek(-128, 2)
+    tag_data = file.read(128)
+
+    if tag_data[:3] != b"TAG":
+        return None, None
+
+    title = tag_data[3:33].strip(_id3v1_strip_chars)
+    artist = tag_data[33:63].strip(_id3v1_strip_chars)
+
+    return str(artist, "latin1") if artist else None, str(title, "latin1") if title else None
+
+
+def _read_artist_and_title_with_eyed3(path_to_audio_file: Path) -> tuple[Optional[str], Optional[str]]:
+    import eyed3
+
+    audio_file = eyed3.load(path_to_audio_file)
+
+    if not audio_file or not audio_file.tag:
+        return None, None
+
+    return audio_file.tag.artist, audio_file.tag.title
+
+
+def read_artist_and_title(path_to_audio_file: Path) -> tuple[Optional[str], Optional[str]]:
+    """ Returns the artist and title tags of an mp3 file, either of which is None if not tagged.
+
+    Of the ID3 tag, only the frame headers and the artist and title frames are read, rather than the complete tag -
+    which often includes sizeable cover art - let alone the audio file. As with eyed3, an ID3v2
+    tag is preferred, and an ID3v1 tag only read in its absence. Tags which require decoding the complete tag, e.g.
+    unsynchronised or compressed ones, or tags that appear corrupt, are read by eyed3 instead.
+    """
+    try:
+        with open(path_to_audio_file, "rb") as file:
+            header = file.read(10)
+
+            if len(header) == 10 and header[:3] == b"ID3":
+                return _read_id3v2_artist_and_title(file, header)
+
+            return _read_id3v1_artist_and_title(file)
+
+    except _UnsupportedTag as error:
+        logging.debug(f"Reading tags using eyed3 ({error}): {path_to_audio_file}")
+
+    return _read_artist_and_title_with_eyed3(path_to_audio_file)
@@ -0,0 +1,91 @@
+# Python
+import os
+import uuid
+import time
+from pathlib import Path
+
+# 3rd Party
+
+
+# 1st Party
+
+
+class FileLock():
+    """ Mutual exclusion between processes, possibly on several machines sharing a folder, via a lock file.
+
+    The lock is held while the lock file exists. It's created exclusively (O_CREAT | O_EXCL), which is atomic on local
+    file systems as well as NFS v3 and later, unlike fcntl/msvcrt locks, which aren't available on every platform and
+    file system alike.
+
+    A lock file older than stale_seconds is assumed to be left behind by a process that died while holding the lock,
+    and is removed. The lock is therefore only suited to guarding brief reads and writes of files.
+
+    A FileLock isn't reentrant, and must not be acquired by several threads of a process simultaneously; guard it with
+    a threading.Lock.
+
+    Example:
+        with FileLock(path_to_file.with_name(f"{path_to_file.name}.lock")):
+            <read, modify and write path_to_file>
+    """
+
+    def __init__(self, path_to_lock: Path, stale_seconds: float = 30.0, poll_seconds: float = 0.05):
+        self.path_to_lock = path_to_lock
+        self.stale_seconds = stale_seconds
+        self.poll_seconds = poll_seconds
+
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+    def acquire(self):
+        """ Waits until the lock is acquired. """
+        while True:
+            try:
+                os.close(os.open(self.path_to_lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644))
+                return
+            except FileExistsError:
+                pass
+
+            if not self._remove_stale_lock():
+                time.sleep(self.poll_seconds)
+
+
+    def release(self):
+        self.path_to_lock.unlink(missing_ok=True)
+
+
+    def _remove_stale_lock(self) -> bool:
+        """ Removes the lock file if it's stale. Returns True if the lock file is gone, by whichever process. """
+        try:
+            if time.time() - os.stat(self.path_to_lock).st_mtime < self.stale_seconds:
+                return False
+        except FileNotFoundError:
+            return True
+
+        # Renaming is atomic, so of several processes removing the same stale lock simultaneously, only one succeeds
+        path_to_stale_lock = self.path_to_lock.with_name(f"{self.path_to_lock.name}.stale-{uuid.uuid4().hex}")
+        try:
+            os.rename(self.path_to_lock, path_to_stale_lock)
+        except FileNotFoundError:
+            return True
+
+        # Another process may have removed the stale lock and acquired the lock since its age was checked above, in
+        # which case its lock file is restored. Linking fails rather than overwrites if yet another process has
+        # acquired the lock in the meantime.
+        if time.time() - os.stat(path_to_stale_lock).st_mtime < self.stale_seconds:
+            try:
+                os.link(path_to_stale_lock, self.path_to_lock)
+            except FileExistsError:
+                pass
+
+            os.unlink(path_to_stale_lock)
+            return False
+
+        os.unlink(path_to_stale_lock)
+        return True
@@ -1,6 +1,5 @@
 # Python
 import shutil
-import os
 from pathlib import Path
 
 # 3rd Party
@@ -17,10 +16,9 @@ class FileOperations():
             path_to_src: Path to file which is to be copied and renamed.
             path_to_dst: Path to future file the src is to be copied and renamed to
         """
-        path_to_dst_dir = path_to_dst.parent
-
-        path_to_src_copy_in_dst_dir = shutil.copy(path_to_src, path_to_dst_dir)
-        os.rename(path_to_src_copy_in_dst_dir, path_to_dst)
+        # Copying straight to the destination filename, rather than copying into the destination directory and then
+        # renaming, avoids collisions between simultaneous copies of identically named files, e.g. 'lyric_aligned.txt'.
+        shutil.copy(path_to_src, path_to_dst)
 
     @staticmethod
     def read_utf8_string(path_to_file: Path) -> str:
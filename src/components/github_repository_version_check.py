@@ -1,49 +1,145 @@
 # Python
-import requests
-from requests import ConnectionError
+import os
 import json
+import time
 import logging
-from typing import Optional
+import threading
+from pathlib import Path
+from typing import Callable, Optional
 
 # 3rd Party
-from packaging import version
+# requests and packaging are imported on use, as they're comparatively slow to import and only needed for the check.
 
 
 # 1st Party
 
 
 class GithubRepositoryVersionCheck():
+    """ Checks whether a newer release of LyricManager has been published on GitHub.
+
+    The check accesses the network, and should never hold up LyricManager. Hence, requests time out quickly, the
+    outcome of a check - including failure to check - can be cached on-disk for a while, and check_in_background()
+    performs the check in a background thread.
+    """
+
+    # How long to wait for GitHub to respond
+    timeout_seconds = 5.0
+
+    # How long a cached check result remains valid. Failed checks are cached too, so offline machines only attempt
+    # (and fail) the check once per period.
+    cache_time_to_live_seconds = 24 * 60 * 60
 
 
     @staticmethod
     def _fetch_latest_version_from_github_repo(user: str, repo_name:str):
+        import requests
+
         api_url = f"https://api.github.com/repos/{user}/{repo_name}/releases/latest"
-        
+
         try:
-            response = requests.get(api_url)
-        except ConnectionError as E:
+            response = requests.get(api_url, timeout=GithubRepositoryVersionCheck.timeout_seconds)
+        except requests.RequestException as E:
             logging.info(f"Error when attempting to access the latest release on GitHub.")
             return None
 
         if response.status_code != 200:
             logging.info(f"Error when accessing githib api url: {response.status_code} {response.reason}")
             return None
-        
+
         release_info = json.loads(response.text)
         latest_version = release_info['tag_name']
 
         return latest_version
 
+
+    @staticmethod
+    def _read_cache(path_to_cache: Path) -> tuple[bool, Optional[str]]:
+        """ Returns whether a still valid check result was cached, and if so, the latest version found (if any). """
+        try:
+            cached_check = json.loads(path_to_cache.read_text())
+        except (OSError, ValueError):
+            return False, None
+
+        time_checked = cached_check.get("time_checked", 0)
+        if time.time() - time_checked > GithubRepositoryVersionCheck.cache_time_to_live_seconds:
+            return False, None
+
+        return True, cached_check.get("latest_version")
+
+
     @staticmethod
-    def get_newer_version_if_available(version_current: str) -> Optional[str]:
-        """ Checks against online version... """
+    def _write_cache(path_to_cache: Path, latest_version: Optional[str]):
+        cached_check = {
+            "time_checked": time.time(),
+            "latest_version": latest_version
+        }
+
+        # Written atomically, as several LyricManager instances may check simultaneously
+        path_to_cache_temp = path_to_cache.with_name(f"{path_to_cache.name}.{os.getpid()}.tmp")
 
-        fetched_version = GithubRepositoryVersionCheck._fetch_latest_version_from_github_repo("Gazoo101", "lyric-manager")
+        try:
+            path_to_cache_temp.write_text(json.dumps(cached_check))
+            os.replace(path_to_cache_temp, path_to_cache)
+        except OSError as error:
+            logging.info(f"Unable to cache latest release check: {error}")
+
+
+    @staticmethod
+    def get_latest_version(path_to_cache: Optional[Path] = None) -> Optional[str]:
+        """ Returns the latest released version, or None if it couldn't be determined.
+
+        Args:
+            path_to_cache: If provided, a still valid cached result is returned without accessing GitHub, and otherwise
+                the result of accessing GitHub is cached here.
+        """
+        if path_to_cache:
+            is_cached, latest_version = GithubRepositoryVersionCheck._read_cache(path_to_cache)
+            if is_cached:
+                return latest_version
+
+        latest_version = GithubRepositoryVersionCheck._fetch_latest_version_from_github_repo("Gazoo101", "lyric-manager")
+
+        if path_to_cache:
+            GithubRepositoryVersionCheck._write_cache(path_to_cache, latest_version)
+
+        return latest_version
+
+
+    @staticmethod
+    def get_newer_version_if_available(version_current: str, path_to_cache: Optional[Path] = None) -> Optional[str]:
+        """ Returns the latest released version if it's newer than the current version, otherwise None. """
+        from packaging import version
+
+        fetched_version = GithubRepositoryVersionCheck.get_latest_version(path_to_cache)
         if fetched_version is None:
             return None
 
         if version.parse(version_current) < version.parse(fetched_version):
             #logging.warning(f"Current Python version '{version_current}', is below required version '{version_required}'.")
             return fetched_version
-        
+
         return None
+
+
+    @staticmethod
+    def check_in_background(version_current: str,
+                            path_to_cache: Optional[Path],
+                            on_newer_version: Callable[[str], None]) -> threading.Thread:
+        """ Performs get_newer_version_if_available() in a background thread, calling on_newer_version if there is one.
+
+        The thread is a daemon, so it never prevents LyricManager from exiting.
+        """
+        def check():
+            try:
+                newer_version = GithubRepositoryVersionCheck.get_newer_version_if_available(version_current, path_to_cache)
+            except Exception:
+                logging.exception("Checking for a newer release of LyricManager failed.")
+                return
+
+            if newer_version:
+                on_newer_version(newer_version)
+
+        thread = threading.Thread(target=check, name="GithubRepositoryVersionCheck", daemon=True)
+        thread.start()
+
+        return thread
@@ -0,0 +1,252 @@
+# Python
+import os
+import json
+import uuid
+import socket
+import hashlib
+import logging
+import threading
+from time import time
+from pathlib import Path
+from typing import Optional
+
+# 3rd Party
+
+
+# 1st Party
+from .metrics import Metrics
+
+
+class JobQueue():
+    """ Distributes jobs across several worker processes, possibly on several machines, via a shared folder.
+
+    Jobs aren't enqueued explicitly. Every worker derives the same jobs, e.g. by scanning the same library, and claims
+    whichever jobs are neither done, nor claimed by another worker. Each job is identified by a key, see get_key().
+
+    The queue folder holds two files per job:
+    - leases/<key>.lease    - Created exclusively (O_CREAT | O_EXCL) to claim the job, which is atomic on local file
+                              systems as well as NFS v3 and later. Its modification time is the worker's latest
+                              heartbeat, and it contains the claiming worker's ID.
+    - done/<key>            - Created once the job is done, after which its lease is removed.
+
+    A worker renews the leases it holds from a background thread. A lease which hasn't been renewed for lease_seconds,
+    e.g. because its worker or machine died, has expired and is reclaimed by whichever worker next tries to claim the
+    job. Expiry compares modification times with the current time, so the machines' clocks must be synchronized.
+    """
+
+    def __init__(self, path_to_queue_directory: Path, lease_seconds: float = 120.0, worker_id: str = None, metrics: Metrics = None):
+        """
+        Args:
+            lease_seconds: How long a lease remains valid without being renewed. Leases are renewed four times as often.
+            worker_id: Identifies this worker in its leases. Defaults to the host name and process ID.
+        """
+        self.path_to_leases = path_to_queue_directory / "leases"
+        self.path_to_done = path_to_queue_directory / "done"
+        self.path_to_leases.mkdir(parents=True, exist_ok=True)
+        self.path_to_done.mkdir(parents=True, exist_ok=True)
+
+        self.lease_seconds = lease_seconds
+        self.worker_id = worker_id if worker_id else f"{socket.gethostname()}-{os.getpid()}"
+        self.metrics = metrics if metrics else Metrics()
+
+        # Keys of the jobs whose leases this worker holds, renewed by the heartbeat thread
+        self.lock = threading.Lock()
+        self.keys_leased: set[str] = set()
+
+        self.thread_heartbeat = None
+        self.event_stopped = threading.Event()
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+
+    @staticmethod
+    def get_key(job_name: str) -> str:
+        """ Returns a key, safe to use as a filename, identifying the job of the given name, e.g. a path. """
+        return hashlib.sha256(job_name.encode("utf-8")).hexdigest()
+
+
+    def _get_path_to_lease(self, key: str) -> Path:
+        return self.path_to_leases / f"{key}.lease"
+
+
+    def _get_path_to_done(self, key: str) -> Path:
+        return self.path_to_done / key
+
+
+    def is_done(self, key: str) -> bool:
+        return self._get_path_to_done(key).exists()
+
+
+    def get_keys_done(self) -> set[str]:
+        """ Returns the keys of all jobs done, which for many jobs is far quicker than calling is_done() for each. """
+        return set(os.listdir(self.path_to_done))
+
+
+    def _create_lease(self, key: str) -> bool:
+        try:
+            file_descriptor = os.open(self._get_path_to_lease(key), os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as file:
+            json.dump({"worker_id": self.worker_id, "time_claimed": time()}, file)
+
+        return True
+
+
+    def _read_worker_id(self, path_to_lease: Path) -> Optional[str]:
+        """ Returns the ID of the worker holding the lease, or None if there's no lease, or it's still being written. """
+        try:
+            with open(path_to_lease, encoding="utf-8") as file:
+                return json.load(file)["worker_id"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+
+    def _get_lease_age_seconds(self, key: str) -> Optional[float]:
+        try:
+            return time() - os.stat(self._get_path_to_lease(key)).st_mtime
+        except FileNotFoundError:
+            return None
+
+
+    def _reclaim_expired_lease(self, key: str) -> bool:
+        """ Removes the job's lease if it has expired. Returns True if the lease is gone, by whichever worker. """
+        lease_age_seconds = self._get_lease_age_seconds(key)
+
+        if lease_age_seconds is None:
+            return True
+
+        if lease_age_seconds < self.lease_seconds:
+            return False
+
+        # Renaming is atomic, so of several workers reclaiming the same lease simultaneously, only one succeeds
+        path_to_expired_lease = self.path_to_leases / f"{key}.expired-{uuid.uuid4().hex}"
+        try:
+            os.rename(self._get_path_to_lease(key), path_to_expired_lease)
+        except FileNotFoundError:
+            return True
+
+        # Another worker may have reclaimed the lease and claimed the job since its age was checked above, in which
+        # case the lease just renamed is that worker's fresh lease, which is restored. Unlike renaming, linking fails
+        # rather than overwrites if yet another worker has claimed the job in the meantime, whose lease then stands.
+        if time() - os.stat(path_to_expired_lease).st_mtime < self.lease_seconds:
+            try:
+                os.link(path_to_expired_lease, self._get_path_to_lease(key))
+            except FileExistsError:
+                pass
+
+            os.unlink(path_to_expired_lease)
+            return False
+
+        logging.warning(f"Reclaimed an expired lease of worker '{self._read_worker_id(path_to_expired_lease)}'.")
+        self.metrics.increment("job_queue.leases_reclaimed")
+
+        os.unlink(path_to_expired_lease)
+
+        return True
+
+
+    def try_claim(self, key: str) -> bool:
+        """ Claims the job for this worker, unless it's done or claimed by another worker whose lease hasn't expired. """
+        if self.is_done(key):
+            return False
+
+        if not self._create_lease(key):
+            if not self._reclaim_expired_lease(key) or not self._create_lease(key):
+                return False
+
+        # The job may have been completed, and its lease removed, after it was checked above
+        if self.is_done(key):
+            self._get_path_to_lease(key).unlink(missing_ok=True)
+            return False
+
+        with self.lock:
+            self.keys_leased.add(key)
+
+        self.metrics.increment("job_queue.jobs_claimed")
+
+        return True
+
+
+    def complete(self, key: str):
+        """ Marks a job claimed by this worker as done, and releases its lease. """
+        self._get_path_to_done(key).write_text(self.worker_id, encoding="utf-8")
+        self.release(key)
+
+
+    def release(self, key: str):
+        """ Releases the lease of a job claimed by this worker without marking it done, so another worker may claim it. """
+        with self.lock:
+            self.keys_leased.discard(key)
+
+        if self._read_worker_id(self._get_path_to_lease(key)) == self.worker_id:
+            self._get_path_to_lease(key).unlink(missing_ok=True)
+
+
+    def get_seconds_until_lease_expiry(self, keys: list[str]) -> Optional[float]:
+        """ Returns how long until the first of the given jobs' leases expires, or None if none of them are leased. """
+        seconds_until_expiry = None
+
+        for key in keys:
+            lease_age_seconds = self._get_lease_age_seconds(key)
+            if lease_age_seconds is None:
+                continue
+
+            seconds = max(0.0, self.lease_seconds - lease_age_seconds)
+            if seconds_until_expiry is None or seconds < seconds_until_expiry:
+                seconds_until_expiry = seconds
+
+        return seconds_until_expiry
+
+
+    def _renew_leases(self):
+        with self.lock:
+            keys_leased = list(self.keys_leased)
+
+        for key in keys_leased:
+            # A worker which failed to renew its lease in time may find it reclaimed by another worker
+            if self._read_worker_id(self._get_path_to_lease(key)) != self.worker_id:
+                logging.warning(f"Lost the lease of a job to another worker: {key}")
+                self.metrics.increment("job_queue.leases_lost")
+
+                with self.lock:
+                    self.keys_leased.discard(key)
+                continue
+
+            try:
+                os.utime(self._get_path_to_lease(key))
+            except FileNotFoundError:
+                pass
+
+
+    def _heartbeat(self):
+        while not self.event_stopped.wait(self.lease_seconds / 4):
+            self._renew_leases()
+
+
+    def start(self):
+        self.event_stopped.clear()
+        self.thread_heartbeat = threading.Thread(target=self._heartbeat, name="JobQueueHeartbeat", daemon=True)
+        self.thread_heartbeat.start()
+
+
+    def stop(self):
+        """ Stops renewing leases, and releases those of jobs that weren't completed. """
+        if self.thread_heartbeat:
+            self.event_stopped.set()
+            self.thread_heartbeat.join()
+            self.thread_heartbeat = None
+
+        with self.lock:
+            keys_leased = list(self.keys_leased)
+
+        for key in keys_leased:
+            self.release(key)
@@ -0,0 +1,177 @@
+# Python
+import os
+import json
+import time
+import logging
+import sqlite3
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
+
+# 3rd Party
+
+
+# 1st Party
+
+
+@dataclass
+class DirectoryListing:
+    filenames: list[str]
+    dirnames: list[str]
+
+
+@dataclass
+class IndexedAudioFile:
+    """ Artist and song name previously derived for an audio file. Both are None if derivation failed. """
+    artist: Optional[str]
+    song_name: Optional[str]
+
+
+class LibraryIndex():
+    """ A persistent on-disk index of the audio files LyricManager has previously scanned.
+
+    Scanning a large library, e.g. on a network drive, is time-consuming. Listing every directory and reading the tags
+    of every audio file takes minutes before any lyrics are fetched. The index avoids repeating this work:
+
+    - Directory listings are cached by the directory's modification time. A directory's modification time changes
+      whenever an entry is added, removed, or renamed, so an unchanged directory need not be listed again.
+    - Artist and song names are cached by the audio file's path, modification time, and size, so tags are only read
+      again from files that have changed.
+
+    The index must be used from the thread that created it, and is intended to be used as a context manager.
+    """
+
+    # File-systems with coarse timestamps (e.g. FAT32 or some network drives) may not register a change that occurs
+    # within the same timestamp interval as a previous scan. Directories modified this recently are therefore not cached.
+    _minimum_directory_age_seconds = 2.0
+
+    def __init__(self, path_to_database: Path):
+        self.path_to_database = path_to_database
+
+        self.connection = sqlite3.connect(path_to_database)
+        self.connection.executescript("""
+            CREATE TABLE IF NOT EXISTS directories (
+                path        TEXT PRIMARY KEY,
+                mtime_ns    INTEGER NOT NULL,
+                filenames   TEXT NOT NULL,
+                dirnames    TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS audio_files (
+                path                TEXT NOT NULL,
+                name_source         TEXT NOT NULL,
+                mtime_ns            INTEGER NOT NULL,
+                size                INTEGER NOT NULL,
+                artist              TEXT,
+                song_name           TEXT,
+                PRIMARY KEY (path, name_source)
+            );
+        """)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+
+    @staticmethod
+    def scan_directory(path_to_directory: Path) -> DirectoryListing:
+        """ Lists the files and sub-directories in a directory, without consulting any index.
+
+        Like os.walk(), symbolic links to directories are not followed and unreadable directories are skipped.
+        """
+        listing = DirectoryListing([], [])
+
+        try:
+            with os.scandir(path_to_directory) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        listing.dirnames.append(entry.name)
+                    else:
+                        listing.filenames.append(entry.name)
+        except OSError as error:
+            logging.warning(f"Unable to scan directory '{path_to_directory}': {error}")
+
+        return listing
+
+
+    def list_directory(self, path_to_directory: Path) -> DirectoryListing:
+        """ Lists the files and sub-directories in a directory, re-using the cached listing if it's still current. """
+        key = os.path.abspath(path_to_directory)
+
+        try:
+            mtime_ns = os.stat(path_to_directory).st_mtime_ns
+        except OSError as error:
+            logging.warning(f"Unable to scan directory '{path_to_directory}': {error}")
+            return DirectoryListing([], [])
+
+        row = self.connection.execute(
+            "SELECT mtime_ns, filenames, dirnames FROM directories WHERE path = ?", (key,)).fetchone()
+
+        if row and row[0] == mtime_ns:
+            return DirectoryListing(json.loads(row[1]), json.loads(row[2]))
+
+        listing = self.scan_directory(path_to_directory)
+
+        if row:
+            # Forget cached artist and song names of files that have since disappeared.
+            filenames_removed = set(json.loads(row[1])) - set(listing.filenames)
+            self.connection.executemany(
+                "DELETE FROM audio_files WHERE path = ?",
+                [(os.path.join(key, filename),) for filename in filenames_removed])
+
+        directory_age_seconds = time.time() - (mtime_ns / 1e9)
+        if directory_age_seconds >= self._minimum_directory_age_seconds:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO directories (path, mtime_ns, filenames, dirnames) VALUES (?, ?, ?, ?)",
+                (key, mtime_ns, json.dumps(listing.filenames), json.dumps(listing.dirnames)))
+
+        return listing
+
+
+    def get_audio_file(self, path_to_audio_file: Path, name_source: str) -> Optional[IndexedAudioFile]:
+        """ Returns the previously derived artist and song name, or None if the file is new or has changed.
+
+        Args:
+            path_to_audio_file: Path to the audio file.
+            name_source: Identifies how the artist and song name was derived, e.g. from file tags or filename.
+        """
+        try:
+            stat_result = os.stat(path_to_audio_file)
+        except OSError:
+            return None
+
+        row = self.connection.execute(
+            "SELECT mtime_ns, size, artist, song_name FROM audio_files WHERE path = ? AND name_source = ?",
+            (os.path.abspath(path_to_audio_file), name_source)).fetchone()
+
+        if not row or row[0] != stat_result.st_mtime_ns or row[1] != stat_result.st_size:
+            return None
+
+        return IndexedAudioFile(row[2], row[3])
+
+
+    def set_audio_file(self, path_to_audio_file: Path, name_source: str, indexed_audio_file: IndexedAudioFile):
+        """ Stores the derived artist and song name of an audio file, along with its current modification time and size. """
+        try:
+            stat_result = os.stat(path_to_audio_file)
+        except OSError:
+            return
+
+        self.connection.execute(
+            "INSERT OR REPLACE INTO audio_files (path, name_source, mtime_ns, size, artist, song_name) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                os.path.abspath(path_to_audio_file),
+                name_source,
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                indexed_audio_file.artist,
+                indexed_audio_file.song_name
+            ))
@@ -0,0 +1,224 @@
+# Python
+import os
+import re
+import fnmatch
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional
+
+# 3rd Party
+
+
+# 1st Party
+from .library_index import LibraryIndex
+from .metrics import Metrics
+
+
+@dataclass(frozen=True)
+class ScanRules:
+    """ The rules by which LibraryScanner decides which folders to descend into, and which files to process.
+
+    Folder and file patterns are either glob patterns, e.g. '*stems*', or regular expressions prefixed with 're:', e.g.
+    're:^Backup \\d+$'. Glob patterns are matched case-insensitively.
+
+    Folder patterns without a path separator are matched against each folder's name, e.g. 'Backups' excludes any folder
+    named 'Backups'. Patterns with a path separator are matched against the folder's complete path, e.g.
+    '~/Music/Backups', or 'Archive/Stem Exports'. Regular expressions are searched for in the folder's complete path.
+
+    File patterns are matched against each file's name, including its extension.
+
+    Attributes:
+        audio_extensions: Extensions of the files to process, without a period. Matched case-insensitively.
+        folders_to_exclude: Folders which, including all of their sub-folders, are not scanned.
+        files_to_include: If any are given, only files matching at least one of these are processed.
+        files_to_exclude: Files which are not processed, even if included.
+    """
+    audio_extensions: tuple[str, ...]   = ("mp3", "wav", "aiff")
+    folders_to_exclude: tuple[str, ...] = ()
+    files_to_include: tuple[str, ...]   = ()
+    files_to_exclude: tuple[str, ...]   = ()
+
+
+class _CompiledPatterns():
+    """ A set of glob and regular expression patterns, compiled into as few regular expressions as possible. """
+
+    prefix_regular_expression = "re:"
+
+    def __init__(self, patterns: tuple[str, ...], match_path: bool):
+        """
+        Args:
+            match_path: If True, glob patterns with a path separator are matched against the complete path, otherwise
+                all glob patterns are only matched against the name.
+        """
+        globs_name = []
+        globs_path = []
+        regular_expressions = []
+
+        for pattern in patterns:
+            pattern = str(pattern)
+
+            if pattern.startswith(self.prefix_regular_expression):
+                regular_expressions.append(pattern[len(self.prefix_regular_expression):])
+            elif match_path and ("/" in pattern or "\\" in pattern or pattern.startswith("~")):
+                glob = self._normalize_path(os.path.expanduser(pattern)).rstrip("/")
+
+                # Relative patterns match the end of the path, e.g. 'Stems/Old' matches '/music/Stems/Old'
+                if not os.path.isabs(glob) and not glob.startswith("*"):
+                    glob = f"*/{glob}"
+
+                globs_path.append(glob)
+            else:
+                globs_name.append(pattern)
+
+        self.re_comp_name = self._compile_globs(globs_name)
+        self.re_comp_path = self._compile_globs(globs_path)
+        self.re_comp_regular_expressions = re.compile("|".join(f"(?:{expression})" for expression in regular_expressions)) \
+            if regular_expressions else None
+
+        self.is_empty = not patterns
+
+
+    @staticmethod
+    def _normalize_path(path: str) -> str:
+        return path.replace("\\", "/")
+
+
+    @staticmethod
+    def _compile_globs(globs: list[str]) -> Optional[re.Pattern]:
+        if not globs:
+            return None
+
+        return re.compile("|".join(fnmatch.translate(glob) for glob in globs), re.IGNORECASE)
+
+
+    def matches(self, path: Path) -> bool:
+        if self.re_comp_name and self.re_comp_name.match(path.name):
+            return True
+
+        if self.re_comp_path or self.re_comp_regular_expressions:
+            path_normalized = self._normalize_path(os.path.abspath(path))
+
+            if self.re_comp_path and self.re_comp_path.match(path_normalized):
+                return True
+
+            if self.re_comp_regular_expressions and self.re_comp_regular_expressions.search(path_normalized):
+                return True
+
+        return False
+
+
+class LibraryScanner():
+    """ Finds the audio files to process in a set of files and folders.
+
+    Excluded folders are pruned before they're listed, so none of their contents - however large - is ever scanned.
+    Files and folders explicitly given to scan() are always processed, the rules only apply to their contents.
+    """
+
+    def __init__(self, rules: ScanRules = ScanRules(), library_index: LibraryIndex = None, metrics: Metrics = None):
+        """
+        Args:
+            library_index: If provided, unchanged folders are not re-listed.
+        """
+        self.library_index = library_index
+        self.metrics = metrics if metrics else Metrics()
+
+        self.audio_extensions = {f".{extension.lower()}" for extension in rules.audio_extensions}
+
+        self.folders_to_exclude = _CompiledPatterns(rules.folders_to_exclude, match_path=True)
+        self.files_to_include = _CompiledPatterns(rules.files_to_include, match_path=False)
+        self.files_to_exclude = _CompiledPatterns(rules.files_to_exclude, match_path=False)
+
+
+    def is_audio_file(self, filename: str) -> bool:
+        return os.path.splitext(filename)[1].lower() in self.audio_extensions
+
+
+    def _is_file_included(self, filename: str) -> bool:
+        if not self.is_audio_file(filename):
+            return False
+
+        path = Path(filename)
+
+        if not self.files_to_include.is_empty and not self.files_to_include.matches(path):
+            return False
+
+        return not self.files_to_exclude.matches(path)
+
+
+    def is_included(self, path_to_audio_file: Path, path_to_root: Path, recursive: bool) -> bool:
+        """ Returns True if scan() would find the given file when scanning the given root folder.
+
+        Allows individual files, e.g. reported as changed, to be checked without scanning.
+        """
+        try:
+            path_relative = path_to_audio_file.relative_to(path_to_root)
+        except ValueError:
+            return False
+
+        if not self._is_file_included(path_to_audio_file.name):
+            return False
+
+        path_to_directory = path_to_audio_file.parent
+
+        if not recursive:
+            return path_to_directory == path_to_root
+
+        # Any excluded folder between the root folder and the file excludes the file
+        for _ in path_relative.parts[:-1]:
+            if self.folders_to_exclude.matches(path_to_directory):
+                return False
+            path_to_directory = path_to_directory.parent
+
+        return True
+
+
+    def _list_directory(self, path_to_directory: Path):
+        with self.metrics.time("scan.list_directory"):
+            if self.library_index:
+                return self.library_index.list_directory(path_to_directory)
+
+            return LibraryIndex.scan_directory(path_to_directory)
+
+
+    def scan(self, all_paths: list[Path], recursive: bool) -> list[Path]:
+        """ Returns all audio files in the paths provided, potentially scanning in sub-folders.
+
+        Args:
+            all_paths: Paths to audio files and/or folders containing audio files.
+            recursive: Whether to scan sub-folders.
+        """
+        all_audio_files = []
+
+        for path in all_paths:
+            if path.is_file():
+                if self.is_audio_file(path.name):
+                    all_audio_files.append(path)
+
+            elif path.is_dir():
+                audio_files_in_path = []
+                paths_to_directories = [path]
+
+                while paths_to_directories:
+                    path_to_directory = paths_to_directories.pop()
+
+                    listing = self._list_directory(path_to_directory)
+
+                    audio_files_in_path.extend(
+                        path_to_directory / filename for filename in listing.filenames if self._is_file_included(filename))
+
+                    if not recursive:
+                        continue
+
+                    for dirname in listing.dirnames:
+                        path_to_subdirectory = path_to_directory / dirname
+
+                        if self.folders_to_exclude.matches(path_to_subdirectory):
+                            self.metrics.increment("scan.folders_excluded")
+                            continue
+
+                        paths_to_directories.append(path_to_subdirectory)
+
+                # Directories are listed in an arbitrary order. For clarity/debugging, we prefer they are sorted by name
+                all_audio_files.extend(sorted(audio_files_in_path))
+
+        return all_audio_files
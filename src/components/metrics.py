@@ -0,0 +1,129 @@
+# Python
+import json
+import bisect
+import threading
+from pathlib import Path
+from time import perf_counter
+from contextlib import contextmanager
+
+# 3rd Party
+
+
+# 1st Party
+
+
+class Histogram():
+    """ Distribution of observed durations, in seconds, over a fixed set of buckets.
+
+    Buckets are cumulative, as in Prometheus: each bucket counts the observations less than or equal to its upper bound.
+    """
+
+    # Upper bounds spanning a cache lookup (~1 ms), to a network fetch (~1 s), to an alignment (~10 minutes)
+    bucket_upper_bounds = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 600.0, 1800.0)
+
+    def __init__(self):
+        self.count = 0
+        self.sum = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+        # The final bucket holds observations exceeding all upper bounds
+        self.bucket_counts = [0] * (len(self.bucket_upper_bounds) + 1)
+
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.sum += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+
+        self.bucket_counts[bisect.bisect_left(self.bucket_upper_bounds, seconds)] += 1
+
+
+    def to_dict(self) -> dict:
+        buckets = {}
+        amount_cumulative = 0
+
+        for upper_bound, amount in zip(self.bucket_upper_bounds, self.bucket_counts):
+            amount_cumulative += amount
+            buckets[str(upper_bound)] = amount_cumulative
+
+        buckets["+Inf"] = self.count
+
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "min": self.min if self.count else 0.0,
+            "max": self.max,
+            "buckets": buckets
+        }
+
+
+class Metrics():
+    """ Counters and duration histograms collected during a single run of LyricManager.
+
+    Metrics are identified by dotted names, e.g. 'lyric_fetcher.Pypi_LyricsGenius.cache_miss', and are created when
+    first used. Metrics are collected by several threads simultaneously.
+
+    Example:
+        with metrics.time("match"):
+            lyric_matcher.match_aligned_lyrics_with_structured_lyrics(...)
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+
+        self.counters: dict[str, int] = {}
+        self.histograms: dict[str, Histogram] = {}
+
+        self.time_created = perf_counter()
+
+
+    def reset(self):
+        """ Discards all metrics collected so far, e.g. to collect those of the next of several batches afresh.
+
+        Resetting, rather than creating new Metrics, keeps the metrics shared by all objects already collecting them.
+        """
+        with self.lock:
+            self.counters = {}
+            self.histograms = {}
+            self.time_created = perf_counter()
+
+
+    def increment(self, name: str, amount: int = 1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+
+    def observe(self, name: str, seconds: float):
+        with self.lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+
+            histogram.observe(seconds)
+
+
+    @contextmanager
+    def time(self, name: str):
+        """ Observes the wall time of the enclosed code in the named histogram, also if an exception is raised. """
+        time_start = perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, perf_counter() - time_start)
+
+
+    def to_dict(self) -> dict:
+        with self.lock:
+            return {
+                "seconds_elapsed": perf_counter() - self.time_created,
+                "counters": dict(sorted(self.counters.items())),
+                "histograms": {name: histogram.to_dict() for name, histogram in sorted(self.histograms.items())}
+            }
+
+
+    def write_json(self, path_to_metrics: Path):
+        with open(path_to_metrics, "w", encoding="utf-8") as file:
+            json.dump(self.to_dict(), file, indent=4)
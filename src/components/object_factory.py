@@ -1,17 +1,44 @@
+# Python
+import importlib
+from typing import Any, Callable, Optional, Union
+
+# 3rd Party
+
+
+# 1st Party
 
 
 # Inspiration: https://realpython.com/factory-method-python/
 
 class ObjectFactory:
-    def __init__(self):
-        self.builders = {}
+    """ Creates objects by key, using the builder registered for that key.
+
+    A builder is either a callable, e.g. a class, or a 'module:attribute' string naming one. Named builders are only
+    imported the first time they're used, so builders with heavy dependencies, e.g. lyric fetchers relying on
+    third-party packages, cost nothing unless they're actually created.
+    """
 
-    def register_builder(self, key, builder):
+    def __init__(self, package: Optional[str] = None):
+        # Anchor for builders named by a relative module, e.g. '.lyric.fetchers.lyric_fetcher_local_file:LyricFetcherLocalFile'
+        self.package = package
+        self.builders: dict[Any, Union[Callable, str]] = {}
+
+    def register_builder(self, key, builder: Union[Callable, str]):
         self.builders[key] = builder
 
     def create(self, key, **kwargs):
         builder = self.builders.get(key)
         if not builder:
             raise ValueError(key)
+
+        if isinstance(builder, str):
+            builder = self._import_builder(builder)
+            self.builders[key] = builder
+
         #return builder.create(**kwargs)
-        return builder(**kwargs)
\ No newline at end of file
+        return builder(**kwargs)
+
+    def _import_builder(self, builder_name: str) -> Callable:
+        module_name, _, attribute_name = builder_name.partition(":")
+        module = importlib.import_module(module_name, self.package)
+        return getattr(module, attribute_name)
@@ -0,0 +1,131 @@
+# Python
+import os
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Optional, Union
+
+# 3rd Party
+
+
+# 1st Party
+
+
+@dataclass
+class OutputRecord:
+    """ Summary of a successfully generated output file, and the fingerprint of the inputs it was generated from. """
+    fingerprint: str
+    words_total_automated: int  = 0
+    words_matched_automated: int = 0
+    words_total_tweaked: int    = 0
+    words_matched_tweaked: int  = 0
+    final_output_type: str      = ""
+
+
+class OutputFingerprints():
+    """ A persistent on-disk record of the input fingerprints from which each output file was last generated.
+
+    If the fingerprint of an output file's inputs matches the recorded fingerprint, the output file is known to be
+    up-to-date and need not be generated again. A summary of the previous result is also recorded, so up-to-date
+    outputs can still be reported on.
+
+    The record may be accessed by several threads simultaneously, and is intended to be used as a context manager.
+    """
+
+    def __init__(self, path_to_database: Path):
+        self.path_to_database = path_to_database
+
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path_to_database, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS outputs (
+                path                        TEXT PRIMARY KEY,
+                fingerprint                 TEXT NOT NULL,
+                words_total_automated       INTEGER NOT NULL,
+                words_matched_automated     INTEGER NOT NULL,
+                words_total_tweaked         INTEGER NOT NULL,
+                words_matched_tweaked       INTEGER NOT NULL,
+                final_output_type           TEXT NOT NULL
+            )
+        """)
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+
+    @staticmethod
+    def compute(*inputs: Union[str, bytes, Path, None]) -> str:
+        """ Computes a fingerprint from a series of inputs.
+
+        Strings and bytes are fingerprinted by content, and paths by the content of the file. For large files, such as
+        audio, see compute_from_file_stat(). None represents an input that doesn't exist, which is distinct from an
+        empty input.
+        """
+        hasher = hashlib.sha256()
+
+        for an_input in inputs:
+            if an_input is None:
+                hasher.update(b"\x00none")
+                continue
+
+            if isinstance(an_input, Path):
+                an_input = an_input.read_bytes()
+            elif isinstance(an_input, str):
+                an_input = an_input.encode("utf-8")
+
+            # Each input is length-prefixed, so inputs cannot run into one another, e.g. ("ab", "c") vs. ("a", "bc")
+            hasher.update(len(an_input).to_bytes(8, "little"))
+            hasher.update(an_input)
+
+        return hasher.hexdigest()
+
+
+    @staticmethod
+    def compute_from_file_stat(path_to_file: Path) -> str:
+        """ Returns a cheap stand-in for a file's content, based on its path, modification time, and size. """
+        stat_result = os.stat(path_to_file)
+        return f"{os.path.abspath(path_to_file)}|{stat_result.st_mtime_ns}|{stat_result.st_size}"
+
+
+    def get(self, path_to_output: Path) -> Optional[OutputRecord]:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT fingerprint, words_total_automated, words_matched_automated, words_total_tweaked, "
+                "words_matched_tweaked, final_output_type FROM outputs WHERE path = ?",
+                (os.path.abspath(path_to_output),)).fetchone()
+
+        if not row:
+            return None
+
+        return OutputRecord(*row)
+
+
+    def set(self, path_to_output: Path, output_record: OutputRecord):
+        with self.lock:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO outputs VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    os.path.abspath(path_to_output),
+                    output_record.fingerprint,
+                    output_record.words_total_automated,
+                    output_record.words_matched_automated,
+                    output_record.words_total_tweaked,
+                    output_record.words_matched_tweaked,
+                    output_record.final_output_type
+                ))
+            # Committed per output, so a crash or cancellation doesn't discard the fingerprints of completed outputs
+            self.connection.commit()
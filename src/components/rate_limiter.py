@@ -0,0 +1,168 @@
+# Python
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional
+from contextlib import contextmanager
+
+# 3rd Party
+
+
+# 1st Party
+from .file_lock import FileLock
+
+
+@dataclass
+class RateLimit:
+    """ Limits on how often a remote service may be accessed.
+
+    Attributes:
+        requests_per_second: Sustained rate at which requests may be made.
+        burst: Number of requests that may be made back-to-back, before the sustained rate applies.
+        daily_quota: Maximum number of requests per day (UTC), or None if unlimited.
+    """
+    requests_per_second: float
+    burst: int = 1
+    daily_quota: Optional[int] = None
+
+
+class RateLimiter():
+    """ A token bucket rate limiter, with an optional daily quota that's persisted across runs.
+
+    The bucket holds up to 'burst' tokens and is refilled at 'requests_per_second'. Each request consumes one token,
+    waiting for the bucket to refill if necessary. Once the daily quota is used up, requests are refused rather than
+    delayed, so the remote service isn't asked for more than it will grant.
+
+    The limiter may be used by several threads simultaneously. The daily quota may moreover be shared by several
+    processes, possibly on several machines, persisting their quota usage to the same file. Each request re-reads and
+    updates the file under a FileLock, rather than overwriting it with the process's own count.
+    """
+
+    def __init__(self, rate_limit: RateLimit, path_to_quota_usage: Path = None):
+        """
+        Args:
+            rate_limit: The limits to enforce.
+            path_to_quota_usage: Json file in which daily quota usage is persisted. Only required with a daily quota.
+        """
+        self.rate_limit = rate_limit
+        self.path_to_quota_usage = path_to_quota_usage
+
+        self.lock = threading.Lock()
+
+        self.tokens = float(rate_limit.burst)
+        self.time_last_refill = time.monotonic()
+
+        self.file_lock = None
+        if path_to_quota_usage:
+            self.file_lock = FileLock(path_to_quota_usage.with_name(f"{path_to_quota_usage.name}.lock"))
+
+        self.quota_date, self.quota_used = self._load_quota_usage()
+
+
+    @staticmethod
+    def _get_date_today() -> str:
+        return datetime.now(timezone.utc).date().isoformat()
+
+
+    def _load_quota_usage(self) -> tuple[str, int]:
+        date_today = self._get_date_today()
+
+        if not self.path_to_quota_usage or not self.path_to_quota_usage.exists():
+            return date_today, 0
+
+        try:
+            quota_usage = json.loads(self.path_to_quota_usage.read_text())
+            return quota_usage["date"], quota_usage["used"]
+        except (ValueError, KeyError) as error:
+            logging.warning(f"Ignoring malformed quota usage file '{self.path_to_quota_usage}': {error}")
+            return date_today, 0
+
+
+    def _save_quota_usage(self):
+        if not self.path_to_quota_usage:
+            return
+
+        path_to_quota_usage_temp = self.path_to_quota_usage.with_name(f"{self.path_to_quota_usage.name}.tmp")
+        path_to_quota_usage_temp.write_text(json.dumps({"date": self.quota_date, "used": self.quota_used}))
+        os.replace(path_to_quota_usage_temp, self.path_to_quota_usage)
+
+
+    def _reset_quota_if_new_day(self):
+        date_today = self._get_date_today()
+
+        if self.quota_date != date_today:
+            self.quota_date = date_today
+            self.quota_used = 0
+
+
+    def get_quota_remaining(self) -> Optional[int]:
+        """ Returns the number of requests remaining in today's quota, or None if there's no daily quota. """
+        if self.rate_limit.daily_quota is None:
+            return None
+
+        with self.lock:
+            # Other processes may have used some of the quota since. The file is replaced atomically, so it's read
+            # without the file lock.
+            if self.path_to_quota_usage:
+                self.quota_date, self.quota_used = self._load_quota_usage()
+
+            self._reset_quota_if_new_day()
+            return max(0, self.rate_limit.daily_quota - self.quota_used)
+
+
+    @contextmanager
+    def _update_quota_usage(self):
+        """ Re-reads the persisted quota usage, and holds the file lock while it's updated by the enclosed code. """
+        if not self.file_lock:
+            self._reset_quota_if_new_day()
+            yield
+            return
+
+        with self.file_lock:
+            self.quota_date, self.quota_used = self._load_quota_usage()
+            self._reset_quota_if_new_day()
+            yield
+
+
+    def acquire(self) -> bool:
+        """ Waits until a request may be made, and returns True. Returns False immediately if the quota is used up. """
+        with self.lock:
+            if self.rate_limit.daily_quota is not None:
+                with self._update_quota_usage():
+                    if self.quota_used >= self.rate_limit.daily_quota:
+                        return False
+
+                    # Quota is counted before the request is made, so a crash can't result in unrecorded requests.
+                    self.quota_used += 1
+                    self._save_quota_usage()
+
+            time_now = time.monotonic()
+            self.tokens = min(
+                float(self.rate_limit.burst),
+                self.tokens + (time_now - self.time_last_refill) * self.rate_limit.requests_per_second)
+            self.time_last_refill = time_now
+
+            # The token is reserved immediately, even if it must be waited for. Tokens thus become negative when
+            # several threads are waiting, and each waits for its own place in the queue.
+            self.tokens -= 1.0
+            wait_seconds = max(0.0, -self.tokens / self.rate_limit.requests_per_second)
+
+        if wait_seconds:
+            time.sleep(wait_seconds)
+
+        return True
+
+
+    def mark_quota_exhausted(self):
+        """ Marks today's quota as used up, e.g. because the remote service reports so despite requests remaining. """
+        if self.rate_limit.daily_quota is None:
+            return
+
+        with self.lock, self._update_quota_usage():
+            self.quota_used = max(self.quota_used, self.rate_limit.daily_quota)
+            self._save_quota_usage()
@@ -29,6 +29,8 @@ class DeveloperOptions():
     class ModelExecutionApplication(Enum):
         Apptainer = auto()
         Singularity = auto()
+        # Executes RunAlignment.sh directly, without a container. Mainly useful to test with a stub RunAlignment.sh.
+        Native = auto()
 
     # LyricManager offers various execution modes to allow for faster iterative development for a select set of code
     # paths:
@@ -2,9 +2,10 @@ from .gui_worker import GuiWorker
 from .qlistwidget_drag_and_drop import QListWidgetDragAndDrop
 from .logging_handler_signal import LoggingHandlerSignal
 from .progress_item_generator_gui import ProgressItemGeneratorGUI
+from .task_result_sink_gui import TaskResultSinkGUI
 from .widget_combobox_enum import ComboBoxEnum
 from .widget_qcheckbox_with_enum import WidgetQCheckBoxWithEnum
 from .widget_qradiobutton_with_enum import WidgetQRadioButtonWithEnum
 
 from .bind_properties import bind_property_window_main
-from .bind_properties import bind_property_window_settings
\ No newline at end of file
+from .bind_properties import bind_property_window_settings
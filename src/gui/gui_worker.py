@@ -17,6 +17,7 @@ class WorkerSignals(QtCore.QObject):
     progress = QtCore.Signal(float)
     task_description = QtCore.Signal(str)
     error = QtCore.Signal(tuple)
+    task_completed = QtCore.Signal(object)
     # result = QtCore.Signal(object)
 
 
@@ -23,9 +23,12 @@ class ProgressItemGeneratorGUI():
         The 'sister-class' ProgressItemGeneratorCLI relies on tqdm to report on progress in a command-line environment.
         We purposefully mirror the types of parameters tqdm expects to allow the calling code to use
         either wrapper seamlessly, e.g. 'desc' is used to set the description field in the GUI progress bar, just like
-        it's used in tqdm.
+        it's used in tqdm. Likewise, 'total' must be passed if elements has no len(), e.g., a generator.
         """
-        total = len(elements)
+        total = kwargs.get('total', None)
+        if total is None:
+            total = len(elements)
+
         progress = 0
 
         task_description = kwargs.get('desc', None)
@@ -42,8 +42,9 @@ class QListWidgetDragAndDrop(QListWidget):
         if self.accepted_audio_filename_extensions is None:
             return False
 
+        # Extensions are matched case-insensitively, e.g. 'Song.MP3' is accepted
         for extension in self.accepted_audio_filename_extensions:
-            if filename.endswith(extension):
+            if filename.lower().endswith(f".{extension.lower()}"):
                 return True
         
         return False
@@ -0,0 +1,23 @@
+# Python
+
+# 3rd Party
+# The error "version `GLIBC_2.28' not found" will occur on Ubuntu 18.04, as Qt6 requires Ubuntu 20.04
+from PySide6 import QtCore
+
+# 1st Party
+from ..results import TaskResult
+from ..results import TaskResultSinkInterface
+
+
+class TaskResultSinkGUI(TaskResultSinkInterface):
+    """ Passes on each task result via a signal, so the GUI can show results while processing is still in progress.
+
+    As processing may execute in a worker thread, the result is passed as a signal instead of updating any widgets
+    directly.
+    """
+
+    def __init__(self, signal_task_completed: QtCore.Signal(object)) -> None:
+        self.task_completed = signal_task_completed
+
+    def add(self, task_result: TaskResult):
+        self.task_completed.emit(task_result)
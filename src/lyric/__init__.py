@@ -1,3 +1,4 @@
 from .lyric_expander import LyricExpander
 from .lyric_matcher import LyricMatcher
-from .lyric_sanitizer import LyricSanitizer
\ No newline at end of file
+from .lyric_sanitizer import LyricSanitizer
+from .lyric_sanitizer import SanitizationRules
@@ -1,6 +1,8 @@
 from .lyric_aligner_interface import LyricAlignerInterface
 from .lyric_aligner_interface import WordAndTiming
+from .lyric_aligner_interface import WordTimings
 from .lyric_aligner_interface import AlignerOutput
+from .alignment_cache import AlignmentCache
 from .lyric_aligner_disabled import LyricAlignerDisabled
 from .lyric_aligner_NUS_autolyrixalign_offline import LyricAlignerNUSAutoLyrixAlignOffline
 from .lyric_aligner_NUS_autolyrixalign_online import LyricAlignerNUSAutoLyrixAlignOnline
\ No newline at end of file
@@ -0,0 +1,76 @@
+# Python
+import os
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+# 3rd Party
+
+
+# 1st Party
+from ...components.audio_fingerprint import compute_audio_fingerprint
+
+
+class AlignmentCache():
+    """ Stores lyric aligner output, addressed by the content of the audio and lyrics it was aligned from.
+
+    Aligner output is otherwise only found by the audio file's name, so renaming or moving an audio file, or a duplicate
+    of it elsewhere in the library, would require re-aligning it. As aligning lyrics takes minutes per song, any output
+    is instead also cached by a key derived from the audio data and the alignment ready lyrics.
+
+    Output is cached as one file per key, in a sub-directory per first two characters of the key, e.g.
+    'alignment_cache/3f/3f9a...c1.nusalaoffline'. The file extension identifies the aligner. Files are written
+    atomically, so the cache may be accessed by several threads, and processes, simultaneously.
+    """
+
+    def __init__(self, path_to_cache_directory: Path):
+        self.path_to_cache_directory = path_to_cache_directory
+        self.path_to_cache_directory.mkdir(parents=True, exist_ok=True)
+
+
+    @staticmethod
+    def compute_key(path_to_audio_file: Path, lyric_text_alignment_ready: str) -> Optional[str]:
+        """ Returns the key of the alignment of the given lyrics to the given audio, or None if the audio can't be read. """
+        try:
+            audio_fingerprint = compute_audio_fingerprint(path_to_audio_file)
+        except OSError as error:
+            logging.warning(f"Unable to fingerprint audio file: {error}")
+            return None
+
+        lyric_hash = hashlib.sha256(lyric_text_alignment_ready.encode("utf-8")).hexdigest()
+
+        return hashlib.sha256(f"{audio_fingerprint}|{lyric_hash}".encode("ascii")).hexdigest()
+
+
+    def _get_path(self, key: str, file_extension: str) -> Path:
+        return self.path_to_cache_directory / key[:2] / f"{key}{file_extension}"
+
+
+    def get(self, key: str, file_extension: str) -> Optional[Path]:
+        """ Returns the path to the cached aligner output, or None if it isn't cached. """
+        path_to_cached_output = self._get_path(key, file_extension)
+
+        if not path_to_cached_output.exists():
+            return None
+
+        return path_to_cached_output
+
+
+    def add(self, key: str, file_extension: str, path_to_aligner_output: Path):
+        path_to_cached_output = self._get_path(key, file_extension)
+        path_to_cached_output.parent.mkdir(exist_ok=True)
+
+        # Written to a temporary file first, so a partially written file is never found by get()
+        file_descriptor, path_to_temporary_file = tempfile.mkstemp(
+            prefix=f".{key}", suffix=".tmp", dir=path_to_cached_output.parent)
+
+        try:
+            with os.fdopen(file_descriptor, "wb") as file:
+                file.write(path_to_aligner_output.read_bytes())
+
+            os.replace(path_to_temporary_file, path_to_cached_output)
+        except BaseException:
+            os.unlink(path_to_temporary_file)
+            raise
@@ -1,5 +1,7 @@
 # Python
 import os
+import shutil
+import tempfile
 import subprocess
 import logging
 from pathlib import Path
@@ -10,12 +12,14 @@ from datetime import datetime
 
 # 1st Party
 from .lyric_aligner_interface import LyricAlignerInterface
-from .lyric_aligner_interface import WordAndTiming
+from .lyric_aligner_interface import WordTimings
 from .lyric_aligner_interface import AlignerOutput
+from .alignment_cache import AlignmentCache
 
 from ...lyric.dataclasses_and_types import LyricAlignTask
 
 from ...components import FileOperations
+from ...components import Metrics
 
 from ...developer_options import DeveloperOptions
 
@@ -55,7 +59,12 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
           not return within a reasonable amount of time.
     """
 
-    def __init__(self, path_aligner_temp_dir: Path, path_to_aligner: Path, path_to_output_dir: Path = None):
+    def __init__(self,
+                 path_aligner_temp_dir: Path,
+                 path_to_aligner: Path,
+                 path_to_output_dir: Path = None,
+                 metrics: Metrics = None,
+                 alignment_cache: AlignmentCache = None):
         """
 
         Args:
@@ -63,6 +72,9 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
             path_to_aligner:
             path_to_output_dir: If 'None' output files will be placed next to processed files, otherwise
                 they'll be place in the path specified in this parameter.
+            metrics: Records the wall time of each execution of NUSAutoLyrixAlign as 'aligner.execute', and the
+                number of re-used pre-existing outputs as 'aligner.preexisting_output'.
+            alignment_cache: If provided, output is also re-used for renamed, moved or duplicate audio files.
         """
 
         if " " in str(path_aligner_temp_dir):
@@ -70,7 +82,7 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
             logging.fatal(error)
             raise RuntimeError(error)
 
-        super().__init__(".nusalaoffline", ".nusalaoffline-manual", path_aligner_temp_dir, path_to_output_dir)
+        super().__init__(".nusalaoffline", ".nusalaoffline-manual", path_aligner_temp_dir, path_to_output_dir, metrics, alignment_cache)
         self.path_aligner = path_to_aligner
         self.path_to_output_dir = path_to_output_dir
 
@@ -84,14 +96,17 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
         path_to_alignment_script = path_to_aligner / "RunAlignment.sh"
         path_to_container_image = path_to_aligner / "kaldi.simg"
 
-        if not path_to_alignment_script.exists() or not path_to_container_image.exists():
+        container_image_required = \
+            DeveloperOptions.model_execution_application != DeveloperOptions.ModelExecutionApplication.Native
+
+        if not path_to_alignment_script.exists() or (container_image_required and not path_to_container_image.exists()):
             logging.warning("NUSAutoLyrixAlign is missing vital files to execute properly, can only run on cached files.")
             return
         
         self.aligner_functional = True
 
 
-    def _convert_to_wordandtiming(self, path_to_aligned_lyrics) -> list[WordAndTiming]:
+    def _convert_to_wordandtiming(self, path_to_aligned_lyrics) -> WordTimings:
 
         # Input looks like this:
         # 9.69 10.53 NO
@@ -102,29 +117,22 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
         # 18.75 20.85 SILENCE
 
         with open(path_to_aligned_lyrics) as file:
-            text_lines = file.readlines()
-
-        timed_words = []
-
-        for line in text_lines:
-            line = line.strip()
-            line_pieces = line.split(' ')
-
-            temp = WordAndTiming(word=line_pieces[2], time_start=float(line_pieces[0]), time_end=float(line_pieces[1]))
-            timed_words.append(temp)
-
-        return timed_words
+            return WordTimings.from_text(file.read())
 
 
     def align_lyrics(self, lyric_align_task: LyricAlignTask, path_to_lyric_input: Path, use_preexisting=True) -> AlignerOutput:
         """ Align lyrics using given task and lyric input path. May use pre-existing cached output and override alignment data if manual tweaks exist.
 
+        This function may be called from several threads simultaneously, as each alignment executes in its own
+        temporary directory.
+
         Args:
             path_to_audio_file:
             path_to_lyric_input:
-            use_preexisting: If a pre-existing alignment file is present, this will be re-used.
+            use_preexisting: If a pre-existing alignment file is present, this will be re-used. Pre-existing files are
+                found by the audio file's name, and otherwise in the alignment cache by the audio and lyrics' content.
         Returns:
-
+            AlignerOutput, which contains no automated alignment data if alignment failed.
         """
         aligner_output: AlignerOutput = AlignerOutput()
 
@@ -138,11 +146,26 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
 
             if path_to_model_output:
                 logging.info(f'Found pre-existing NUSAutoLyrixAlign file: {path_to_model_output}')
-        else:
+                self.metrics.increment("aligner.preexisting_output")
+
+        alignment_cache_key = None
+        if not path_to_model_output:
+            alignment_cache_key = self._get_alignment_cache_key(lyric_align_task)
+
+        if alignment_cache_key and use_preexisting:
+            path_to_model_output = self._get_aligned_output_file_from_alignment_cache(lyric_align_task, alignment_cache_key)
+
+            if path_to_model_output:
+                logging.info(f'Found NUSAutoLyrixAlign output of the same audio and lyrics in the alignment cache: {path_to_model_output}')
+
+        if not path_to_model_output:
             # Otherwise, create a fresh .nusalaoffline file
             path_to_model_output = self._align_lyrics_using_model(lyric_align_task, path_to_lyric_input)
             if not path_to_model_output:
-                return None
+                return aligner_output
+
+            if alignment_cache_key:
+                self.alignment_cache.add(alignment_cache_key, self.file_extension, path_to_model_output)
         
         aligner_output.automated = self._convert_to_wordandtiming(path_to_model_output)
 
@@ -162,35 +185,52 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
             logging.info("Missing vital components to execute aligner - skipping alignment.")
             return None
 
-        datetime_before_alignment = datetime.now()
-        path_temp_file_lyric_aligned = self._execute_NUSautolyrixalign(lyric_align_task.path_to_audio_file, path_to_lyric_input)
-        
-        # The most dependable way to ensure that the NUSAutoLyrixAlign process succeeded, is to
-        # check if the temporary output file has been updated.
-        if path_temp_file_lyric_aligned.exists() == False:
-            logging.warning(f"Unable to create aligned lyrics for {lyric_align_task.path_to_audio_file}")
-            return None
+        # Every alignment job receives its own scratch directory, allowing several jobs to execute simultaneously.
+        # Its name is generated from [a-z0-9_], so - like path_aligner_temp_dir - it contains no spaces.
+        path_to_job_dir = Path(tempfile.mkdtemp(prefix="job_", dir=self.path_aligner_temp_dir))
+
+        try:
+            datetime_before_alignment = datetime.now()
+
+            with self.metrics.time("aligner.execute"):
+                path_temp_file_lyric_aligned = self._execute_NUSautolyrixalign(
+                    lyric_align_task.path_to_audio_file,
+                    path_to_lyric_input,
+                    path_to_job_dir)
+            
+            # The most dependable way to ensure that the NUSAutoLyrixAlign process succeeded, is to
+            # check if the temporary output file has been updated.
+            if path_temp_file_lyric_aligned.exists() == False:
+                logging.warning(f"Unable to create aligned lyrics for {lyric_align_task.path_to_audio_file}")
+                return None
 
-        datetime_lyric_aligned = datetime.fromtimestamp(path_temp_file_lyric_aligned.stat().st_ctime)
+            datetime_lyric_aligned = datetime.fromtimestamp(path_temp_file_lyric_aligned.stat().st_ctime)
 
-        if datetime_before_alignment > datetime_lyric_aligned:
-            logging.warning('Lyric aligned existed before completion O_o')
-            return None
-        
-        # 'temp_dir/lyric_aligned.txt' --> 'working_directory/artist - song title.nusalaoffline'
-        path_to_aligned_lyric_file = self.copy_aligned_lyrics_to_working_directory(path_temp_file_lyric_aligned, lyric_align_task.path_to_audio_file)
+            if datetime_before_alignment > datetime_lyric_aligned:
+                logging.warning('Lyric aligned existed before completion O_o')
+                return None
+            
+            # 'temp_dir/job_xxx/lyric_aligned.txt' --> 'working_directory/artist - song title.nusalaoffline'
+            path_to_aligned_lyric_file = self.copy_aligned_lyrics_to_working_directory(path_temp_file_lyric_aligned, lyric_align_task.path_to_audio_file)
+        finally:
+            shutil.rmtree(path_to_job_dir, ignore_errors=True)
 
         return path_to_aligned_lyric_file
 
 
-    def _execute_NUSautolyrixalign(self, path_to_audio_file: Path, path_to_lyric_input: Path):
-        """ Copies audio and lyric file to a working directory, performs alignment, returns the path to this file.
+    def _execute_NUSautolyrixalign(self, path_to_audio_file: Path, path_to_lyric_input: Path, path_to_job_dir: Path):
+        """ Copies audio and lyric file to a job directory, performs alignment, returns the path to this file.
         
-        Copies audio and lyric files to a temporary location, executes NUSAutoLyrixAlign on this data generating lyric
-        alignment data, to then copy back.
+        Copies audio and lyric files to a temporary job directory, executes NUSAutoLyrixAlign on this data generating
+        lyric alignment data, to then copy back.
 
         NUSAutoLyrixAlign executes via Apptainer/Singularity. Singularity didn't handle spaces in path's well. Therefore
         we eliminate all spaces in the temporary pathing.
+
+        Args:
+            path_to_audio_file: Audio file to align lyrics to.
+            path_to_lyric_input: Alignment ready lyric file.
+            path_to_job_dir: A space-free directory used exclusively by this alignment job.
         """
         logging.info(f"Aligment audio: {path_to_audio_file}")
         logging.info(f"Aligment lyric: {path_to_lyric_input}")
@@ -198,8 +238,8 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
         # TODO: Upgrade to handle mp3 to wav conversion as that seems to go side-ways for Singularity...
         # Update, fixing conversion didn't help, it's in the scipy call that things go off the rails...
 
-        path_temp_file_audio: Path = self.path_aligner_temp_dir / "audio.notset"
-        path_temp_file_lyric: Path = self.path_aligner_temp_dir / "lyric.txt"
+        path_temp_file_audio: Path = path_to_job_dir / "audio.notset"
+        path_temp_file_lyric: Path = path_to_job_dir / "lyric.txt"
 
         # Update the temporary file suffix (.notset), to the proper audio file extension, e.g. .mp3 or .wav or .aiff
         path_temp_file_audio = path_temp_file_audio.with_suffix(path_to_audio_file.suffix)
@@ -207,7 +247,7 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
         FileOperations.copy_and_rename(path_to_audio_file, path_temp_file_audio)
         FileOperations.copy_and_rename(path_to_lyric_input, path_temp_file_lyric)
 
-        path_temp_file_lyric_aligned = self.path_aligner_temp_dir / "lyric_aligned.txt"
+        path_temp_file_lyric_aligned = path_to_job_dir / "lyric_aligned.txt"
 
         match DeveloperOptions.model_execution_application:
             case DeveloperOptions.ModelExecutionApplication.Apptainer:
@@ -220,15 +260,21 @@ class LyricAlignerNUSAutoLyrixAlignOffline(LyricAlignerInterface):
                 arguments_list = ['singularity', 'shell', 'kaldi.simg', '-c', f'"./RunAlignment.sh" "{path_temp_file_audio}" "{path_temp_file_lyric}" "{path_temp_file_lyric_aligned}"']
                 arguments_string = " ".join(arguments_list)
                 use_shell = False
-                
+
+            case DeveloperOptions.ModelExecutionApplication.Native:
+                arguments_list = ['./RunAlignment.sh', str(path_temp_file_audio), str(path_temp_file_lyric), str(path_temp_file_lyric_aligned)]
+                arguments_string = " ".join(arguments_list)
+                use_shell = False
+
 
         # logging.info() -- Enter details of audio file (original name here)
         logging.info(f"Processing Audio: {path_to_audio_file.name}")
         logging.info(f"Executing command: {arguments_string}")
-        result = subprocess.run(arguments_string,
+        # A failing alignment job shouldn't bring down the alignment jobs running alongside it, hence check=False
+        result = subprocess.run(arguments_string if use_shell else arguments_list,
                                 shell=use_shell,
                                 cwd=self.path_aligner,
-                                check=True)
+                                check=False)
 
         if result.returncode != 0:
             logging.warning("Lyric alignment did not complete as expected.")
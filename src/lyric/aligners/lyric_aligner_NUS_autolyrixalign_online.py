@@ -4,6 +4,7 @@ from pathlib import Path
 # 1st Party
 from .lyric_aligner_interface import LyricAlignerInterface
 from .lyric_aligner_interface import WordAndTiming
+from ...components import Metrics
 
 # 3rd Party
 
@@ -16,8 +17,8 @@ class LyricAlignerNUSAutoLyrixAlignOnline(LyricAlignerInterface):
     low priority. You're encouraged to use LyricAlignerNUSAutoLyrixAlignOffline instead.
     """
 
-    def __init__(self, path_to_output_dir: Path = None):
-        super().__init__(".nusalaonline", Path(), path_to_output_dir)
+    def __init__(self, path_to_output_dir: Path = None, metrics: Metrics = None):
+        super().__init__(".nusalaonline", Path(), path_to_output_dir, metrics=metrics)
 
     def _convert_to_wordandtiming(self, input):
         return []
@@ -4,7 +4,9 @@ from pathlib import Path
 
 # 1st Party
 from .lyric_aligner_interface import LyricAlignerInterface
-from .lyric_aligner_interface import WordAndTiming
+from .lyric_aligner_interface import WordTimings
+from .lyric_aligner_interface import AlignerOutput
+from ...components import Metrics
 
 # 3rd Party
 
@@ -12,12 +14,12 @@ from .lyric_aligner_interface import WordAndTiming
 # Used to be named 'Off', but this is interpreted as 'False' by PyYaml
 class LyricAlignerDisabled(LyricAlignerInterface):
 
-    def __init__(self, path_to_output_dir: Path = None):
-        super().__init__(".na", Path(), path_to_output_dir)
+    def __init__(self, path_to_output_dir: Path = None, metrics: Metrics = None):
+        super().__init__(".na", Path(), path_to_output_dir, metrics=metrics)
 
-    def _convert_to_wordandtiming(self, input):
-        return []
+    def _convert_to_wordandtiming(self, input) -> WordTimings:
+        return WordTimings()
 
-    def align_lyrics(self, path_to_audio_file, path_to_lyric_input, use_preexisting) -> list[WordAndTiming]:
+    def align_lyrics(self, path_to_audio_file, path_to_lyric_input, use_preexisting) -> AlignerOutput:
         logging.info("Lyric alignment *disabled* - no lyrics aligned.")
-        return []
\ No newline at end of file
+        return AlignerOutput()
\ No newline at end of file
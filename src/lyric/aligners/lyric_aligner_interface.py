@@ -1,10 +1,12 @@
 # Python
 from __future__ import annotations
+import sys
 import logging
+from array import array
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 
 # 3rd Party
@@ -12,29 +14,100 @@ from typing import TYPE_CHECKING
 
 # 1st Party
 from ...components import FileOperations
+from ...components import Metrics
+
+from .alignment_cache import AlignmentCache
 
 
 if TYPE_CHECKING:
     from ...lyric.dataclasses_and_types import LyricAlignTask
 
-@dataclass
+@dataclass(slots=True)
 class WordAndTiming():
     word: str
     time_start: float
     time_end: float
 
+class WordTimings():
+    """ Words with timing information, as produced by a lyric aligner, stored column-wise.
+
+    A song consists of hundreds of timed words, and a library of hundreds of thousands. Rather than one object per word,
+    the words and their start and end times are each stored in a single column. Words are interned, as songs repeat the
+    same words many times. Iterating yields a WordAndTiming per word, for convenience.
+    """
+
+    def __init__(self, words: list[str] = None, times_start: array = None, times_end: array = None):
+        self.words: list[str] = words if words is not None else []
+        self.times_start: array = times_start if times_start is not None else array('d')
+        self.times_end: array = times_end if times_end is not None else array('d')
+
+
+    @classmethod
+    def from_text(cls, text: str) -> WordTimings:
+        """ Parses lines of '<time start> <time end> <word>', e.g. '9.69 10.53 NO', skipping malformed lines. """
+        tokens = text.split()
+
+        # Well-formed text is parsed in bulk, a column at a time.
+        if len(tokens) % 3 == 0 and len(tokens) == 3 * len(text.splitlines()):
+            return cls(
+                [sys.intern(word) for word in tokens[2::3]],
+                array('d', map(float, tokens[0::3])),
+                array('d', map(float, tokens[1::3])))
+
+        word_timings = cls()
+
+        for line in text.splitlines():
+            line_pieces = line.split()
+
+            if len(line_pieces) != 3:
+                if line_pieces:
+                    logging.warning(f"Ignoring malformed word timing: '{line}'")
+                continue
+
+            word_timings.append(line_pieces[2], float(line_pieces[0]), float(line_pieces[1]))
+
+        return word_timings
+
+
+    def append(self, word: str, time_start: float, time_end: float):
+        self.words.append(sys.intern(word))
+        self.times_start.append(time_start)
+        self.times_end.append(time_end)
+
+
+    def get_words_lowercase(self) -> list[str]:
+        # Each distinct word is only lowercased once
+        words_lowercase = {word: sys.intern(word.lower()) for word in set(self.words)}
+        return [words_lowercase[word] for word in self.words]
+
+
+    def __len__(self) -> int:
+        return len(self.words)
+
+
+    def __iter__(self):
+        for word, time_start, time_end in zip(self.words, self.times_start, self.times_end):
+            yield WordAndTiming(word, time_start, time_end)
+
+
 @dataclass
 class AlignerOutput():
     # Alignment models aren't perfect. Most model output will be about 70-90% accurate. In many cases, some minor manual tweaking
     # can make a big difference, so LyricManager supports processing manually tweaked alignment data which takes precedence
     # in the final output, and will be compared/ranked against the fully automatic output.
-    automated: list[WordAndTiming] = None
-    tweaked: list[WordAndTiming] = None
+    automated: WordTimings = None
+    tweaked: WordTimings = None
 
 
 class LyricAlignerInterface(ABC):
 
-    def __init__(self, file_extension: str, file_extension_manual_tweak: str, path_aligner_temp_dir: Path, path_to_output_dir: Path = None):
+    def __init__(self,
+                 file_extension: str,
+                 file_extension_manual_tweak: str,
+                 path_aligner_temp_dir: Path,
+                 path_to_output_dir: Path = None,
+                 metrics: Metrics = None,
+                 alignment_cache: AlignmentCache = None):
         self.file_extension = file_extension
 
         self.file_extension_manual_tweak = file_extension_manual_tweak
@@ -45,6 +118,10 @@ class LyricAlignerInterface(ABC):
         self.path_aligner_temp_dir.mkdir(parents=True, exist_ok=True)
         self.path_to_output_dir = path_to_output_dir
 
+        self.metrics = metrics if metrics else Metrics()
+
+        self.alignment_cache = alignment_cache
+
 
     def _get_cached_aligned_output_file(self, path_to_audio_file:Path) -> Path:
         """ Retrieves a previously generated aligned output file.
@@ -75,6 +152,31 @@ class LyricAlignerInterface(ABC):
         
         return None
     
+    def _get_alignment_cache_key(self, lyric_align_task: LyricAlignTask) -> Optional[str]:
+        """ Returns the key of the task's aligner output in the alignment cache, or None if there's no cache. """
+        if not self.alignment_cache:
+            return None
+
+        return self.alignment_cache.compute_key(lyric_align_task.path_to_audio_file, lyric_align_task.lyric_text_alignment_ready)
+
+
+    def _get_aligned_output_file_from_alignment_cache(self, lyric_align_task: LyricAlignTask, key: str) -> Optional[Path]:
+        """ Retrieves aligner output previously generated for the same audio and lyrics, even if under another name.
+
+        The cached output is copied to where output for the task's audio file is expected, so it's found by name from
+        then on, e.g. by _get_cached_aligned_output_file().
+        """
+        path_to_cached_output = self.alignment_cache.get(key, self.file_extension)
+
+        if not path_to_cached_output:
+            self.metrics.increment("aligner.alignment_cache_miss")
+            return None
+
+        self.metrics.increment("aligner.alignment_cache_hit")
+
+        return self.copy_aligned_lyrics_to_working_directory(path_to_cached_output, lyric_align_task.path_to_audio_file)
+
+
     # TODO: Clean up
     def _get_manually_tweaked_alignment_data_file(self, path_to_audio_file:Path) -> Path:
         path_to_alignment_file_next_to_audio_file = path_to_audio_file.with_suffix(self.file_extension_manual_tweak)
@@ -92,6 +194,17 @@ class LyricAlignerInterface(ABC):
         return None
 
 
+    def get_preexisting_alignment_files(self, path_to_audio_file: Path) -> tuple[Optional[Path], Optional[Path]]:
+        """ Returns paths to the pre-existing automated and manually tweaked alignment files, or None if absent. """
+        path_to_automated = self._get_cached_aligned_output_file(path_to_audio_file)
+
+        # Without automated output, alignment must still be performed, so we don't bother looking for tweaked output.
+        if not path_to_automated:
+            return None, None
+
+        return path_to_automated, self._get_manually_tweaked_alignment_data_file(path_to_audio_file)
+
+
     def get_corresponding_aligned_lyric_file(self, path_to_audio_file:Path):
         path_to_lyric_aligned_file = path_to_audio_file.with_suffix(self.file_extension)
 
@@ -125,5 +238,5 @@ class LyricAlignerInterface(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def _convert_to_wordandtiming(self, input) -> list[WordAndTiming]:
+    def _convert_to_wordandtiming(self, input) -> WordTimings:
         raise NotImplementedError
\ No newline at end of file
@@ -7,7 +7,9 @@
 
 from .lyric_align_task import LyricAlignTask, LyricAlignmentOutput
 from .lyric_aligner_type import LyricAlignerType
+from .lyric_cache_type import LyricCacheType
 from .lyric_fetcher_type import LyricFetcherType
+from .lyric_matching_method import LyricMatchingMethod
 from .lyric_payload import LyricPayload
 from .lyric_validity import LyricValidity
 #from .lyric_validity import ValidityNew
\ No newline at end of file
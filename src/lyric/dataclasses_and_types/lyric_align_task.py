@@ -5,10 +5,11 @@ from dataclasses import dataclass, field
 from enum import Enum, auto
 
 # 3rd Party
-import eyed3
+
 
 # 1st Party
 from ...developer_options import DeveloperOptions
+from ...components.audio_tag_reader import read_artist_and_title
 
 from .lyric_payload import LyricPayload
 from .lyric_match import MatchResult, MatchLyric
@@ -24,7 +25,7 @@ class LyricAlignmentOutput(Enum):
     # Tweaked means that after tha automated output, a human tweaked the results
     Tweaked = auto()
 
-@dataclass
+@dataclass(slots=True)
 class LyricAlignTask:
     """ Contains lyric and lyric metadata passed through LyricManager as it fetches and aligns lyrics.
 
@@ -36,6 +37,10 @@ class LyricAlignTask:
 
     Currently, LyricAlignTask can only house lyrics from a single source, but in the future it might be advantagous for
     it to actually house lyrics from multiple sources.
+
+    Every task of a run is kept until the run's report is written, which for a large library amounts to tens of
+    thousands of tasks. Tasks therefore use __slots__, and once written to disk, release_heavy_data() discards all but
+    the summary needed for reporting.
     """
 
     path_to_audio_file: Path
@@ -71,6 +76,13 @@ class LyricAlignTask:
     # Defaults to automated, as the tweaked output is expected to always be based on top of an automated output
     final_output_type: LyricAlignmentOutput = LyricAlignmentOutput.Automated
 
+    # Set if the final aligned lyrics output was already up-to-date, and therefore wasn't generated again
+    skipped_as_up_to_date: bool     = False
+
+    # Progress flags, which remain valid once heavy data has been released
+    alignment_prepared: bool        = False                         # Alignment ready lyrics were passed to the aligner
+    aligned_lyrics_written: bool    = False                         # Final aligned lyrics output was written to disk
+
 
     def __post_init__(self):
         """ Parses given data into more granular data. """
@@ -114,6 +126,30 @@ class LyricAlignTask:
         return lyric_align_task
 
 
+    @classmethod
+    def create_from_cache_key(cls, cache_key: str, artist: str = None, song_name: str = None):
+        """ Creates LyricAlignTask for a song only known by its lyric cache key, i.e. its filename without extension.
+
+        The audio file itself isn't accessed, so unless the artist and song name are provided, e.g. as recorded in the
+        lyric cache, they can only be derived from the filename.
+
+        Args:
+            cache_key: The audio filename without its extension, e.g. 'Artist - Songname'.
+        Returns:
+            A LyricAlignTask object, whose artist and song name are empty if they couldn't be derived.
+        """
+        # The extension is a placeholder, as cache keys may contain periods, e.g. 'Artist - Song 2.0'
+        lyric_align_task: LyricAlignTask = cls(Path(f"{cache_key}.audio"))
+
+        if artist and song_name:
+            lyric_align_task.artist = artist
+            lyric_align_task.song_name = song_name
+        else:
+            lyric_align_task._derive_artist_song_name_from_filename()
+
+        return lyric_align_task
+
+
     def _derive_artist_song_name_from_tags(self) -> bool:
         """ Sets artist and song title based on the audio file's meta tags.
         
@@ -125,19 +161,13 @@ class LyricAlignTask:
         if self.path_to_audio_file.suffix != ".mp3":
             return False
 
-        audio_file = eyed3.load(self.path_to_audio_file)
+        artist, title = read_artist_and_title(self.path_to_audio_file)
 
-        if not audio_file:
-            return False
-        
-        if not audio_file.tag:
-            return False
-        
-        if audio_file.tag.artist is None or audio_file.tag.title is None:
+        if artist is None or title is None:
             return False
 
-        self.artist = audio_file.tag.artist
-        self.song_name = audio_file.tag.title
+        self.artist = artist
+        self.song_name = title
 
         return True
     
@@ -169,10 +199,13 @@ class LyricAlignTask:
         if self.lyric_payload.validity != LyricValidity.Valid:
             return self.lyric_payload.validity.text
         
-        if not self.lyric_text_alignment_ready:
+        if self.skipped_as_up_to_date:
+            return "Valid Lyrics - Output already up-to-date"
+
+        if not self.alignment_prepared:
             return "Valid Lyrics - No alignment done."
         
-        if not self.lyrics_aligned_disk_output:
+        if not self.aligned_lyrics_written:
             return "Valid Lyrics - No alignment written to disk, which is strange as the data was prepared to do it?"
         
         match(self.final_output_type):
@@ -184,6 +217,21 @@ class LyricAlignTask:
                 return "Valid Lyrics - But unknown source?! This shouldn't happen."
             
 
+    def release_heavy_data(self):
+        """ Discards lyrics and alignment data, retaining only what's needed to report on the task's result. """
+        self.lyric_payload.source = None
+        self.lyric_payload.text_raw = ""
+        self.lyric_payload.text_sanitized = ""
+
+        self.lyric_text_expanded = ""
+        self.lyric_lines_expanded = []
+        self.lyric_text_alignment_ready = ""
+
+        self.lyrics_aligned_automated = []
+        self.lyrics_aligned_tweaked = []
+        self.lyrics_aligned_disk_output = {}
+
+
     def convert_best_aligment_lyrics_to_dict(self) -> dict:
         """ Converts MatchLyric data-classes into a dict ready for Json conversion for disk-serialization. """
 
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+class LyricCacheType(Enum):
+    # Two files per song per lyric fetcher in the working directory, e.g. 'Artist - Song.genius_source'
+    SidecarFiles = auto()
+    # A single SQLite database in the working directory
+    Sqlite = auto()
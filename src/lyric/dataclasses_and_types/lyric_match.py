@@ -11,7 +11,8 @@ from ...components.miscellaneous import get_percentage_and_amount_string
 
 
 
-@dataclass
+# Songs consist of hundreds of words, so MatchLyric (and MatchResult) use __slots__ to keep their memory footprint low.
+@dataclass(slots=True)
 class MatchLyric:
     """ Houses matching data to re-connect a time-aligned word back to the originally structured lyrics. """
     word_original: str                # Includes apostrophe's, commas, and ()'s, e.g. "(bring", "one,", "Glancin'", "Jealousy!"
@@ -34,7 +35,7 @@ class MatchLyric:
         return self.word_original + self.word_split_char_post
 
 
-@dataclass
+@dataclass(slots=True)
 class MatchResult:
     words_total: int          = 0
     words_matched: int        = 0
@@ -0,0 +1,7 @@
+from enum import Enum, auto
+
+class LyricMatchingMethod(Enum):
+    # Forward-searches an expanding/contracting window of structured lyrics for each time aligned word
+    Greedy = auto()
+    # Banded global sequence alignment (Needleman-Wunsch) of all time aligned words against all structured lyrics
+    GlobalAlignment = auto()
@@ -9,7 +9,7 @@ from typing import Any
 from .lyric_validity import LyricValidity
 
 
-@dataclass
+@dataclass(slots=True)
 class LyricPayload():
     """ Represents Lyrics data generated and passed around in lyric fetchers
 
@@ -1,6 +1,30 @@
 from .lyric_fetcher_base import LyricFetcherBase
-from .lyric_fetcher_disabled import LyricFetcherDisabled
-from .lyric_fetcher_local_file import LyricFetcherLocalFile
-from .lyric_fetcher_pypi_lyricsgenius import LyricFetcherPyPiLyricsGenius
-from .lyric_fetcher_pypi_lyrics_extractor import LyricFetcherPyPiLyricsExtractor
-from .lyric_fetcher_website_lyrics_dot_ovh import LyricFetcherWebsiteLyricsDotOvh
\ No newline at end of file
+from .lyric_cache import LyricCacheInterface
+from .lyric_cache import LyricCacheSidecarFiles
+from .lyric_cache import LyricCacheSqlite
+from .lyric_cache_resanitizer import resanitize_lyric_cache
+from .lyric_cache_resanitizer import ResanitizationResult
+from .fetch_history import FetchHistory
+
+# Lyric fetchers rely on sizeable third-party packages, and are only imported once accessed (PEP 562).
+_lazy_lyric_fetchers = {
+    "LyricFetcherDisabled": ".lyric_fetcher_disabled",
+    "LyricFetcherLocalFile": ".lyric_fetcher_local_file",
+    "LyricFetcherPyPiLyricsGenius": ".lyric_fetcher_pypi_lyricsgenius",
+    "LyricFetcherPyPiLyricsExtractor": ".lyric_fetcher_pypi_lyrics_extractor",
+    "LyricFetcherWebsiteLyricsDotOvh": ".lyric_fetcher_website_lyrics_dot_ovh",
+}
+
+
+def __getattr__(name: str):
+    if name not in _lazy_lyric_fetchers:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    import importlib
+    lyric_fetcher = getattr(importlib.import_module(_lazy_lyric_fetchers[name], __name__), name)
+    globals()[name] = lyric_fetcher
+    return lyric_fetcher
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_lyric_fetchers))
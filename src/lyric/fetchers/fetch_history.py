@@ -0,0 +1,261 @@
+# Python
+import os
+import json
+import time
+import logging
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from collections import defaultdict
+from typing import DefaultDict
+from enum import Enum, auto
+
+# 3rd Party
+
+
+# 1st Party
+from ...components.file_lock import FileLock
+
+
+class FetchErrorType(Enum):
+    TimeOut = auto()
+    NotFound = auto()
+    Unknown = auto()
+
+
+# Delay before a song may be fetched again after an error, per error type, as (initial delay, maximum delay) in seconds.
+# The delay doubles with each consecutive error of the same type. Time outs are typically transient, whereas a song that
+# isn't found is unlikely to appear at the source soon.
+_hour = 60 * 60
+_day = 24 * _hour
+retry_delays_seconds = {
+    FetchErrorType.TimeOut:     (1 * _hour, 1 * _day),
+    FetchErrorType.NotFound:    (14 * _day, 180 * _day),
+    FetchErrorType.Unknown:     (1 * _day, 30 * _day),
+}
+
+
+# FetchErrors is a @dataclass so we can construct defaultdict(FetchErrors) which can be serialized using jsons.
+# defaultdict(defaultdict(Enum)) cannot be serialized in using jsons.
+@dataclass
+class FetchErrors():
+    time_out : int = 0
+    not_found : int = 0
+    unknown : int = 0
+
+    # Unix timestamps. A retry_after of 0 with errors present stems from a fetch history predating retries.
+    time_last_error : float = 0.0
+    retry_after : float = 0.0
+
+    def get_total_error_amount(self):
+        return self.time_out + self.not_found + self.unknown
+
+    def is_due_for_retry(self, time_now: float) -> bool:
+        return self.get_total_error_amount() == 0 or self.retry_after <= time_now
+
+    def add_error(self, error_type: FetchErrorType, time_error: float):
+        match error_type:
+            case FetchErrorType.TimeOut:
+                self.time_out += 1
+                error_amount = self.time_out
+            case FetchErrorType.NotFound:
+                self.not_found += 1
+                error_amount = self.not_found
+            case FetchErrorType.Unknown:
+                self.unknown += 1
+                error_amount = self.unknown
+
+        delay_initial, delay_maximum = retry_delays_seconds[error_type]
+        # The exponent is capped, as the delay reaches its maximum long before then anyway
+        delay = min(delay_initial * 2 ** min(error_amount - 1, 32), delay_maximum)
+
+        self.time_last_error = time_error
+        self.retry_after = time_error + delay
+
+
+class FetchHistory():
+    """ Records failed attempts at fetching lyrics per song, so songs known to fail aren't fetched again.
+
+    The history is kept in memory and persisted as two files:
+    - A snapshot, e.g. 'fetch_history.genius', containing the complete history as of the most recent compaction.
+    - A journal, e.g. 'fetch_history.genius.journal', to which each newly recorded error is appended as a json line.
+
+    Songs aren't skipped forever. Each error schedules a time after which fetching the song may be retried, see
+    retry_delays_seconds.
+
+    Recorded errors are appended to the journal in batches, so at most one batch is lost if LyricManager crashes. When
+    the journal grows large, and when the history is closed, the journal is compacted into the snapshot.
+
+    The history may be accessed by several threads simultaneously. The files may moreover be shared by several
+    processes, possibly on several machines, e.g. workers sharing a job queue. Appending and compacting occur under a
+    FileLock, and compaction merges the snapshot and journal on disk, so errors recorded by other processes are kept,
+    and picked up by this process.
+    """
+
+    def __init__(self, path_to_snapshot: Path, batch_size: int = 32, compaction_threshold: int = 4096):
+        """
+        Args:
+            path_to_snapshot: Path to the snapshot. The journal is located next to it.
+            batch_size: Number of recorded errors to append to the journal at once.
+            compaction_threshold: Number of journal entries at which the journal is compacted into the snapshot.
+        """
+        self.path_to_snapshot = path_to_snapshot
+        self.path_to_journal = path_to_snapshot.with_name(f"{path_to_snapshot.name}.journal")
+        self.file_lock = FileLock(path_to_snapshot.with_name(f"{path_to_snapshot.name}.lock"))
+
+        self.batch_size = batch_size
+        self.compaction_threshold = compaction_threshold
+
+        # Accessing the history via a defaultdict inserts new entries, which must not happen while another thread
+        # serializes it to disk.
+        self.lock = threading.Lock()
+
+        self.fetch_errors: DefaultDict[str, FetchErrors] = self._load_snapshot()
+        self.journal_entries_amount = 0
+        self.journal_entries_pending: list[str] = []
+
+        # A journal left behind by a previous run, e.g. due to a crash, is compacted immediately. Otherwise new entries
+        # could be appended to a partially written final line.
+        if self.path_to_journal.exists():
+            self._compact()
+
+
+    def _load_snapshot(self) -> DefaultDict[str, FetchErrors]:
+        if not self.path_to_snapshot.exists():
+            return defaultdict(FetchErrors)
+
+        # jsons is only imported if there's a fetch history, which for most local-only runs there isn't
+        import jsons as jsonserializer
+
+        file_content = self.path_to_snapshot.read_text()
+        fetch_errors = jsonserializer.loads(file_content, DefaultDict[str, FetchErrors])
+
+        # Errors recorded before retries were supported have no timestamp. Rather than retrying all of them at once,
+        # which could exhaust a source's quota, they're treated as having occurred now.
+        time_now = time.time()
+        for a_fetch_errors in fetch_errors.values():
+            if a_fetch_errors.get_total_error_amount() and not a_fetch_errors.retry_after:
+                a_fetch_errors.time_last_error = time_now
+                a_fetch_errors.retry_after = time_now + retry_delays_seconds[self._get_most_frequent_error_type(a_fetch_errors)][0]
+
+        return fetch_errors
+
+
+    @staticmethod
+    def _get_most_frequent_error_type(fetch_errors: FetchErrors) -> FetchErrorType:
+        error_amounts = {
+            FetchErrorType.TimeOut: fetch_errors.time_out,
+            FetchErrorType.NotFound: fetch_errors.not_found,
+            FetchErrorType.Unknown: fetch_errors.unknown,
+        }
+        return max(error_amounts, key=error_amounts.get)
+
+
+    def _replay_journal(self, fetch_errors: DefaultDict[str, FetchErrors]):
+        """ Applies all journal entries to the given history. """
+        if not self.path_to_journal.exists():
+            return
+
+        time_now = time.time()
+
+        with open(self.path_to_journal, 'r', encoding='utf-8') as file:
+            for line in file:
+                try:
+                    entry = json.loads(line)
+                    fetch_errors[entry["filename"]].add_error(FetchErrorType[entry["error_type"]], entry.get("time", time_now))
+                except (ValueError, KeyError):
+                    # Only the final line is expected to be malformed, if LyricManager crashed mid-write.
+                    logging.warning(f"Ignoring malformed entry in fetch history journal: {self.path_to_journal}")
+
+
+    def is_due_for_retry(self, filename: str) -> bool:
+        """ Returns False if a previous attempt at fetching lyrics for the given filename failed too recently. """
+        with self.lock:
+            fetch_errors = self.fetch_errors.get(filename)
+            return fetch_errors is None or fetch_errors.is_due_for_retry(time.time())
+
+
+    def get_retry_after(self, filename: str) -> float:
+        """ Returns the unix timestamp after which fetching lyrics for the given filename may be retried. """
+        with self.lock:
+            fetch_errors = self.fetch_errors.get(filename)
+            return fetch_errors.retry_after if fetch_errors else 0.0
+
+
+    def get_amount_due_for_retry(self) -> tuple[int, int]:
+        """ Returns the number of songs with previous fetch errors that are, and aren't yet, due for retry. """
+        time_now = time.time()
+
+        with self.lock:
+            amount_with_errors = sum(1 for fetch_errors in self.fetch_errors.values() if fetch_errors.get_total_error_amount())
+            amount_due = sum(
+                1 for fetch_errors in self.fetch_errors.values()
+                if fetch_errors.get_total_error_amount() and fetch_errors.is_due_for_retry(time_now))
+
+        return amount_due, amount_with_errors - amount_due
+
+
+    def record_error(self, filename: str, error_type: FetchErrorType):
+        """ Records a failed attempt at fetching lyrics for the given filename. """
+        time_error = time.time()
+
+        with self.lock:
+            self.fetch_errors[filename].add_error(error_type, time_error)
+
+            entry = {"filename": filename, "error_type": error_type.name, "time": time_error}
+            self.journal_entries_pending.append(json.dumps(entry))
+
+            if len(self.journal_entries_pending) >= self.batch_size:
+                self._flush()
+
+
+    def flush(self):
+        """ Appends all pending errors to the journal. """
+        with self.lock:
+            self._flush()
+
+
+    def close(self):
+        """ Compacts the journal into the snapshot. """
+        with self.lock:
+            self._flush()
+
+            if self.journal_entries_amount:
+                self._compact()
+
+
+    def _flush(self):
+        if not self.journal_entries_pending:
+            return
+
+        with self.file_lock, open(self.path_to_journal, 'a', encoding='utf-8') as file:
+            file.write("\n".join(self.journal_entries_pending) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+
+        self.journal_entries_amount += len(self.journal_entries_pending)
+        self.journal_entries_pending.clear()
+
+        if self.journal_entries_amount >= self.compaction_threshold:
+            self._compact()
+
+
+    def _compact(self):
+        # The snapshot is replaced atomically, and only then is the journal removed. A crash in between merely replays
+        # the journal onto a snapshot that already contains it, over-counting errors and thereby lengthening retry delays.
+        import jsons as jsonserializer
+
+        # All errors recorded by this process have been appended to the journal by now. The history is rebuilt from
+        # disk, rather than written from memory, so as to include those recorded by other processes.
+        with self.file_lock:
+            fetch_errors = self._load_snapshot()
+            self._replay_journal(fetch_errors)
+
+            path_to_snapshot_temp = self.path_to_snapshot.with_name(f"{self.path_to_snapshot.name}.tmp")
+            path_to_snapshot_temp.write_text(jsonserializer.dumps(fetch_errors))
+            os.replace(path_to_snapshot_temp, self.path_to_snapshot)
+
+            self.path_to_journal.unlink(missing_ok=True)
+
+        self.fetch_errors = fetch_errors
+        self.journal_entries_amount = 0
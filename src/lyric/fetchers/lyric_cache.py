@@ -0,0 +1,343 @@
+# Python
+import os
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from dataclasses import dataclass
+from abc import ABC, abstractmethod
+from typing import Iterable, Iterator, Optional
+
+# 3rd Party
+
+
+# 1st Party
+from ...components.file_operations import FileOperations
+
+
+@dataclass
+class CachedLyrics():
+    """ Previously fetched lyrics for a single song. Any may be None if it hasn't been cached. """
+    source: Optional[str] = None            # Serialized raw source, as returned by the lyric fetcher
+    text_sanitized: Optional[str] = None
+
+    # The artist and song name the source was fetched for. The key alone doesn't always reveal them, e.g. for songs
+    # named by their audio file's tags. None for sources cached before these were recorded.
+    artist: Optional[str] = None
+    song_name: Optional[str] = None
+
+
+class LyricCacheInterface(ABC):
+    """ Stores lyrics fetched from remote sources, so they needn't be fetched again.
+
+    Cached lyrics are identified by two keys:
+    - namespace: Identifies the lyric fetcher, i.e. its file extension, e.g. '.genius'.
+    - key: Identifies the song, i.e. the audio filename without its extension, e.g. 'Artist - Songname'.
+
+    Both keys are deliberately identical to those historically used to name sidecar files, so sidecar files can be
+    migrated to other caches.
+
+    Caches may be accessed by several threads simultaneously.
+    """
+
+    @abstractmethod
+    def get(self, namespace: str, key: str) -> CachedLyrics:
+        raise NotImplementedError()
+
+
+    @abstractmethod
+    def set_source(self, namespace: str, key: str, source: str, artist: str = None, song_name: str = None):
+        """ Caches the source, along with the artist and song name it was fetched for, if provided. """
+        raise NotImplementedError()
+
+
+    @abstractmethod
+    def set_text_sanitized(self, namespace: str, key: str, text_sanitized: str):
+        raise NotImplementedError()
+
+
+    def set_text_sanitized_many(self, namespace: str, keys_and_texts_sanitized: Iterable[tuple[str, str]]):
+        for key, text_sanitized in keys_and_texts_sanitized:
+            self.set_text_sanitized(namespace, key, text_sanitized)
+
+
+    @abstractmethod
+    def remove_text_sanitized(self, namespace: str, key: str):
+        raise NotImplementedError()
+
+
+    @abstractmethod
+    def get_all_with_source(self, namespace: str) -> Iterator[tuple[str, CachedLyrics]]:
+        """ Yields the key and cached lyrics of every song in the namespace for which a source has been cached. """
+        raise NotImplementedError()
+
+
+    def close(self):
+        pass
+
+
+class LyricCacheSidecarFiles(LyricCacheInterface):
+    """ Caches lyrics as up to three files per song per lyric fetcher, in the working directory:
+
+    - Artist - Songname.{file_extension}_source             - The raw returned result from the given source.
+    - Artist - Songname.{file_extension}_sanitized_text     - Sanitized source lyric text
+    - Artist - Songname.{file_extension}_song_names         - Json of the artist and song name the source was fetched for
+
+    The files are deliberately given unique file-extensions so users can use the OS file-explorer to easily purge cached
+    files from only a particular source, by sorting by file-extension.
+    """
+
+    suffix_source = "_source"
+    suffix_text_sanitized = "_sanitized_text"
+    suffix_song_names = "_song_names"
+
+    def __init__(self, path_to_working_dir: Path):
+        self.path_to_working_dir = path_to_working_dir
+
+
+    def _get_path(self, namespace: str, key: str, suffix: str) -> Path:
+        # Song keys may contain periods, e.g. 'Artist - Song 2.0', so the file extension is appended rather than replaced
+        return self.path_to_working_dir / f"{key}{namespace}{suffix}"
+
+
+    def get(self, namespace: str, key: str) -> CachedLyrics:
+        cached_lyrics = CachedLyrics()
+
+        path_to_source = self._get_path(namespace, key, self.suffix_source)
+        if path_to_source.exists():
+            cached_lyrics.source = path_to_source.read_text()
+
+        path_to_text_sanitized = self._get_path(namespace, key, self.suffix_text_sanitized)
+        if path_to_text_sanitized.exists():
+            cached_lyrics.text_sanitized = FileOperations.read_utf8_string(path_to_text_sanitized)
+
+        path_to_song_names = self._get_path(namespace, key, self.suffix_song_names)
+        if path_to_song_names.exists():
+            self._read_song_names(path_to_song_names, cached_lyrics)
+
+        return cached_lyrics
+
+
+    @staticmethod
+    def _read_song_names(path_to_song_names: Path, cached_lyrics: CachedLyrics):
+        try:
+            song_names = json.loads(FileOperations.read_utf8_string(path_to_song_names))
+            cached_lyrics.artist = song_names["artist"]
+            cached_lyrics.song_name = song_names["song_name"]
+        except (ValueError, KeyError) as error:
+            logging.warning(f"Ignoring malformed cached song names '{path_to_song_names}': {error}")
+
+
+    def set_source(self, namespace: str, key: str, source: str, artist: str = None, song_name: str = None):
+        self._get_path(namespace, key, self.suffix_source).write_text(source)
+
+        if artist is not None and song_name is not None:
+            FileOperations.write_utf8_string(
+                self._get_path(namespace, key, self.suffix_song_names),
+                json.dumps({"artist": artist, "song_name": song_name}, ensure_ascii=False))
+
+
+    def set_text_sanitized(self, namespace: str, key: str, text_sanitized: str):
+        FileOperations.write_utf8_string(self._get_path(namespace, key, self.suffix_text_sanitized), text_sanitized)
+
+
+    def remove_text_sanitized(self, namespace: str, key: str):
+        self._get_path(namespace, key, self.suffix_text_sanitized).unlink(missing_ok=True)
+
+
+    def get_all_with_source(self, namespace: str) -> Iterator[tuple[str, CachedLyrics]]:
+        for found_namespace, key, path_to_source, path_to_text_sanitized, path_to_song_names in self.find_all():
+            if found_namespace != namespace or not path_to_source:
+                continue
+
+            cached_lyrics = CachedLyrics(source=path_to_source.read_text())
+
+            if path_to_text_sanitized:
+                cached_lyrics.text_sanitized = FileOperations.read_utf8_string(path_to_text_sanitized)
+
+            if path_to_song_names:
+                self._read_song_names(path_to_song_names, cached_lyrics)
+
+            yield key, cached_lyrics
+
+
+    def find_all(self) -> list[tuple[str, str, Path, Path, Path]]:
+        """ Returns all sidecar files in the working directory, as (namespace, key, source, sanitized text, song names)
+        tuples.
+
+        Any path is None if the song has no corresponding cached file.
+        """
+        found = {}
+
+        with os.scandir(self.path_to_working_dir) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+
+                path = Path(entry.path)
+
+                for suffix, index in ((self.suffix_source, 0), (self.suffix_text_sanitized, 1), (self.suffix_song_names, 2)):
+                    if not path.suffix.endswith(suffix):
+                        continue
+
+                    namespace = path.suffix[:-len(suffix)]
+                    paths = found.setdefault((namespace, path.stem), [None, None, None])
+                    paths[index] = path
+
+        return [(namespace, key, *paths) for (namespace, key), paths in found.items()]
+
+
+class LyricCacheSqlite(LyricCacheInterface):
+    """ Caches lyrics in a single SQLite database.
+
+    Large libraries result in tens of thousands of sidecar files, which makes the working directory slow to list and
+    costs several file-system lookups per song. A single database avoids both.
+    """
+
+    def __init__(self, path_to_database: Path):
+        self.path_to_database = path_to_database
+
+        self.lock = threading.Lock()
+
+        self.connection = sqlite3.connect(path_to_database, check_same_thread=False)
+        self.connection.execute("""
+            CREATE TABLE IF NOT EXISTS lyrics (
+                namespace       TEXT NOT NULL,
+                key             TEXT NOT NULL,
+                source          TEXT,
+                text_sanitized  TEXT,
+                artist          TEXT,
+                song_name       TEXT,
+                PRIMARY KEY (namespace, key)
+            )
+        """)
+
+        # Databases created before the artist and song name were recorded lack their columns
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(lyrics)")}
+        for column in ("artist", "song_name"):
+            if column not in columns:
+                self.connection.execute(f"ALTER TABLE lyrics ADD COLUMN {column} TEXT")
+        self.connection.commit()
+
+
+    def __enter__(self):
+        return self
+
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def close(self):
+        with self.lock:
+            self.connection.commit()
+            self.connection.close()
+
+
+    def get(self, namespace: str, key: str) -> CachedLyrics:
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT source, text_sanitized, artist, song_name FROM lyrics WHERE namespace = ? AND key = ?",
+                (namespace, key)).fetchone()
+
+        if not row:
+            return CachedLyrics()
+
+        return CachedLyrics(*row)
+
+
+    def set_source(self, namespace: str, key: str, source: str, artist: str = None, song_name: str = None):
+        # Song names already recorded are kept if none are provided
+        with self.lock:
+            self.connection.execute(
+                "INSERT INTO lyrics (namespace, key, source, artist, song_name) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET source = excluded.source, "
+                "artist = coalesce(excluded.artist, artist), song_name = coalesce(excluded.song_name, song_name)",
+                (namespace, key, source, artist, song_name))
+            self.connection.commit()
+
+
+    def set_text_sanitized(self, namespace: str, key: str, text_sanitized: str):
+        with self.lock:
+            self.connection.execute(
+                "INSERT INTO lyrics (namespace, key, text_sanitized) VALUES (?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET text_sanitized = excluded.text_sanitized",
+                (namespace, key, text_sanitized))
+            self.connection.commit()
+
+
+    def set_text_sanitized_many(self, namespace: str, keys_and_texts_sanitized: Iterable[tuple[str, str]]):
+        # A single transaction, as committing each song separately is slow for large amounts of songs
+        with self.lock:
+            self.connection.executemany(
+                "INSERT INTO lyrics (namespace, key, text_sanitized) VALUES (?, ?, ?) "
+                "ON CONFLICT (namespace, key) DO UPDATE SET text_sanitized = excluded.text_sanitized",
+                ((namespace, key, text_sanitized) for key, text_sanitized in keys_and_texts_sanitized))
+            self.connection.commit()
+
+
+    def remove_text_sanitized(self, namespace: str, key: str):
+        with self.lock:
+            self.connection.execute(
+                "UPDATE lyrics SET text_sanitized = NULL WHERE namespace = ? AND key = ?", (namespace, key))
+            self.connection.commit()
+
+
+    def get_all_with_source(self, namespace: str, page_size: int = 256) -> Iterator[tuple[str, CachedLyrics]]:
+        # Songs are read a page at a time, so neither all songs are held in memory, nor is a cursor kept open while
+        # the songs are being updated.
+        key_previous = ""
+
+        while True:
+            with self.lock:
+                rows = self.connection.execute(
+                    "SELECT key, source, text_sanitized, artist, song_name FROM lyrics "
+                    "WHERE namespace = ? AND key > ? AND source IS NOT NULL ORDER BY key LIMIT ?",
+                    (namespace, key_previous, page_size)).fetchall()
+
+            for key, *cached in rows:
+                yield key, CachedLyrics(*cached)
+
+            if len(rows) < page_size:
+                return
+
+            key_previous = rows[-1][0]
+
+
+    def import_sidecar_files(self, sidecar_files: LyricCacheSidecarFiles) -> int:
+        """ Imports all sidecar files, overwriting previously cached lyrics. Returns the number of songs imported.
+
+        The sidecar files themselves are left untouched.
+        """
+        amount_imported = 0
+
+        for namespace, key, path_to_source, path_to_text_sanitized, path_to_song_names in sidecar_files.find_all():
+            cached_lyrics = CachedLyrics()
+
+            try:
+                if path_to_source:
+                    cached_lyrics.source = path_to_source.read_text()
+
+                if path_to_text_sanitized:
+                    cached_lyrics.text_sanitized = FileOperations.read_utf8_string(path_to_text_sanitized)
+
+                if path_to_song_names:
+                    sidecar_files._read_song_names(path_to_song_names, cached_lyrics)
+            except (OSError, UnicodeDecodeError) as error:
+                logging.warning(f"Unable to import cached lyrics '{key}{namespace}': {error}")
+                continue
+
+            with self.lock:
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO lyrics (namespace, key, source, text_sanitized, artist, song_name) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (namespace, key, cached_lyrics.source, cached_lyrics.text_sanitized, cached_lyrics.artist,
+                     cached_lyrics.song_name))
+
+            amount_imported += 1
+
+        with self.lock:
+            self.connection.commit()
+
+        return amount_imported
@@ -0,0 +1,129 @@
+# Python
+import os
+import logging
+from dataclasses import dataclass
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Optional
+
+# 3rd Party
+
+
+# 1st Party
+from .lyric_cache import LyricCacheInterface
+from .lyric_cache import CachedLyrics
+from .lyric_fetcher_base import LyricFetcherBase
+
+
+@dataclass
+class ResanitizationResult:
+    """ The number of cached songs of a single lyric fetcher, by what happened to their sanitized lyrics. """
+    amount_unchanged: int   = 0
+    amount_updated: int     = 0     # Includes songs whose source is now considered valid, but previously wasn't
+    amount_removed: int     = 0     # Songs whose source is no longer considered valid
+    amount_skipped: int     = 0     # Songs whose artist and song name are unknown, which are left as they are
+    amount_failed: int      = 0
+
+    def get_amount_total(self) -> int:
+        return self.amount_unchanged + self.amount_updated + self.amount_removed + self.amount_skipped + self.amount_failed
+
+
+# Each worker process receives its own copy of the lyric fetcher, see LyricFetcherBase.__getstate__()
+_lyric_fetcher: Optional[LyricFetcherBase] = None
+
+
+def _init_worker(lyric_fetcher: LyricFetcherBase):
+    global _lyric_fetcher
+    _lyric_fetcher = lyric_fetcher
+
+
+def _resanitize_batch(batch: list[tuple[str, CachedLyrics]]) -> tuple[list[tuple[str, Optional[str]]], int, int]:
+    """ Re-sanitizes a batch of (key, cached lyrics) cached songs in a worker process.
+
+    Returns:
+        The (key, sanitized text) of only those songs whose sanitized text changed, the number of songs skipped, as
+        their artist and song name are unknown, and the number of songs that failed to re-sanitize. The sanitized text
+        is None if the source is no longer considered valid.
+    """
+    changed = []
+    amount_skipped = 0
+    amount_failed = 0
+
+    for key, cached_lyrics in batch:
+        try:
+            validity, text_sanitized_new = _lyric_fetcher.resanitize_cached_source(
+                key, cached_lyrics.source, cached_lyrics.artist, cached_lyrics.song_name)
+        except Exception:
+            logging.exception(f"Unable to re-sanitize cached lyrics for: {key}")
+            amount_failed += 1
+            continue
+
+        # Without knowing which song the source was fetched for, it can't be told whether it's still valid, so its
+        # sanitized lyrics are kept rather than removed.
+        if validity is None:
+            logging.warning(f"Skipped re-sanitizing cached lyrics of unknown artist and song name: {key}")
+            amount_skipped += 1
+            continue
+
+        if text_sanitized_new != cached_lyrics.text_sanitized:
+            changed.append((key, text_sanitized_new))
+
+    return changed, amount_skipped, amount_failed
+
+
+def resanitize_lyric_cache(lyric_fetcher: LyricFetcherBase,
+                           lyric_cache: LyricCacheInterface,
+                           max_workers: Optional[int] = None,
+                           batch_size: int = 64) -> ResanitizationResult:
+    """ Re-validates and re-sanitizes every cached source of the lyric fetcher, across several processes.
+
+    Only sanitized lyrics which changed are written to the cache. The fetchers source isn't accessed.
+
+    Args:
+        max_workers: Number of worker processes. Defaults to the number of CPU cores.
+        batch_size: Number of songs passed to a worker process at a time.
+    """
+    namespace = lyric_fetcher.file_extension
+    result = ResanitizationResult()
+
+    def apply(future: Future, amount_songs: int):
+        changed, amount_skipped, amount_failed = future.result()
+
+        lyric_cache.set_text_sanitized_many(namespace, [(key, text) for key, text in changed if text is not None])
+
+        for key, text_sanitized in changed:
+            if text_sanitized is None:
+                lyric_cache.remove_text_sanitized(namespace, key)
+                result.amount_removed += 1
+            else:
+                result.amount_updated += 1
+
+        result.amount_skipped += amount_skipped
+        result.amount_failed += amount_failed
+        result.amount_unchanged += amount_songs - len(changed) - amount_skipped - amount_failed
+
+    max_workers = max_workers or os.cpu_count() or 1
+
+    # The cache is read batch by batch, with only a few batches per worker in flight, so a large cache is never held
+    # in memory all at once.
+    max_batches_in_flight = max_workers * 2
+
+    cached_songs = lyric_cache.get_all_with_source(namespace)
+
+    with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(lyric_fetcher,)) as executor:
+        batches_in_flight: dict[Future, int] = {}
+
+        while batch := list(islice(cached_songs, batch_size)):
+            batches_in_flight[executor.submit(_resanitize_batch, batch)] = len(batch)
+
+            if len(batches_in_flight) < max_batches_in_flight:
+                continue
+
+            done, _ = wait(batches_in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                apply(future, batches_in_flight.pop(future))
+
+        for future in wait(batches_in_flight).done:
+            apply(future, batches_in_flight.pop(future))
+
+    return result
@@ -1,29 +1,31 @@
 # Python
 from __future__ import annotations # Why is this needed in Python 3.11?
-import json
-import jsons as jsonserializer
 import logging
 from pathlib import Path
-from dataclasses import dataclass
+from datetime import datetime
 from abc import ABC, abstractmethod
-from collections import defaultdict
-from typing import TYPE_CHECKING, Any, DefaultDict
+from typing import Any, Optional
 
 
 
 # 3rd Party
-import jsonpickle
 
 # 1st Party
 from ...components.file_operations import FileOperations
+from ...components.rate_limiter import RateLimit
+from ...components.rate_limiter import RateLimiter
+from ...components.metrics import Metrics
+from .lyric_cache import LyricCacheInterface
+from .lyric_cache import LyricCacheSidecarFiles
+from .fetch_history import FetchHistory
+from .fetch_history import FetchErrorType
+from ..lyric_sanitizer import SanitizationRules
 from ..dataclasses_and_types import LyricFetcherType
 from ..dataclasses_and_types import LyricValidity
 from ..dataclasses_and_types import LyricPayload
+from ..dataclasses_and_types import LyricAlignTask
 import src.lyric as lll
 
-if TYPE_CHECKING:
-    from ..dataclasses_and_types import LyricAlignTask
-
 
 """ Lyric Annotations:
 
@@ -41,18 +43,6 @@ use various types of annotation to inform how we handle things in code.
 
 """
 
-# FetchErrors is a @dataclass so we can construct defaultdict(FetchErrors) which can be serialized using jsons.
-# defaultdict(defaultdict(Enum)) cannot be serialized in using jsons.
-@dataclass
-class FetchErrors():
-    time_out : int = 0
-    not_found : int = 0
-    unknown : int = 0
-
-    def get_total_error_amount(self):
-        return self.time_out + self.not_found + self.unknown
-
-    
 class LyricFetcherBase(ABC):
     """ Base-class for LyricFetchers implementing shared functionality.
 
@@ -62,42 +52,98 @@ class LyricFetcherBase(ABC):
     - Record lyric fetch history, to prevent spending time attempting to fetch lyrics for a song that's already proven
       not to exist at a particular source.
 
-    Two cached files will typically be created:
+    Fetched lyrics are cached via a LyricCacheInterface, which by default stores two files per song:
     - Artist - Songname.{file_extension}_source             - The raw returned result from the given source.
     - Artist - Songname.{file_extension}_sanitized_text     - Sanitized source lyric text
+
+    Fetchers accessing remote sources should declare the source's rate_limit, and call _acquire_rate_limit() prior to
+    each request.
+
+    Cache hits and misses, and the time spent fetching from the source and sanitizing, are recorded in the given
+    Metrics, named after the fetchers type, e.g. 'lyric_fetcher.Pypi_LyricsGenius.cache_miss'.
     """
 
-    def __init__(self, type: LyricFetcherType, file_extension: str, path_to_working_dir: Path=None):
+    # Limits on accessing the fetchers source, if any. Daily quota usage is persisted in the working directory.
+    rate_limit: Optional[RateLimit] = None
+
+    # The rules by which lyrics from the fetchers source are sanitized
+    sanitization_rules: SanitizationRules = SanitizationRules()
+
+    def __init__(self,
+                 type: LyricFetcherType,
+                 file_extension: str,
+                 path_to_working_dir: Path=None,
+                 lyric_cache: LyricCacheInterface=None,
+                 metrics: Metrics=None):
         self.type = type
 
         self.file_extension = file_extension
 
-        # The locally cached files are deliberately given unique file-extensions so users can use the OS file-explorer
-        # to easily purge cached files from only a particular source, by sorting by file-extension
-        self.file_extension_source = f"{file_extension}_source"
-        self.file_extension_txt_sanitized = f"{file_extension}_sanitized_text"
-
         self.path_to_working_dir = path_to_working_dir
 
-        self.lyric_sanitizer = lll.LyricSanitizer()
+        # The file extension doubles as the fetchers namespace in the lyric cache
+        self.lyric_cache = lyric_cache if lyric_cache else LyricCacheSidecarFiles(path_to_working_dir)
+
+        self.metrics = metrics if metrics else Metrics()
+        self.metrics_prefix = f"lyric_fetcher.{type.name}"
+
+        self.lyric_sanitizer = lll.LyricSanitizer(self.sanitization_rules)
+
+        self.fetch_history = FetchHistory(path_to_working_dir / f"fetch_history{file_extension}")
+
+        self.rate_limiter = None
+        if self.rate_limit:
+            self.rate_limiter = RateLimiter(self.rate_limit, path_to_working_dir / f"quota_usage{file_extension}.json")
+
+
+    def close(self):
+        """ Persists any state which is held in memory. Must be called once the fetcher is no longer used. """
+        self.fetch_history.close()
+
 
-        self.path_to_fetch_history = path_to_working_dir / f"fetch_history{file_extension}"
-        self.fetch_history = self._init_fetch_history()
+    def __getstate__(self):
+        """ Only the state required to validate and sanitize cached sources is pickled.
 
+        This allows cached sources to be re-sanitized in other processes, without those processes accessing the
+        fetchers source, fetch history or rate limits. An unpickled fetcher can't fetch lyrics.
+        """
+        return {
+            "type": self.type,
+            "file_extension": self.file_extension,
+            "lyric_sanitizer": self.lyric_sanitizer,
+        }
+
+
+    def log_fetch_history_summary(self):
+        """ Logs how many songs previously failed to fetch, and how many of those are now due for a retry. """
+        amount_due, amount_not_due = self.fetch_history.get_amount_due_for_retry()
+
+        if amount_due or amount_not_due:
+            logging.info(f"{self.type.name}: {amount_due} song(s) with previous fetch errors are due for retry, "
+                         f"{amount_not_due} are not yet.")
 
-    def _init_fetch_history(self):
-        fetch_history = defaultdict(FetchErrors)
 
-        if self.path_to_fetch_history.exists():
-            file_content = self.path_to_fetch_history.read_text()
-            fetch_history = jsonserializer.loads(file_content, DefaultDict[str, FetchErrors])
+    def _acquire_rate_limit(self) -> bool:
+        """ Waits until the source may be accessed. Returns False if the sources daily quota has been used up. """
+        if not self.rate_limiter:
+            return True
 
-        return fetch_history
+        return self.rate_limiter.acquire()
 
 
-    def _save_fetch_history(self):
-        fetch_history_serialized = jsonserializer.dumps(self.fetch_history)
-        self.path_to_fetch_history.write_text(fetch_history_serialized)
+    def _has_recent_fetch_errors(self, filename: str) -> bool:
+        """ Returns True if a previous attempt at fetching lyrics for the given filename failed too recently to retry. """
+        if self.fetch_history.is_due_for_retry(filename):
+            return False
+
+        retry_after = datetime.fromtimestamp(self.fetch_history.get_retry_after(filename))
+        logging.info(f"Skipping {filename} due to previous fetch errors. Retrying after {retry_after:%Y-%m-%d %H:%M}.")
+        return True
+
+
+    def _record_fetch_error(self, filename: str, error_type: FetchErrorType):
+        """ Records a failed attempt at fetching lyrics for the given filename. """
+        self.fetch_history.record_error(filename, error_type)
 
 
     @abstractmethod
@@ -129,13 +175,15 @@ class LyricFetcherBase(ABC):
         return LyricValidity.NotSet
     
 
-    def _load_json_from_disk(self, path_to_json_file: Path) -> Any:
-        return jsonpickle.decode(path_to_json_file.read_text())
+    # jsonpickle is only imported once a source is actually (de)serialized, as local files have no source to cache
+    def _decode_source(self, source_serialized: str) -> Any:
+        import jsonpickle
+        return jsonpickle.decode(source_serialized)
 
 
-    def _save_json_to_disk(self, path_to_json_file: Path, data: Any):
-        json_text = jsonpickle.encode(data)
-        path_to_json_file.write_text(json_text)        
+    def _encode_source(self, source: Any) -> str:
+        import jsonpickle
+        return jsonpickle.encode(source)
 
 
     @abstractmethod
@@ -159,45 +207,49 @@ class LyricFetcherBase(ABC):
         This function relies on self._fetch_lyrics_payload() to provide the LyricFetcher-unique 
         
         The logic generally works as follows:
-            - If a local sanitized cached copy (.{file_extension}_sanitized_text) exists, assume it's valid and return.
-            - If a local raw cached copy (.{file_extension}_source) exists, attempt to sanitize and validate and return.
+            - If cached sanitized lyrics exist, assume they're valid and return.
+            - If a cached raw source exists, attempt to sanitize and validate and return.
             - Fetch remote copy, cache locally, validate, sanitze, and return.
         """
         lyrics = LyricPayload()
 
         logging.debug(f"Fetching lyrics for: {lyric_align_task.path_to_audio_file.name}")
 
-        path_to_cached_source = self.path_to_working_dir / lyric_align_task.path_to_audio_file.name
-        path_to_cached_source = path_to_cached_source.with_suffix(self.file_extension_source)
-        path_to_cached_lyrics_sanitized = self.path_to_working_dir / lyric_align_task.path_to_audio_file.name
-        path_to_cached_lyrics_sanitized = path_to_cached_lyrics_sanitized.with_suffix(self.file_extension_txt_sanitized)
+        cache_key = lyric_align_task.path_to_audio_file.stem
+        cached_lyrics = self.lyric_cache.get(self.file_extension, cache_key)
 
         # 1. First try to locate locally cached sanitized lyrics
-        if path_to_cached_lyrics_sanitized.exists():
+        if cached_lyrics.text_sanitized is not None:
             logging.debug(f"Local cached Sanitized text detected!")
-            lyrics.text_sanitized = self._read_file_utf8(path_to_cached_lyrics_sanitized)
+            self.metrics.increment(f"{self.metrics_prefix}.cache_hit")
+            lyrics.text_sanitized = cached_lyrics.text_sanitized
 
             # Sanitized lyrics are assumed to always be valid.
             lyrics.validity = LyricValidity.Valid
 
             # For debugging purposes, we still try to read and return the raw lyrics too
-            if path_to_cached_source.exists():
-                lyrics.source = self._load_json_from_disk(path_to_cached_source)
+            if cached_lyrics.source is not None:
+                lyrics.source = self._decode_source(cached_lyrics.source)
                 lyrics.text_raw = self._get_lyric_text_raw_from_source(lyrics.source)
 
             return lyrics
         
         # 2. If locally cached sanitized lyrics aren't available, try to locate locally cached raw source lyrics
-        if path_to_cached_source.exists():
+        if cached_lyrics.source is not None:
             logging.debug(f"Locally cached raw source detected!")
-            lyrics.source = self._load_json_from_disk(path_to_cached_source)
+            self.metrics.increment(f"{self.metrics_prefix}.cache_hit_source")
+            lyrics.source = self._decode_source(cached_lyrics.source)
             
             # Locally loaded lyrics require re-validating
             lyrics.validity = self._validate_lyrics(lyric_align_task, lyrics.source)
         else:
             # 3. If neither a locally cached sanitized or locally cached raw source is available, do we fetch a fresh
             # copy.
-            lyrics = self._fetch_lyrics_payload(lyric_align_task)
+            self.metrics.increment(f"{self.metrics_prefix}.cache_miss")
+
+            # Includes waiting for the sources rate limit, if any
+            with self.metrics.time(f"{self.metrics_prefix}.fetch_from_source"):
+                lyrics = self._fetch_lyrics_payload(lyric_align_task)
 
             # Only if the source is completely empty do we skip caching it, otherwise we'd like to retain a local cached
             # copy in order to improve validation code, etc.
@@ -205,7 +257,8 @@ class LyricFetcherBase(ABC):
                 return lyrics
 
             # Regardless of validity, we save the source, unless not-set
-            self._save_json_to_disk(path_to_cached_source, lyrics.source)
+            self.lyric_cache.set_source(self.file_extension, cache_key, self._encode_source(lyrics.source),
+                                        lyric_align_task.artist, lyric_align_task.song_name)
 
         if lyrics.validity is not LyricValidity.Valid:
             return lyrics
@@ -213,13 +266,41 @@ class LyricFetcherBase(ABC):
         # The transition from Lyrics object into AudioLyricAlignTest is a little... Iffy...
         lyrics.text_raw = self._get_lyric_text_raw_from_source(lyrics.source)
 
-        lyrics.text_sanitized = self._sanitize_lyrics_raw(lyric_align_task, lyrics.source)
+        with self.metrics.time(f"{self.metrics_prefix}.sanitize"):
+            lyrics.text_sanitized = self._sanitize_lyrics_raw(lyric_align_task, lyrics.source)
 
-        self._write_file_utf8(path_to_cached_lyrics_sanitized, lyrics.text_sanitized)
+        self.lyric_cache.set_text_sanitized(self.file_extension, cache_key, lyrics.text_sanitized)
 
         return lyrics
 
 
+    def resanitize_cached_source(self,
+                                 cache_key: str,
+                                 source_serialized: str,
+                                 artist: str = None,
+                                 song_name: str = None) -> tuple[Optional[LyricValidity], Optional[str]]:
+        """ Re-validates and re-sanitizes a cached source, without accessing the fetchers source.
+
+        Args:
+            artist, song_name: The artist and song name the source was fetched for, as recorded in the lyric cache. If
+                not recorded, they're derived from the cache key.
+        Returns:
+            The validity of the source, and its sanitized text if valid, otherwise None. The validity is None too, if
+            the artist and song name are unknown, as the source can't be validated without them.
+        """
+        lyric_align_task = LyricAlignTask.create_from_cache_key(cache_key, artist, song_name)
+        if not lyric_align_task.artist or not lyric_align_task.song_name:
+            return None, None
+
+        source = self._decode_source(source_serialized)
+
+        validity = self._validate_lyrics(lyric_align_task, source)
+        if validity is not LyricValidity.Valid:
+            return validity, None
+
+        return validity, self._sanitize_lyrics_raw(lyric_align_task, source)
+
+
     @abstractmethod
     def _fetch_lyrics_payload(self, lyric_align_task:LyricAlignTask) -> LyricPayload:
         """ Returns lyrics and (estimated) validity for a given LyricAlignTask. """
@@ -6,6 +6,8 @@ from pathlib import Path
 
 # 1st Party
 from .lyric_fetcher_base import LyricFetcherBase
+from .lyric_cache import LyricCacheInterface
+from ...components.metrics import Metrics
 from ..dataclasses_and_types import LyricPayload
 
 from ..dataclasses_and_types import LyricFetcherType
@@ -18,12 +20,12 @@ class LyricFetcherDisabled(LyricFetcherBase):
     
     """
 
-    def __init__(self, path_to_working_dir:Path = None):
+    def __init__(self, path_to_working_dir:Path = None, lyric_cache: LyricCacheInterface = None, metrics: Metrics = None):
         """ Creates the Dummy class for skipping lyric fetching.
         
         It mimics the LyricFetcherInterface design so the calling code can be kept simple.
         """
-        super().__init__(LyricFetcherType.Disabled, ".na", path_to_working_dir)
+        super().__init__(LyricFetcherType.Disabled, ".na", path_to_working_dir, lyric_cache, metrics)
 
     def _sanitize_lyrics_raw(self, lyrics_raw: List[str]) -> List[str]:
         return []
@@ -9,6 +9,9 @@ from typing import Tuple, List, TYPE_CHECKING
 
 # 1st Party
 from .lyric_fetcher_base import LyricFetcherBase
+from .lyric_cache import LyricCacheInterface
+from ...components.metrics import Metrics
+from ..lyric_sanitizer import SanitizationRules
 from ..dataclasses_and_types import LyricPayload
 
 from ..dataclasses_and_types import LyricFetcherType
@@ -23,8 +26,12 @@ if TYPE_CHECKING:
 class LyricFetcherLocalFile(LyricFetcherBase):
     """ Fetches local .txt files containing lyrics for a given song. """
 
-    def __init__(self, path_to_working_dir:Path = None):
-        super().__init__(LyricFetcherType.LocalFile, ".txt", path_to_working_dir)
+    # We remove []'s and their contents inside, as well as any stray brackets. Other characters are left as-is, as
+    # local files are provided by the user.
+    sanitization_rules = SanitizationRules(characters_to_replace=(("[", ""), ("]", "")))
+
+    def __init__(self, path_to_working_dir:Path = None, lyric_cache: LyricCacheInterface = None, metrics: Metrics = None):
+        super().__init__(LyricFetcherType.LocalFile, ".txt", path_to_working_dir, lyric_cache, metrics)
 
     
     def _validate_lyrics(self, lyric_align_task: LyricAlignTask, lyrics: str):
@@ -59,15 +66,17 @@ class LyricFetcherLocalFile(LyricFetcherBase):
             path_to_lyric_txt_file = path_to_local_copy_in_working_dir
 
         if not path_to_lyric_txt_file:
+            self.metrics.increment(f"{self.metrics_prefix}.not_found")
             return lyrics
-        
+
+        self.metrics.increment(f"{self.metrics_prefix}.found")
+
         file_content = self._fetch_lyrics_payload(path_to_lyric_txt_file)
         lyrics.text_raw = file_content
 
         # Local text fetcher does *not* save sanitized text.
-        text_lines = lyrics.text_raw.splitlines()
-        text_lines_sanitized = self._sanitize_lyrics_raw(text_lines)
-        lyrics.text_sanitized = '\n'.join(text_lines_sanitized)
+        with self.metrics.time(f"{self.metrics_prefix}.sanitize"):
+            lyrics.text_sanitized = self._sanitize_lyrics_raw(lyrics.text_raw)
 
         # This should be detected elsewhere I think...
         lyrics.contains_multipliers = False # To be fixed!
@@ -125,25 +134,9 @@ class LyricFetcherLocalFile(LyricFetcherBase):
 
 
     """ See LyricFetcherInterface.sanitize_raw_lyrics() for description. """
-    def _sanitize_lyrics_raw(self, lyrics_raw: List[str]) -> List[str]:
-        lyrics = lyrics_raw
-
-        # We remove []'s and their contents inside
-        lyrics_list = self.lyric_sanitizer.remove_non_lyrics(lyrics)
-
-        lyrics = "\n".join(lyrics_list)
-
-        lyrics = lyrics.replace('[', '').replace(']', '')
-
-        # This is intentionally disabled, as in some lyrics (such as those by 50 cent) he sings "two-step" and "G-Unit".
+    def _sanitize_lyrics_raw(self, lyrics_raw: str) -> str:
+        # Hyphens are intentionally kept, as in some lyrics (such as those by 50 cent) he sings "two-step" and "G-Unit".
         # Lyrically, these are connected words, but it's not correct to smoosh them together. They should be aligned as
-        # individual words. Thus, we disable this.
-        # TODO: Figure out if this should instead insert a space?
-        #lyrics = lyrics.replace('-', '')
-
-        all_lyric_lines = lyrics.splitlines()
-
-        # Removes empty lines
-        non_empty_lyric_lines = [lyric_line for lyric_line in all_lyric_lines if lyric_line]
-
-        return non_empty_lyric_lines
\ No newline at end of file
+        # individual words.
+        # TODO: Figure out if hyphens should instead be replaced by a space?
+        return self.lyric_sanitizer.sanitize(lyrics_raw)
\ No newline at end of file
@@ -9,6 +9,10 @@ from lyrics_extractor import SongLyrics, LyricScraperException
 
 # 1st Party
 from .lyric_fetcher_base import LyricFetcherBase
+from .fetch_history import FetchErrorType
+from .lyric_cache import LyricCacheInterface
+from ...components import RateLimit
+from ...components import Metrics
 from ..dataclasses_and_types import LyricPayload
 from ..dataclasses_and_types import LyricFetcherType
 from ..dataclasses_and_types import LyricValidity
@@ -20,17 +24,26 @@ if TYPE_CHECKING:
 class LyricFetcherPyPiLyricsExtractor(LyricFetcherBase):
     """ Retrieves Lyrics from PyPi's lyrics_extractor package which relies on Google Custom Search (GCS).
 
-    The free version of GCS is rate-limited and LyricFetcherPyPiLyricsExtractor maintains a flag to determine whether
-    this quota has been met. If LyricManager is restarted this flag is reset.
+    The free version of GCS is limited to a daily quota of 100 queries. LyricFetcherPyPiLyricsExtractor counts its
+    queries against this quota across restarts, and stops querying once the quota has been met.
 
     PyPi Link: https://pypi.org/project/lyrics-extractor/
     """
 
+    # GCS allows a maximum of 100 queries per minute per user, in addition to the daily quota.
+    rate_limit = RateLimit(requests_per_second=1.0, burst=10, daily_quota=100)
+
     def __init__(self,
                  path_to_working_dir: Path,
                  google_custom_search_api_key: str,
-                 google_custom_search_engine_id: str):
-        super().__init__(LyricFetcherType.Pypi_LyricsExtractor, ".le", path_to_working_dir)
+                 google_custom_search_engine_id: str,
+                 lyric_cache: LyricCacheInterface = None,
+                 google_custom_search_daily_quota: int = 100,
+                 metrics: Metrics = None):
+        # Paid GCS plans have a larger daily quota
+        self.rate_limit = RateLimit(self.rate_limit.requests_per_second, self.rate_limit.burst, google_custom_search_daily_quota)
+
+        super().__init__(LyricFetcherType.Pypi_LyricsExtractor, ".le", path_to_working_dir, lyric_cache, metrics)
 
         self.lyric_extractor = SongLyrics(google_custom_search_api_key, google_custom_search_engine_id)
 
@@ -75,9 +88,13 @@ class LyricFetcherPyPiLyricsExtractor(LyricFetcherBase):
             return lyrics
         
         # For this lyrics fetcher, we have a very low error tolerance so as to not exhaust any quotas.
-        if self.fetch_history[lyric_align_task.filename].get_total_error_amount() >= 1:
+        if self._has_recent_fetch_errors(lyric_align_task.filename):
             lyrics.validity = LyricValidity.Skipped_Due_To_Fetch_Errors
-            logging.info(f"Skipping {lyric_align_task.filename} due to previous fetch errors.")
+            return lyrics
+
+        if not self._acquire_rate_limit():
+            self.quota_exceeded = True
+            logging.warning("PyPi - LyricsExtractor - Daily quota used up - Not fetching lyrics.")
             return lyrics
 
         try:
@@ -98,7 +115,7 @@ class LyricFetcherPyPiLyricsExtractor(LyricFetcherBase):
             exception_contents_at_error = e.args[0]['error']
 
             if exception_contents_at_error == "No results found":
-                self.fetch_history[lyric_align_task.filename].not_found += 1
+                self._record_fetch_error(lyric_align_task.filename, FetchErrorType.NotFound)
             else:
                 if isinstance(exception_contents_at_error, dict):
                     if exception_contents_at_error['code'] == 400:
@@ -107,18 +124,17 @@ class LyricFetcherPyPiLyricsExtractor(LyricFetcherBase):
                         return lyrics
                     elif exception_contents_at_error['code'] == 429:
                         self.quota_exceeded = True
+                        self.rate_limiter.mark_quota_exhausted()
                         logging.warning("PyPi - LyricsExtractor - Quota exceeded error")
                         # We intentionally return the Lyrics object with validity defaulting to NotSet, as we're
                         # prevented from accessing the source due quota being exceeded.
                         return lyrics
                     else:
 
-                        self.fetch_history[lyric_align_task.filename].unknown += 1
+                        self._record_fetch_error(lyric_align_task.filename, FetchErrorType.Unknown)
                         #logging.info("Unknown error encountered when fetching lyrics.")
                         logging.exception("Unknown error encountered when fetching lyrics.")
 
-            self._save_fetch_history()
-
             # # Also raises quota exception which should then turn this one off?
             # # also institute checking for no lyrics found.
             # error_code = e.args[0]['error']['code']
@@ -154,25 +170,13 @@ class LyricFetcherPyPiLyricsExtractor(LyricFetcherBase):
 
 
     def _sanitize_lyrics_raw(self, lyric_align_task:LyricAlignTask, raw_source:dict) -> str:
-        """ Returns a sanitized list of lyric strings based on the raw lyrics likely fetched in the function above.
+        """ Returns sanitized lyrics based on the raw lyrics likely fetched in the function above.
         
         The function accepts a AudioLyricAlignTask object (as opposed to a string) as some sanitization requires
         knowledge of a songs name, e.g., removing the very first line containing the song title.
-
-        It's convenient from a code perspective to convert lyrics into a list of individual lyric lines here.
         """
 
         lyrics = self._get_lyric_text_raw_from_source(raw_source)
 
-        lyrics = lyrics.splitlines()
-
         # Clears non-lyric content like [verse 1] and empty lines
-        lyrics = self.lyric_sanitizer.remove_non_lyrics(lyrics)
-        # TODO: ALSO SPLITS string, this isn't clear and should be 'separated out' or unified somehow with the
-        # local file handler/sanitizer.
-
-        lyrics = self.lyric_sanitizer.replace_difficult_characters(lyrics)
-
-        lyrics = '/n'.join(lyrics)
-
-        return lyrics
\ No newline at end of file
+        return self.lyric_sanitizer.sanitize(lyrics)
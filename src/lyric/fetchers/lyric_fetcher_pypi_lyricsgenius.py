@@ -1,13 +1,8 @@
 # Python
 from __future__ import annotations
-import os
 import logging
-import contextlib
-import time
-import random
 import re
 from pathlib import Path
-from datetime import datetime
 from typing import TYPE_CHECKING
 from difflib import SequenceMatcher
 
@@ -19,10 +14,15 @@ from requests.exceptions import Timeout
 
 # 1st Party
 from .lyric_fetcher_base import LyricFetcherBase
+from .fetch_history import FetchErrorType
+from .lyric_cache import LyricCacheInterface
+from ..lyric_sanitizer import SanitizationRules
 from ..dataclasses_and_types import LyricPayload
 from ..dataclasses_and_types import LyricFetcherType
 from ..dataclasses_and_types import LyricValidity
 from ...components import text_simplifier
+from ...components import RateLimit
+from ...components import Metrics
 
 if TYPE_CHECKING:
     from ..dataclasses_and_types import LyricAlignTask
@@ -34,23 +34,20 @@ class LyricFetcherPyPiLyricsGenius(LyricFetcherBase):
     PyPi Link: https://pypi.org/project/lyricsgenius/
     """
 
-    def __init__(self, token, path_to_working_dir:Path = None):
-        super().__init__(LyricFetcherType.Pypi_LyricsGenius, ".genius", path_to_working_dir)
+    # Genius doesn't publish its rate limits. This is a conservative limit, so as to not overload Genius' servers.
+    rate_limit = RateLimit(requests_per_second=1.0, burst=4)
+
+    sanitization_rules = SanitizationRules(remove_trailing_embed=True)
+
+    def __init__(self, token, path_to_working_dir:Path = None, lyric_cache: LyricCacheInterface = None, metrics: Metrics = None):
+        super().__init__(LyricFetcherType.Pypi_LyricsGenius, ".genius", path_to_working_dir, lyric_cache, metrics)
         self.token = token
 
         # lyricgenius throws a TypeError if the provided token is bad. This exception is expected to be caught
         # externally.
-        self.genius = lyricsgenius.Genius(self.token)
-
-        self.sequence_matcher = SequenceMatcher()
-
-        # In an effort to not overload Genius' servers, we insert some self-rate limiting
-        self.rate_limit = True
-        self.rate_limit = False
-        self.timestamp_recent_fetch = datetime.now()
-
-        self.random_wait_lower = 3.0 # seconds
-        self.random_wait_upper = 10.0 # seconds
+        # Silence geniuslibrary - breaks output. Redirecting sys.stdout instead isn't thread-safe, as lyrics are fetched
+        # by several threads simultaneously.
+        self.genius = lyricsgenius.Genius(self.token, verbose=False)
 
 
     def _get_lyric_text_raw_from_source(self, source: Song) -> str:
@@ -79,11 +76,9 @@ class LyricFetcherPyPiLyricsGenius(LyricFetcherBase):
         task_song_name = lyric_align_task.song_name.lower()
         source_song_name = raw_source.title.lower()
 
-        self.sequence_matcher.set_seqs(task_artist, source_artist)
-        ratio_artist = self.sequence_matcher.ratio()
-
-        self.sequence_matcher.set_seqs(task_song_name, source_song_name)
-        ratio_song_name = self.sequence_matcher.ratio()
+        # A SequenceMatcher is created per comparison, as lyrics may be validated by several threads simultaneously.
+        ratio_artist = SequenceMatcher(None, task_artist, source_artist).ratio()
+        ratio_song_name = SequenceMatcher(None, task_song_name, source_song_name).ratio()
 
         # Debug output
         logging.debug(f"Artist: Task '{task_artist}' vs. source '{source_artist}' - Ratio {ratio_artist}")
@@ -165,38 +160,26 @@ class LyricFetcherPyPiLyricsGenius(LyricFetcherBase):
         lyrics = LyricPayload()
 
 
-        if self.fetch_history[lyric_align_task.filename].get_total_error_amount() >= 1:
+        if self._has_recent_fetch_errors(lyric_align_task.filename):
             lyrics.validity = LyricValidity.Skipped_Due_To_Fetch_Errors
-            logging.info(f"Skipping {lyric_align_task.filename} due to previous fetch errors.")
             return lyrics
 
 
-        if self.rate_limit:
-            time_since_last_fetch = datetime.now() - self.timestamp_recent_fetch
-            if time_since_last_fetch.total_seconds() < self.random_wait_lower:
-                random_wait = random.uniform(self.random_wait_lower, self.random_wait_upper)
-                logging.info(f"Forcing rate-limit wait of {random_wait} second(s).")
-                time.sleep(random_wait)
-
-            self.timestamp_recent_fetch = datetime.now()
+        self._acquire_rate_limit()
 
         try:
-            # Silence geniuslibrary - breaks output.
-            with open(os.devnull, "w") as f, contextlib.redirect_stdout(f):
-                genius_song = self.genius.search_song(lyric_align_task.song_name, lyric_align_task.artist)
+            genius_song = self.genius.search_song(lyric_align_task.song_name, lyric_align_task.artist)
 
             # genius_artist = self.genius.search_artist(lyric_align_task.artist, max_songs=1)
             # genius_song = genius_artist.song(lyric_align_task.song_name)
         except Timeout:
             logging.warning("Timeout error.")
-            self.fetch_history[lyric_align_task.filename].time_out += 1
-            self._save_fetch_history()
+            self._record_fetch_error(lyric_align_task.filename, FetchErrorType.TimeOut)
             return lyrics
 
         if not genius_song:
             logging.warning(f"Song '{lyric_align_task.song_name}' was not found.")
-            self.fetch_history[lyric_align_task.filename].not_found += 1
-            self._save_fetch_history()
+            self._record_fetch_error(lyric_align_task.filename, FetchErrorType.NotFound)
             return lyrics
 
 
@@ -215,7 +198,6 @@ class LyricFetcherPyPiLyricsGenius(LyricFetcherBase):
         garbage data may change over time.
 
         Time of confirmed proper sanitization: 04-03-2023
-        
         """
         lyrics = self._get_lyric_text_raw_from_source(raw_source)
 
@@ -226,30 +208,6 @@ class LyricFetcherPyPiLyricsGenius(LyricFetcherBase):
 
         #lyrics = self.lyric_sanitizer.remove_leading_title(lyric_align_task.song_name, lyrics)
 
-        # Remove lead-out garbage data
-        # Examples:
-        # <lyrics>2Embed
-        # <lyrics>40Embed
-        # <lyrics>19Embed
-        # <lyrics>5Embed
-        # <lyrics>You might also likeEmbed
-        # <lyrics>You might also like82Embed'
-
-        # First we remove the '<numeric value>Embed' portion
-        lyrics = self.lyric_sanitizer.remove_embed_at_end(lyrics)
-
-        # Hard-code detect this new piece of garbage data. Hopefully, no lyrics will ever end with this line :/
-        occasional_garbage_ending = "You might also like"
-        if lyrics.endswith(occasional_garbage_ending):
-            lyrics = lyrics[:-len(occasional_garbage_ending)]
-
-        lyrics = lyrics.splitlines()
-
-        # Clears non-lyric content like [verse 1] and empty lines
-        lyrics = self.lyric_sanitizer.remove_non_lyrics(lyrics)
-
-        lyrics = self.lyric_sanitizer.replace_difficult_characters(lyrics)
-
-        lyrics = '/n'.join(lyrics)
-
-        return lyrics
\ No newline at end of file
+        # Lead-out garbage data, e.g. '<lyrics>40Embed' or '<lyrics>You might also like82Embed', is removed by the
+        # sanitizer, along with non-lyric content like [verse 1] and empty lines.
+        return self.lyric_sanitizer.sanitize(lyrics)
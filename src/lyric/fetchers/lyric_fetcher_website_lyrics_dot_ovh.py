@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, List, Tuple
 
 # 1st Party
 from .lyric_fetcher_base import LyricFetcherBase
+from .lyric_cache import LyricCacheInterface
+from ...components.metrics import Metrics
 from ..dataclasses_and_types import LyricFetcherType
 
 if TYPE_CHECKING:
@@ -23,8 +25,8 @@ class LyricFetcherWebsiteLyricsDotOvh(LyricFetcherBase):
     https://github.com/NTag/lyrics.ovh/issues/15
     """
 
-    def __init__(self, path_to_working_dir: Path=None):
-        super().__init__(LyricFetcherType.Website_LyricsDotOvh, ".ovh", path_to_working_dir)
+    def __init__(self, path_to_working_dir: Path=None, lyric_cache: LyricCacheInterface=None, metrics: Metrics=None):
+        super().__init__(LyricFetcherType.Website_LyricsDotOvh, ".ovh", path_to_working_dir, lyric_cache, metrics)
 
 
     def _fetch_lyrics_payload(self, lyric_align_task:LyricAlignTask) -> Tuple[str, LyricValidity]:
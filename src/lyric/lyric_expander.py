@@ -9,57 +9,100 @@ import logging
 #from .dataclasses_and_types import LyricAlignTask
 
 class LyricExpander():
-    """ When/If this class starts doing more than expansion (other logic), rename it to LyricLogic """
+    """ When/If this class starts doing more than expansion (other logic), rename it to LyricLogic
 
-    def __init__(self) -> None:
-        # compile the thing...
+    Expands LyricManager's multiplier annotations, e.g. "{Safe in the eyes of the morning|3}", into repeated lyrics.
+    Multipliers may be nested, e.g. "{Keeping on, {keeping on track|2}|2}", in which case the innermost multiplier is
+    expanded first.
 
-        # Explain: {}
-        brackets_re = r"\{([^|]*?)\|(\d+)\}"
+    Lyrics are expanded in a single pass, however many multipliers they contain. As local lyric files are user
+    provided, they may contain malformed or excessive multipliers. Unmatched braces are kept as-is, multipliers nested
+    deeper than max_nesting_depth are kept as-is, and once the expanded lyrics would exceed max_expanded_length, any
+    further multipliers are expanded only once.
+    """
 
-        self.compiled = re.compile(brackets_re)
+    def __init__(self, max_expanded_length: int = 250_000, max_nesting_depth: int = 8) -> None:
+        self.max_expanded_length = max_expanded_length
+        self.max_nesting_depth = max_nesting_depth
+
+        # Matches either the start of a multiplier '{', or the end of one, e.g. '|4}'
+        tokens_re = r"\{|\|(\d+)\}"
+
+        self.compiled = re.compile(tokens_re)
 
 
     def expand_lyrics(self, filename: str, lyrics: str):
+        """ Returns the given lyrics with all multipliers expanded.
+
+        Input is one long connected text string. Each repetition is followed by a line break, to prevent repetitions
+        from 'sticking together'.
         """
-        
-        Input is one long connected text string...
-        
-        """
+        if "{" not in lyrics:
+            return lyrics
 
-        # Re-connect all data
-        #lyrics_expanded = "\n".join(audio_lyric_align_task.lyric_text_sanitized) # no longer reconnect
-        lyrics_expanded = lyrics
+        # Each opened multiplier collects its text in a list of its own, until the multiplier is closed and its
+        # expanded text is added to the enclosing list. The first list collects the expanded lyrics.
+        open_multipliers: list[list[str]] = [[]]
 
-        match = self.compiled.search(lyrics_expanded)
+        length_expanded = len(lyrics)
+        exceeded_max_length = False
 
-        while match:
+        # Multipliers nested too deeply are kept as-is, including their closing '|N}'
+        amount_kept_as_is = 0
 
-            # Python's indexing with .groups() and .group() is very unorthodox. E.g. len(.groups()) will yield
-            # 2, but the indexing goes all the way up to .group(2) where .group(0) is neither of the groups, but
-            # instead the full match.
-            num_groups = len(match.groups())
-            if num_groups != 2:
-                logging.warning(f"'{filename}' contained group mismatch.")
-                logging.warning(f"Mixmatch: {match.group(0)}")
+        position = 0
+
+        for match in self.compiled.finditer(lyrics):
+            open_multipliers[-1].append(lyrics[position:match.start()])
+            position = match.end()
+
+            repetitions_text = match.group(1)
+
+            if repetitions_text is None:
+                if amount_kept_as_is or len(open_multipliers) > self.max_nesting_depth:
+                    amount_kept_as_is += 1
+                    open_multipliers[-1].append(match.group(0))
+                else:
+                    open_multipliers.append([])
                 continue
 
-            full_match_start = match.start(0)
-            full_match_end = match.end(0)
+            if amount_kept_as_is:
+                amount_kept_as_is -= 1
+                open_multipliers[-1].append(match.group(0))
+                continue
 
-            text_to_repeat = match.group(1)
-            repetitions = int(match.group(2))
+            # A closing '|N}' without a preceding '{' isn't a multiplier
+            if len(open_multipliers) == 1:
+                open_multipliers[-1].append(match.group(0))
+                continue
+
+            text_to_repeat = "".join(open_multipliers.pop())
+
+            # More than 9 digits can only be a mistake, and is treated as excessive rather than converted
+            repetitions = int(repetitions_text) if len(repetitions_text) <= 9 else self.max_expanded_length
+
+            length_text_expanded = (len(text_to_repeat) + 1) * repetitions
+            length_multiplier = len(text_to_repeat) + len(match.group(0)) + 1
+
+            if length_expanded + length_text_expanded - length_multiplier > self.max_expanded_length:
+                if not exceeded_max_length:
+                    logging.warning(f"'{filename}' exceeded {self.max_expanded_length} characters when expanding multipliers. "
+                                    f"Remaining multipliers are not repeated.")
+                    exceeded_max_length = True
+                repetitions = 1
+                length_text_expanded = len(text_to_repeat) + 1
+
+            length_expanded += length_text_expanded - length_multiplier
 
             # Craft expanded string - We insert a \n to handle things 'sticking together'
-            match_expanded = (text_to_repeat + "\n") * repetitions
+            open_multipliers[-1].append((text_to_repeat + "\n") * repetitions)
+
+        open_multipliers[-1].append(lyrics[position:])
 
-            # Insert expanded text
-            text_up_to_match = lyrics_expanded[:full_match_start]
-            text_after_match = lyrics_expanded[full_match_end:]
-            lyric_expanded_partial = text_up_to_match + match_expanded + text_after_match
+        # Any multipliers left open are missing their '|N}', and are kept as they were
+        if len(open_multipliers) > 1:
+            logging.warning(f"'{filename}' contained {len(open_multipliers) - 1} unclosed multiplier(s).")
 
-            # Apply update and repeat
-            lyrics_expanded = lyric_expanded_partial
-            match = self.compiled.search(lyrics_expanded)
+        lyrics_expanded = "{".join("".join(text) for text in open_multipliers)
 
         return lyrics_expanded
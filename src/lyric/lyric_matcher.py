@@ -2,6 +2,7 @@
 import os
 import re
 import logging
+from array import array
 
 
 # 3rd Party
@@ -10,7 +11,8 @@ import logging
 # 1st Party
 from .dataclasses_and_types.lyric_match import MatchLyric
 from .dataclasses_and_types.lyric_match import MatchResult
-from ..lyric.aligners import WordAndTiming
+from .dataclasses_and_types.lyric_matching_method import LyricMatchingMethod
+from ..lyric.aligners import WordTimings
 
 
 class LyricMatcher():
@@ -52,8 +54,20 @@ class LyricMatcher():
     the 'Fetched lyrics' structured text.
     """
 
-    def __init__(self, json_schema_version):
+    # Traceback moves of the global alignment
+    _move_none = 0
+    _move_match = 1         # Time aligned word matches structured word
+    _move_skip_aligned = 2  # Time aligned word is not matched, e.g. 'BREATH*'
+    _move_skip_structured = 3 # Structured word is not matched, e.g. a word the aligner skipped
+
+    def __init__(self, json_schema_version, band_radius: int = 128):
+        """
+        Args:
+            band_radius: Maximum number of words the global alignment may deviate from the diagonal, i.e. how far the
+                time aligned and structured lyrics may drift apart, e.g. due to a skipped verse.
+        """
         self.json_schema_version = json_schema_version
+        self.band_radius = band_radius
 
 
     def convert_lyrics_string_to_match_lyrics(self, lyrics: list[str]):
@@ -207,9 +221,57 @@ class LyricMatcher():
 
 
     def match_aligned_lyrics_with_structured_lyrics(self,
-        lyrics_time_aligned: list[WordAndTiming],
+        lyrics_time_aligned: WordTimings,
         lyrics_structured: list[MatchLyric],
+        matching_method: LyricMatchingMethod = LyricMatchingMethod.Greedy,
         debug_print=False) -> tuple[list[MatchLyric], MatchResult]:
+        """ Matches time aligned lyrics with (sentance) structured lyrics, using the given matching method.
+
+        Matching operates solely on words. Each matching method determines, for each structured lyric, the index of the
+        matching time aligned word, after which the timing information is applied in a single pass.
+
+        Returns:
+            List[MatchLyric] - List of structure lyrics now with timing information
+        """
+        words_aligned = lyrics_time_aligned.get_words_lowercase()
+        words_structured = [lyric.word_alignment.lower() for lyric in lyrics_structured]
+
+        if matching_method == LyricMatchingMethod.GlobalAlignment:
+            match_indices = self._match_global_alignment(words_aligned, words_structured)
+        else:
+            match_indices = self._match_greedy(words_aligned, words_structured, debug_print)
+
+        total_matched = self._apply_word_timings(lyrics_time_aligned, lyrics_structured, match_indices)
+
+        return lyrics_structured, MatchResult(len(words_aligned), total_matched)
+
+
+    @staticmethod
+    def _apply_word_timings(lyrics_time_aligned: WordTimings, lyrics_structured: list[MatchLyric], match_indices: array) -> int:
+        """ Copies timing information to each matched structured lyric, and returns the number of matches.
+
+        Args:
+            match_indices: Per structured lyric, the index of the matching time aligned word, or -1 if unmatched.
+        """
+        times_start = lyrics_time_aligned.times_start
+        times_end = lyrics_time_aligned.times_end
+        total_matched = 0
+
+        for lyric, match_index in zip(lyrics_structured, match_indices):
+            if match_index < 0:
+                continue
+
+            lyric.time_start = times_start[match_index]
+            lyric.time_end = times_end[match_index]
+            total_matched += 1
+
+        return total_matched
+
+
+    def _match_greedy(self,
+        words_aligned: list[str],
+        words_structured: list[str],
+        debug_print=False) -> array:
         """ Matches time aligned lyrics with (sentance) structured lyrics.
 
         Aligned lyrics and structured lyrics rarely match exactly. This function uses a moving
@@ -223,10 +285,10 @@ class LyricMatcher():
         window shrinks.
 
         Args:
-            - TODO:
+            words_aligned: Lowercase time aligned words.
+            words_structured: Lowercase alignment-ready structured words.
         Returns:
-            List[MatchLyric] - List of structure lyrics now with timing information
-
+            Per structured word, the index of the matching time aligned word, or -1 if unmatched.
         """
 
         #debug_print = True
@@ -267,33 +329,27 @@ class LyricMatcher():
         # wat -> word and timing
         lsb_index = 0
 
-        total_unmatched = 0
+        match_indices = array('l', [-1]) * len(words_structured)
 
         # Growing / Shrinking tolerance window works well with BLUR - Boys & Girls
         min_mismatch_tolerance = 3
         current_mismatch_tolerance = min_mismatch_tolerance
 
-        for wat_index, wat in enumerate(lyrics_time_aligned):
+        for wat_index, word_aligned in enumerate(words_aligned):
 
             failed_to_match = False
 
-            match_span = min(len(lyrics_structured) - lsb_index, current_mismatch_tolerance)
+            match_span = min(len(words_structured) - lsb_index, current_mismatch_tolerance)
             for index_offset in range(match_span):
 
                 if debug_print:
-                    self._debug_print(lyrics_time_aligned, wat_index, lyrics_structured, lsb_index, index_offset, current_mismatch_tolerance)
+                    self._debug_print(words_aligned, wat_index, words_structured, lsb_index, index_offset, current_mismatch_tolerance)
                     input("Press Enter to continue...")
 
-                # Fix out of range...
-                lsb = lyrics_structured[lsb_index + index_offset]
-
-                #print(f"Matching {wat.word.lower()} against {lsb.word.lower()} ")
-
                 # Todo: Improve word-to-word comparisson 
-                if wat.word.lower() == lsb.word_alignment.lower():
+                if word_aligned == words_structured[lsb_index + index_offset]:
                     #lsb_mismatch_count = 0
-                    lyrics_structured[lsb_index + index_offset].time_start = wat.time_start
-                    lyrics_structured[lsb_index + index_offset].time_end = wat.time_end
+                    match_indices[lsb_index + index_offset] = wat_index
 
                     # If we find a 'later' match, we must move the lsb_index forward by the offset
                     # otherwise, it'll keep falling behind
@@ -310,23 +366,112 @@ class LyricMatcher():
                 #self._debug_print(lyrics_time_aligned, wat_index, lyrics_structured_better, lsb_index, index_offset, current_mismatch_tolerance)
 
             if failed_to_match:
-                logging.debug(f"Failed to match a word: {wat.word:10} | wat_index: {wat_index:3} | lsb_index: {lsb_index:3}")
+                logging.debug(f"Failed to match a word: {word_aligned:10} | wat_index: {wat_index:3} | lsb_index: {lsb_index:3}")
                 # Given that the timed lyrics are always expected to be more sparse, than
                 # the structured ones, if a match fails, it 'should' be ok to move the lsb_index
                 # ahead. See how we go re. this change.
                 #lsb_index += 1
                 current_mismatch_tolerance += 1
-                total_unmatched += 1
             else:
                 current_mismatch_tolerance = max(min_mismatch_tolerance, current_mismatch_tolerance-1)
                 lsb_index += 1
 
-        num_time_aligned_lyrics = len(lyrics_time_aligned)
-        total_matched = num_time_aligned_lyrics - total_unmatched
+        return match_indices
+
+
+    def _match_global_alignment(self, words_aligned: list[str], words_structured: list[str]) -> array:
+        """ Matches time aligned lyrics with (sentance) structured lyrics via banded global sequence alignment.
+
+        Unlike the greedy window, the alignment considers both word sequences in their entirety, so it recovers from
+        inserted words, e.g. 'BREATH*', and skipped words or verses. Each time aligned word is either matched to an
+        identical structured word, or left unmatched, and the alignment maximizes the number of matched words, i.e. it
+        finds their longest common subsequence (Needleman-Wunsch with a match score of 1 and no penalties).
 
-        match_result = MatchResult(num_time_aligned_lyrics, total_matched)
+        Only alignments within band_radius words of the diagonal are considered. Runtime and memory are therefore
+        proportional to the number of words times band_radius, rather than the product of both word counts. Only two
+        rows of scores are kept, and the traceback is stored in a single bytearray.
+
+        Returns:
+            Per structured word, the index of the matching time aligned word, or -1 if unmatched.
+        """
+        amount_aligned = len(words_aligned)
+        amount_structured = len(words_structured)
+
+        match_indices = array('l', [-1]) * amount_structured
+
+        if not amount_aligned:
+            return match_indices
+
+        # Columns [column_start, column_end] of each row lie within the band around the diagonal. A row's band always
+        # overlaps the previous row's band, so that every row is reachable, even if the structured lyrics are far longer.
+        columns_start = [0]
+        columns_end = [min(amount_structured, self.band_radius)]
+        for row in range(1, amount_aligned + 1):
+            column_center = row * amount_structured // amount_aligned
+            columns_start.append(min(max(0, column_center - self.band_radius), columns_end[-1]))
+            columns_end.append(min(amount_structured, column_center + self.band_radius))
+
+        traceback_offsets = [0]
+        for row in range(amount_aligned):
+            traceback_offsets.append(traceback_offsets[-1] + columns_end[row] - columns_start[row] + 1)
+        traceback = bytearray(traceback_offsets[-1] + columns_end[-1] - columns_start[-1] + 1)
+
+        # The first row consists solely of skipped structured words
+        scores_previous = [0] * (columns_end[0] + 1)
+        for column in range(1, columns_end[0] + 1):
+            traceback[column] = self._move_skip_structured
+
+        for row in range(1, amount_aligned + 1):
+            word_aligned = words_aligned[row - 1]
+            column_start, column_end = columns_start[row], columns_end[row]
+            column_start_previous, column_end_previous = columns_start[row - 1], columns_end[row - 1]
+            traceback_offset = traceback_offsets[row] - column_start
+
+            # Scores are never negative, so -1 marks cells that can't be reached from within the band.
+            scores = [-1] * (column_end - column_start + 1)
+
+            for column in range(column_start, column_end + 1):
+                score_best = -1
+                move = self._move_none
+
+                if column_start_previous <= column <= column_end_previous:
+                    score_best = scores_previous[column - column_start_previous]
+                    move = self._move_skip_aligned
+
+                if column > column_start and scores[column - 1 - column_start] > score_best:
+                    score_best = scores[column - 1 - column_start]
+                    move = self._move_skip_structured
+
+                # Matches are preferred on ties, so words are matched as early as possible.
+                if column_start_previous < column <= column_end_previous + 1 and word_aligned == words_structured[column - 1]:
+                    score_match = scores_previous[column - 1 - column_start_previous]
+                    if score_match >= 0 and score_match + 1 >= score_best:
+                        score_best = score_match + 1
+                        move = self._move_match
+
+                scores[column - column_start] = score_best
+                traceback[traceback_offset + column] = move
+
+            scores_previous = scores
+
+        row, column = amount_aligned, amount_structured
+
+        while row > 0 or column > 0:
+            move = traceback[traceback_offsets[row] - columns_start[row] + column]
+
+            if move == self._move_match:
+                match_indices[column - 1] = row - 1
+                row -= 1
+                column -= 1
+            elif move == self._move_skip_aligned:
+                logging.debug(f"Failed to match a word: {words_aligned[row - 1]:10} | wat_index: {row - 1:3}")
+                row -= 1
+            elif move == self._move_skip_structured:
+                column -= 1
+            else:
+                raise RuntimeError(f"Lyric global alignment traceback reached an unreachable cell ({row}, {column}).")
 
-        return lyrics_structured, match_result
+        return match_indices
 
 
     def _debug_print(self, lyrics_timing, wat_index, lyrics_structured_better, lsb_index, index_offset, mismatch_tolerance):
@@ -340,11 +485,9 @@ class LyricMatcher():
         display_range = 12  # How large a range to 
         os.system('cls')
 
-        lyrics_timing_display = lyrics_timing[wat_index:wat_index+display_range]
-        words_timing = [x.word for x in lyrics_timing_display]
+        words_timing = lyrics_timing[wat_index:wat_index+display_range]
 
-        lyrics_structured_better_display = lyrics_structured_better[lsb_index:lsb_index+display_range]
-        words_structure = [x.word_alignment for x in lyrics_structured_better_display]
+        words_structure = lyrics_structured_better[lsb_index:lsb_index+display_range]
 
         # TODO: Fix case index_offset > display_range
         words_timing[0] = f">{words_timing[0]}<"
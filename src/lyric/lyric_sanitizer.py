@@ -1,6 +1,6 @@
 # Python
 import re
-from typing import List
+from dataclasses import dataclass
 
 # 3rd Party
 
@@ -8,18 +8,71 @@ from typing import List
 # 1st Party
 
 
+@dataclass(frozen=True)
+class SanitizationRules:
+    """ The rules by which a LyricSanitizer cleans up raw lyrics. Each lyric fetcher declares the rules its source needs.
+
+    Attributes:
+        remove_trailing_embed: Removes '<numeric value>Embed' and 'You might also like' from the end of the lyrics.
+        remove_bracketed_text: Removes non-lyric content in brackets, e.g. '[Verse 1]'.
+        characters_to_replace: Pairs of characters and their replacements. Replacing with '' removes the character.
+    """
+    remove_trailing_embed: bool = False
+    remove_bracketed_text: bool = True
+    characters_to_replace: tuple[tuple[str, str], ...] = (
+        ("’", "'"),     # Annoying almost-apostrophe. Recorded instance of "white's" being recognized, but not "white’s"
+    )
+
 
 class LyricSanitizer():
     """ LyricSanitizer is responsible for cleaning up raw lyrics to make them easier to align.
 
     An ever growing number of exceptional cases has compelled the creation of this class.
-    
-    
+
+    The given rules are compiled once. sanitize() then applies each rule to the complete lyrics at once, rather than line
+    by line, and only splits and joins the lyric lines a single time.
     """
-    def __init__(self) -> None:
+    def __init__(self, rules: SanitizationRules = SanitizationRules()) -> None:
+        self.rules = rules
+
         reg_exp_find_lyric_multiplications = r"[(\[]\d+x[)\]]"
         self.re_comp_find_lyric_multiplications = re.compile(reg_exp_find_lyric_multiplications)
 
+        # Examples:
+        # <lyrics>2Embed
+        # <lyrics>You might also likeEmbed
+        # <lyrics>You might also like82Embed
+        self.re_comp_trailing_embed = None
+        if rules.remove_trailing_embed:
+            self.re_comp_trailing_embed = re.compile(r"(?:You might also like)?(?:\d*Embed)?\s*\Z")
+
+        # Removes [<any content, except newlines>]. A negated character class avoids the backtracking of r"\[.*?\]".
+        self.re_comp_bracketed_text = None
+        if rules.remove_bracketed_text:
+            self.re_comp_bracketed_text = re.compile(r"\[[^\]\n]*\]")
+
+
+    def sanitize(self, lyrics: str) -> str:
+        """ Returns the given lyrics with all rules applied, stripped of surrounding whitespace and empty lines.
+
+        Each remaining line represents a single cohesive sung sentence.
+        """
+        if self.re_comp_trailing_embed:
+            # The trailing garbage is always contained within the last non-empty line, so there's no need to search further
+            lyrics = lyrics.rstrip()
+            match = self.re_comp_trailing_embed.search(lyrics, lyrics.rfind("\n") + 1)
+            lyrics = lyrics[:match.start()]
+
+        # Brackets never span multiple lines, so the complete lyrics are processed at once
+        if self.re_comp_bracketed_text:
+            lyrics = self.re_comp_bracketed_text.sub("", lyrics)
+
+        # For a handful of characters, str.replace() is considerably faster than str.translate()
+        for character, replacement in self.rules.characters_to_replace:
+            lyrics = lyrics.replace(character, replacement)
+
+        return "\n".join(line_stripped for line in lyrics.splitlines() if (line_stripped := line.strip()))
+
 
     def remove_leading_title(self, song_name:str, lyrics:str):
         """ Removes the leading '<song name> Lyrics' text piece. """
@@ -49,66 +102,6 @@ class LyricSanitizer():
         return lyrics
 
 
-    def remove_embed_at_end(self, lyrics:str):
-        sanitized = re.sub(r"\d*Embed$", '', lyrics)
-        return sanitized
-
-
-    def remove_non_lyrics(self, all_lyric_lines: List[str]) -> List[str]:
-        """ Returns a list of sanitized lyric strings.
-
-        Each string in the list represents a single coheasive sung sentence. This is used during
-        visualization to cohesively visualize sentances.
-        """
-        # Lyrics are provided in a single large string
-
-        sanitized_lyric_lines = []
-
-        for lyric_line in all_lyric_lines:
-            # Removes [<any content, except newlines>]
-            #complete_lyric_string = re.sub(r"\[.*\]", '', complete_lyric_string)
-            #lyric_line = re.sub(r"\[[a-zA-Z0-9 -]*\]", '', lyric_line) # Didn't catch &, or . and the like
-            lyric_line = re.sub(r"\[(.*?)\]", '', lyric_line)
-
-            lyric_line = lyric_line.strip()
-
-            sanitized_lyric_lines.append(lyric_line)
-
-        # Remove empty lines
-        non_empty_lyric_lines = [lyric_line for lyric_line in sanitized_lyric_lines if lyric_line]
-
-
-        # complete_lyric_string = ' '.join(non_empty_lyric_lines)
-
-        # # Removes [<any content, except newlines>]
-        # #complete_lyric_string = re.sub(r"\[.*\]", '', complete_lyric_string)
-        # complete_lyric_string = re.sub(r"\[[a-zA-Z0-9 -]*\]", '', complete_lyric_string)
-
-        # # Remove double-spaces
-        # complete_lyric_string = ' '.join(complete_lyric_string.split())
-
-        return non_empty_lyric_lines
-
-
-    
-    def replace_difficult_characters(self, lyrics: List[str]) -> List[str]:
-        """ Replaces characters that cause issues in the lyric rendering pipeline.
-
-        Rather than supporting every possible character, it's initially far simpler, to replace
-        the difficult ones and add support for more and more in the future
-
-        """
-        lyrics_cleaned = []
-
-        # Recorded instance of "white's" being recognized, but "white’s" *not* being recognized
-        # Recorded instance of "I'm" being recognized, but not "Ims", "I'ms"
-
-        for lyric in lyrics:
-            lyrics_cleaned.append(lyric.replace("’", "'")) # Annoying almost-apostrophe
-
-        return lyrics_cleaned
-
-
     # Should be extracted out into another object...
     def contains_multipliers(self, lyrics: str):
         """ Tries to locate instances of (4x) or [10x] etc. """
@@ -5,9 +5,14 @@ import os
 import sys
 import json
 import logging
+import threading
+import time
 from pathlib import Path
 from datetime import datetime
-from typing import TYPE_CHECKING, Union
+from dataclasses import dataclass
+from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Optional, Union
 
 
 # 3rd Party
@@ -19,33 +24,51 @@ from .developer_options import DeveloperOptions
 
 from .components import AudioArtistAndSongNameSource
 from .components import ObjectFactory
-from .components import get_percentage_and_amount_string
 from .components import FileOperations
 from .components import GithubRepositoryVersionCheck
+from .components import LibraryIndex
+from .components import IndexedAudioFile
+from .components import LibraryScanner
+from .components import ScanRules
+from .components import create_audio_file_watcher
+from .components import OutputFingerprints
+from .components import OutputRecord
+from .components import Metrics
+from .components import JobQueue
 
 from .lyric.dataclasses_and_types import LyricAlignTask, LyricAlignmentOutput
 from .lyric.dataclasses_and_types import LyricAlignerType
 from .lyric.dataclasses_and_types import LyricFetcherType
+from .lyric.dataclasses_and_types import LyricCacheType
+from .lyric.dataclasses_and_types import LyricMatchingMethod
 from .lyric.dataclasses_and_types import LyricPayload
 from .lyric.dataclasses_and_types import LyricValidity
+from .lyric.dataclasses_and_types.lyric_match import MatchResult
 
 
-from .lyric.fetchers import LyricFetcherDisabled
-from .lyric.fetchers import LyricFetcherPyPiLyricsGenius
-from .lyric.fetchers import LyricFetcherPyPiLyricsExtractor
-from .lyric.fetchers import LyricFetcherLocalFile
-from .lyric.fetchers import LyricFetcherWebsiteLyricsDotOvh
 from .lyric.fetchers import LyricFetcherBase
+from .lyric.fetchers import LyricCacheInterface
+from .lyric.fetchers import LyricCacheSidecarFiles
+from .lyric.fetchers import LyricCacheSqlite
+from .lyric.fetchers import resanitize_lyric_cache
 
 from .lyric.aligners import LyricAlignerInterface
-from .lyric.aligners import LyricAlignerDisabled
-from .lyric.aligners import LyricAlignerNUSAutoLyrixAlignOffline
-from .lyric.aligners import LyricAlignerNUSAutoLyrixAlignOnline
+from .lyric.aligners import AlignmentCache
 
 from .lyric import LyricSanitizer
 from .lyric import LyricExpander
 from .lyric import LyricMatcher
 
+from .pipeline import Pipeline
+from .pipeline import PipelineStage
+
+from .results import TaskResult
+from .results import TaskResultSinkInterface
+from .results import TaskResultSinkReport
+from .results import TaskResultSinkJsonLines
+from .results import TaskResultSinkMetrics
+from .results import TaskResultSinkJobQueue
+
 from src.lyric_processing_config import Settings
 from src.lyric_processing_config import FileCopyMode
 from src.lyric_processing_config import AlignedLyricsFormatting
@@ -56,12 +79,48 @@ if TYPE_CHECKING:
     from .cli import ProgressItemGeneratorCLI
     from .gui import ProgressItemGeneratorGUI
 
+@dataclass
+class _ProcessingSession:
+    """ The lyric fetchers, caches and pipeline shared by all tasks processed in a single run, or while watching. """
+    lyric_cache: LyricCacheInterface
+    lyric_fetchers: list[LyricFetcherBase]
+    output_fingerprints: Optional[OutputFingerprints]
+    pipeline: Pipeline
+
+    def close(self):
+        for lyric_fetcher in self.lyric_fetchers:
+            lyric_fetcher.close()
+
+        self.lyric_cache.close()
+
+        if self.output_fingerprints:
+            self.output_fingerprints.close()
+
+
+def _init_tag_reading_worker():
+    if DeveloperOptions.eyed3_log_only_errors:
+        eyed3.log.setLevel(logging.ERROR)
+
+
+def _derive_lyric_align_task(audio_song_name: AudioArtistAndSongNameSource,
+                             path_to_audio_file: Path) -> Optional[LyricAlignTask]:
+    """ Creates a LyricAlignTask, deriving its artist and song name. Executes in worker processes when reading tags. """
+    if audio_song_name == AudioArtistAndSongNameSource.FileName:
+        return LyricAlignTask.create_prefer_artist_song_name_from_filename(path_to_audio_file)
+    elif audio_song_name == AudioArtistAndSongNameSource.FileTags:
+        return LyricAlignTask.create_prefer_artist_song_name_from_tags(path_to_audio_file)
+
+    return None
+
+
 class LyricManagerBase:
-    def __init__(self, working_directory: str, reports_directory: str) -> None:
+    def __init__(self, working_directory: str, reports_directory: str, check_for_new_version: bool = True) -> None:
         """
         Args:
             working_directory: Either a default or user-defined path to LyricManager's working directory.
             reports_directory: Either a default or user-defined path to LyricManager's report directory.
+            check_for_new_version: If True, a newer release of LyricManager is checked for in the background, and
+                logged if found.
         """
         # Preferred over __file__, as that has been known to cause issues with Py2Exe
         self.path_to_application = Path(sys.argv[0]).parent
@@ -74,12 +133,6 @@ class LyricManagerBase:
 
         self._init_logger(self.path_to_application)
 
-        newer_version = GithubRepositoryVersionCheck.get_newer_version_if_available(DeveloperOptions.version)
-
-        if newer_version:
-            logging.info(f"A newer version of LyricManager ({newer_version}) has been released!")
-            logging.info(f"To download, visit: https://github.com/Gazoo101/lyric-manager/releases")
-
         # LyricManager expects to have the current working directory set to its base execution
         os.chdir(self.path_to_application)
         logging.info(f"Current working directory: {os.getcwd()}")
@@ -92,50 +145,77 @@ class LyricManagerBase:
         
         self.lyric_matcher = LyricMatcher(DeveloperOptions.json_schema_version)
 
+        # Counters and timings of the current run, replaced at the start of each run
+        self.metrics = Metrics()
+
         self.extension_alignment_ready = ".alignment_ready"
 
         self.recognized_audio_filename_extensions = ["mp3", "wav", "aiff"]
 
+        # Tags are read by several processes only if there are enough audio files to outweigh starting the processes
+        self.min_audio_files_for_parallel_tag_reading = 1000
+
+        self.filename_library_index = "library_index.sqlite"
+        self.filename_output_fingerprints = "output_fingerprints.sqlite"
+        self.filename_lyric_cache = "lyric_cache.sqlite"
+        self.filename_latest_release_check = "latest_release_check.json"
+        self.dirname_alignment_cache = "alignment_cache"
+        self.dirname_job_queues = "job_queues"
+
         if DeveloperOptions.eyed3_log_only_errors:
             eyed3.log.setLevel(logging.ERROR)
 
+        # Checking GitHub requires network access, which mustn't hold up processing - especially when offline.
+        if check_for_new_version:
+            GithubRepositoryVersionCheck.check_in_background(
+                DeveloperOptions.version,
+                self.path_to_working_directory / self.filename_latest_release_check,
+                self._log_newer_version)
 
 
+    def _log_newer_version(self, newer_version: str):
+        logging.info(f"A newer version of LyricManager ({newer_version}) has been released!")
+        logging.info(f"To download, visit: https://github.com/Gazoo101/lyric-manager/releases")
+
 
-    def _valid_audio_extension(self, filename: str):
-        for extension in self.recognized_audio_filename_extensions:
-            if filename.endswith(extension):
-                return True
-        
-        return False
 
 
     def _create_factory_lyric_fetcher(self):
-        factory = ObjectFactory()
-        #factory.register_builder(LyricFetcherType.Disabled, LyricFetcherDisabled)
-        factory.register_builder(LyricFetcherType.Pypi_LyricsGenius, LyricFetcherPyPiLyricsGenius)
-        factory.register_builder(LyricFetcherType.Pypi_LyricsExtractor, LyricFetcherPyPiLyricsExtractor)
-        factory.register_builder(LyricFetcherType.LocalFile, LyricFetcherLocalFile)
-        #factory.register_builder(LyricFetcherType.Website_LyricsDotOvh, LyricFetcherWebsiteLyricsDotOvh)
+        # Builders are named rather than imported, so only the lyric fetchers in use (and their dependencies) are imported
+        factory = ObjectFactory(__package__)
+        #factory.register_builder(LyricFetcherType.Disabled, ".lyric.fetchers.lyric_fetcher_disabled:LyricFetcherDisabled")
+        factory.register_builder(LyricFetcherType.Pypi_LyricsGenius, ".lyric.fetchers.lyric_fetcher_pypi_lyricsgenius:LyricFetcherPyPiLyricsGenius")
+        factory.register_builder(LyricFetcherType.Pypi_LyricsExtractor, ".lyric.fetchers.lyric_fetcher_pypi_lyrics_extractor:LyricFetcherPyPiLyricsExtractor")
+        factory.register_builder(LyricFetcherType.LocalFile, ".lyric.fetchers.lyric_fetcher_local_file:LyricFetcherLocalFile")
+        #factory.register_builder(LyricFetcherType.Website_LyricsDotOvh, ".lyric.fetchers.lyric_fetcher_website_lyrics_dot_ovh:LyricFetcherWebsiteLyricsDotOvh")
         return factory
 
 
     def _create_factory_lyric_aligners(self):
-        factory = ObjectFactory()
-        factory.register_builder(LyricAlignerType.Disabled, LyricAlignerDisabled)
-        factory.register_builder(LyricAlignerType.NUSAutoLyrixAlignOffline, LyricAlignerNUSAutoLyrixAlignOffline)
-        #factory.register_builder(LyricAlignerType.NUSAutoLyrixAlignOnline, LyricAlignerNUSAutoLyrixAlignOnline)
+        factory = ObjectFactory(__package__)
+        factory.register_builder(LyricAlignerType.Disabled, ".lyric.aligners.lyric_aligner_disabled:LyricAlignerDisabled")
+        factory.register_builder(LyricAlignerType.NUSAutoLyrixAlignOffline, ".lyric.aligners.lyric_aligner_NUS_autolyrixalign_offline:LyricAlignerNUSAutoLyrixAlignOffline")
+        #factory.register_builder(LyricAlignerType.NUSAutoLyrixAlignOnline, ".lyric.aligners.lyric_aligner_NUS_autolyrixalign_online:LyricAlignerNUSAutoLyrixAlignOnline")
         return factory
     
 
-    def _create_lyric_fetcher(self, type: LyricFetcherType, settings: Settings):
+    def _create_lyric_cache(self, type: LyricCacheType) -> LyricCacheInterface:
+        if type == LyricCacheType.Sqlite:
+            return LyricCacheSqlite(self.path_to_working_directory / self.filename_lyric_cache)
+
+        return LyricCacheSidecarFiles(self.path_to_working_directory)
+
+
+    def _create_lyric_fetcher(self, type: LyricFetcherType, settings: Settings, lyric_cache: LyricCacheInterface):
         """ Returns a lyric fetcher matching the provided type.
 
         In order to cleanly encapsulate the LyricFetcher from the configuration code, we must build this intermediary
         code handling parameter passing.
         """
         lyric_fetcher_parameters = {
-            "path_to_working_dir": self.path_to_working_directory
+            "path_to_working_dir": self.path_to_working_directory,
+            "lyric_cache": lyric_cache,
+            "metrics": self.metrics
         }
 
         if type == LyricFetcherType.Pypi_LyricsGenius:
@@ -158,6 +238,7 @@ class LyricManagerBase:
 
             lyric_fetcher_parameters["google_custom_search_api_key"] = settings.lyric_fetching.google_custom_search_api_key
             lyric_fetcher_parameters["google_custom_search_engine_id"] = settings.lyric_fetching.google_custom_search_engine_id
+            lyric_fetcher_parameters["google_custom_search_daily_quota"] = settings.lyric_fetching.google_custom_search_daily_quota
         
         return self.factory_lyric_fetcher.create(type, **lyric_fetcher_parameters)
 
@@ -166,11 +247,15 @@ class LyricManagerBase:
 
         lyric_aligner_parameters = {
             "path_to_output_dir": self.path_to_working_directory, # improve this
+            "metrics": self.metrics
         }
 
         if type == LyricAlignerType.NUSAutoLyrixAlignOffline:
             lyric_aligner_parameters["path_aligner_temp_dir"] = settings.lyric_alignment.NUSAutoLyrixAlign_working_directory
             lyric_aligner_parameters["path_to_aligner"] = settings.lyric_alignment.NUSAutoLyrixAlign_path
+
+            if settings.lyric_alignment.use_alignment_cache:
+                lyric_aligner_parameters["alignment_cache"] = AlignmentCache(self.path_to_working_directory / self.dirname_alignment_cache)
             
             # think about this...
             #raise Exception("This has yet to be fixed - the outputdir doesn't exist and NUSAutoLyrix align likely needs 2 dirs.")
@@ -213,25 +298,205 @@ class LyricManagerBase:
     
     def fetch_and_align_lyrics(self,
         settings: Settings,
-        loop_wrapper: Union[ProgressItemGeneratorCLI, ProgressItemGeneratorGUI]) -> list[LyricAlignTask]:
+        loop_wrapper: Union[ProgressItemGeneratorCLI, ProgressItemGeneratorGUI],
+        task_result_sinks: Optional[list[TaskResultSinkInterface]] = None):
         """ Fetches and aligns lyrics using selected fetchers and aligner as defined by the settings parameter.
 
         Args:
             settings: Settings object containing all settings required to fully execute fetching and aligning of lyrics
             loop_wrapper: Encapsulates communicating progress either via command-line or graphical user-interface while
                 the fetching and alignment code is executed.
-        Returns:
-            A list of AudioLyricAlignTask objects, either completed or failed.
+            task_result_sinks: Additional sinks receiving the result of each task as soon as it completes, either
+                completed or failed. The alignment report - and optionally a results log - is always written.
+
+        Alongside the alignment report, a metrics file records the counters and timings of each stage of the run.
+        """
+        self.metrics = Metrics()
+
+        processing_session = self._open_processing_session(settings)
+        if not processing_session:
+            return
+
+        try:
+            tasks = self._find_lyric_align_tasks(settings, settings.data.input.use_library_index)
+
+            self._process_lyric_align_tasks(processing_session, tasks, settings, loop_wrapper, task_result_sinks)
+        finally:
+            processing_session.close()
+
+        logging.info("Fetching and aligning lyrics finished.")
+
+
+    def work_on_job_queue(self,
+        settings: Settings,
+        loop_wrapper: Union[ProgressItemGeneratorCLI, ProgressItemGeneratorGUI],
+        job_queue_name: str,
+        task_result_sinks: Optional[list[TaskResultSinkInterface]] = None):
+        """ Fetches and aligns lyrics as one of several workers sharing a job queue, e.g. on several machines.
+
+        Every worker finds the same audio files, and claims a few tasks at a time, so each audio file is processed by a
+        single worker. If a worker dies, its tasks are reclaimed by the other workers once its leases expire, see
+        JobQueue. Workers stop once every task is done, rather than merely claimed.
+
+        All workers must share the working directory - holding the job queue, cached lyrics and aligner output - and
+        find the audio files by the same paths. Each worker writes its own report and metrics file, named after it.
+
+        Sqlite databases mustn't be shared by several machines. The Sqlite lyric cache is therefore not supported, and
+        the library index and output fingerprints are not used; within a job queue, done tasks are never re-processed.
+
+        Args:
+            job_queue_name: Names the job queue in the working directory. Workers sharing the same name share tasks,
+                and a new name starts afresh.
         """
+        if settings.lyric_fetching.cache == LyricCacheType.Sqlite:
+            logging.error("The Sqlite lyric cache can't be shared by several workers, use the SidecarFiles cache instead.")
+            return
+
+        self.metrics = Metrics()
+
+        processing_session = self._open_processing_session(settings, use_output_fingerprints=False)
+        if not processing_session:
+            return
+
+        job_queue = JobQueue(
+            self.path_to_working_directory / self.dirname_job_queues / job_queue_name,
+            settings.job_queue.lease_seconds,
+            metrics=self.metrics)
+
+        logging.info(f"Working on job queue '{job_queue_name}' as worker '{job_queue.worker_id}'.")
+
+        task_result_sinks = self._create_task_result_sinks(settings, job_queue.worker_id) + \
+            [TaskResultSinkJobQueue(job_queue)] + (task_result_sinks or [])
+
+        # Enough tasks are claimed to keep every stage busy, but no more, leaving the remaining tasks to other workers
+        max_tasks_in_flight = settings.lyric_fetching.max_concurrent_fetches + 2 * settings.lyric_alignment.max_concurrent_alignments
+
+        # The number of tasks this worker processes is only known once all tasks are done
+        for task_result_sink in task_result_sinks:
+            task_result_sink.start(0)
+
+        try:
+            tasks = self._find_lyric_align_tasks(settings, use_library_index=False)
+
+            with job_queue:
+                while True:
+                    keys_done = job_queue.get_keys_done()
+                    tasks = [task for task in tasks if JobQueue.get_key(str(task.path_to_audio_file)) not in keys_done]
+
+                    if not tasks:
+                        break
+
+                    # Tasks are claimed only as they're let into the pipeline
+                    tasks_claimed = (task for task in tasks if job_queue.try_claim(JobQueue.get_key(str(task.path_to_audio_file))))
+                    tasks_completed = processing_session.pipeline.process(tasks_claimed, max_tasks_in_flight)
+
+                    for task in loop_wrapper(tasks_completed, total=len(tasks), desc="Fetching and aligning lyrics"):
+                        self.metrics.increment("tasks.total")
+
+                        task_result = TaskResult.from_task(task)
+                        for task_result_sink in task_result_sinks:
+                            task_result_sink.add(task_result)
+
+                    # Any tasks not yet done are claimed by other workers, which either complete them, or die and
+                    # leave their leases to expire. Either way, this worker holds no leases while waiting.
+                    seconds_until_lease_expiry = job_queue.get_seconds_until_lease_expiry(
+                        [JobQueue.get_key(str(task.path_to_audio_file)) for task in tasks])
+
+                    if seconds_until_lease_expiry is not None:
+                        time.sleep(min(seconds_until_lease_expiry + 1.0, job_queue.lease_seconds / 4))
+        finally:
+            for task_result_sink in task_result_sinks:
+                task_result_sink.finish()
+
+            processing_session.close()
+
+        logging.info("All tasks of the job queue are done.")
+
+
+    def watch_and_align_lyrics(self,
+        settings: Settings,
+        loop_wrapper: Union[ProgressItemGeneratorCLI, ProgressItemGeneratorGUI],
+        task_result_sinks: Optional[list[TaskResultSinkInterface]] = None,
+        event_stop: Optional[threading.Event] = None):
+        """ Watches the folders to process, fetching and aligning lyrics of audio files as they're added or changed.
+
+        The lyric fetchers, aligner and caches are set up once, and kept for as long as folders are watched. Audio files
+        arriving in bursts, e.g. an album being copied, are processed together once the burst has settled. Each batch
+        of processed audio files is reported on like a regular run, with files numbered by batch, and metrics of that
+        batch only.
+
+        Only audio files which are added or changed after watching started are processed. Run fetch_and_align_lyrics()
+        beforehand to process the audio files already present.
+
+        Args:
+            event_stop: Watching stops once set. If not provided, watching only stops on KeyboardInterrupt.
+        """
+        self.metrics = Metrics()
+
+        processing_session = self._open_processing_session(settings)
+        if not processing_session:
+            return
+
+        audio_file_watcher = create_audio_file_watcher(
+            self._get_paths_to_process(settings),
+            settings.data.input.recursively_process_paths,
+            self._create_library_scanner(settings),
+            settings.data.input.watch_debounce_seconds,
+            settings.data.input.watch_polling_interval_seconds)
+
+        event_stop = event_stop if event_stop else threading.Event()
+
+        try:
+            audio_file_watcher.start()
+            logging.info("Watching for new or changed audio files. Press Ctrl+C to stop.")
+
+            for batch_number, paths_to_audio_files in enumerate(audio_file_watcher.get_batches(event_stop), start=1):
+                logging.info(f"Detected {len(paths_to_audio_files)} new or changed audio files to process.")
+
+                # The session's fetchers and aligner share the metrics, so they're reset rather than replaced
+                self.metrics.reset()
+
+                # Files are new or changed, so indexed artist and song names are of no use
+                tasks = self._create_lyric_align_tasks_from_paths(
+                    settings.data.input.artist_song_name_source,
+                    paths_to_audio_files,
+                    max_processes=settings.data.input.max_tag_reading_processes)
+
+                self._process_lyric_align_tasks(processing_session, tasks, settings, loop_wrapper, task_result_sinks, batch_number)
+        except KeyboardInterrupt:
+            logging.info("Watching stopped.")
+        finally:
+            audio_file_watcher.stop()
+            processing_session.close()
+
+
+    def _get_paths_to_process(self, settings: Settings) -> list[Path]:
+        paths_to_process_valid = []
+        for path in settings.data.input.paths_to_process:
+            if not path.exists():
+                logging.info(f"Provided path to process '{path}' not found. Skipping it.")
+                continue
+
+            paths_to_process_valid.append(path)
+
+        return paths_to_process_valid
+
+
+    def _open_processing_session(self, settings: Settings, use_output_fingerprints: bool = True) -> Optional[_ProcessingSession]:
+        """ Sets up the lyric fetchers, aligner, caches and pipeline, or returns None if there are no lyric fetchers. """
 
         ##############################################################################################################
         # Construct fetcher(s)
+        # All lyric fetchers share a single cache
+        lyric_cache = self._create_lyric_cache(settings.lyric_fetching.cache)
+
         lyric_fetchers = []
         for lyric_fetcher_type in settings.lyric_fetching.sources:
 
             # Instantiation of lyric fetchers may fail if various API tokens are missing.
-            a_lyric_fetcher = self._create_lyric_fetcher(lyric_fetcher_type, settings)
+            a_lyric_fetcher = self._create_lyric_fetcher(lyric_fetcher_type, settings, lyric_cache)
             if a_lyric_fetcher:
+                a_lyric_fetcher.log_fetch_history_summary()
                 lyric_fetchers.append(a_lyric_fetcher)
 
         # The remaining code is simpler if we eliminate the possibility of proceeding without a single valid lyric
@@ -239,124 +504,327 @@ class LyricManagerBase:
         if not lyric_fetchers:
             # If we can't obtain any lyric sources locally or remotely, we may as well cut to the chase
             logging.info("No lyric fetches selected. No lyrics to parse.")
-            return []
+            lyric_cache.close()
+            return None
 
 
         ##############################################################################################################
         # Construct aligner
         lyric_aligner = self._create_lyric_aligner(settings.lyric_alignment.method, settings)
 
-        paths_to_process_valid = []
-        for path in settings.data.input.paths_to_process:
-            if not path.exists():
-                logging.info(f"Provided path to process '{path}' not found. Skipping it.")
-                continue
+        # Design commentary:
+        # Tasks are deliberately encapsulated into multiple functionally independent stages, as opposed to undertaking
+        # all activities per-song in one giant function. Because:
+        #   - The code is easier to maintain - different types of functionality breaks differently.
+        #   - Debugging can be more easily focused on one single failing functionality
+        #   - Further encapsulation is simpler.
+        #
+        # The stages are connected as a pipeline. As soon as a task has valid sanitized lyrics, it proceeds to the
+        # alignment stage, so network-bound lyric fetching overlaps with CPU-bound lyric alignment.
+
+        # Each individual task still passes through the lyric fetchers in order of preference.
+        def fetch_and_sanitize_lyrics(task: LyricAlignTask):
+            with self.metrics.time("stage.fetch"):
+                return self._fetch_and_sanitize_lyrics(lyric_fetchers, task)
+
+        stage_fetch = PipelineStage(
+            "Fetching, validating, and sanitizing lyrics",
+            fetch_and_sanitize_lyrics,
+            settings.lyric_fetching.max_concurrent_fetches,
+            # For now we only keep (probably) valid lyrics
+            passes_on=lambda task: task.lyric_payload.validity == LyricValidity.Valid)
+
+        # Only if existing output mustn't be overwritten, do we skip re-generating up-to-date output.
+        output_fingerprints = None
+        if use_output_fingerprints and not settings.data.output.overwrite_existing_generated_files:
+            output_fingerprints = OutputFingerprints(self.path_to_working_directory / self.filename_output_fingerprints)
 
-            paths_to_process_valid.append(path)
+        # Because lyric alignment is fairly time-consuming (~0.5 minute processing per 1 minute audio), we write the
+        # results to disk in the same stage to ensure nothing is lost in case of unexpected errors.
+        def align_lyrics_and_write_to_disk(task: LyricAlignTask):
+            with self.metrics.time("stage.align"):
+                return self._align_lyrics_and_write_to_disk(task, lyric_aligner, settings, output_fingerprints)
 
-        all_audio_files = self._get_audio_files_found_in_paths(paths_to_process_valid, settings.data.input.recursively_process_paths)
+        stage_align = PipelineStage(
+            "Align lyrics",
+            align_lyrics_and_write_to_disk,
+            settings.lyric_alignment.max_concurrent_alignments)
 
-        logging.info(f"Found {len(all_audio_files)} audio files to process.")
+        pipeline = Pipeline([stage_fetch, stage_align])
 
-        tasks = self._create_lyric_align_tasks_from_paths(settings.data.input.artist_song_name_source, all_audio_files)
+        return _ProcessingSession(lyric_cache, lyric_fetchers, output_fingerprints, pipeline)
 
-        # Design commentary:
-        # Tasks are deliberately encapsulated into multiple functionally independent loops, as opposed to undertaking
-        # all activities per-song in one giant loop. Because:
-        #   - The code is easier to maintain - different types of functionality breaks differently.
-        #   - Debugging can be more easily focused on one single failing functionality
-        #   - Further encapsulation is simpler.
 
-        tasks_with_lyrics: list[LyricAlignTask] = []
-        tasks_with_lyrics_valid: list[LyricAlignTask] = []
+    def _process_lyric_align_tasks(self,
+        processing_session: _ProcessingSession,
+        tasks: list[LyricAlignTask],
+        settings: Settings,
+        loop_wrapper: Union[ProgressItemGeneratorCLI, ProgressItemGeneratorGUI],
+        task_result_sinks: Optional[list[TaskResultSinkInterface]] = None,
+        batch_number: Optional[int] = None):
+        """ Passes the tasks through the processing session's pipeline, and reports on the result of each task. """
+
+        # Results are passed on as soon as each task completes, so no task is kept once it has left the pipeline.
+        task_result_sinks = self._create_task_result_sinks(settings, batch_number=batch_number) + (task_result_sinks or [])
 
-        task: LyricAlignTask
-        for task in loop_wrapper(tasks, desc="Fetching, validating, and sanitizing lyrics"):
-            logging.info(f"======================= Getting Lyrics [{task.filename}] =======================")
-            task_with_lyrics = self._fetch_and_sanitize_lyrics(lyric_fetchers, task)
-            tasks_with_lyrics.append(task_with_lyrics)
+        amount_tasks = len(tasks)
+        tasks_completed = processing_session.pipeline.process(tasks)
+        del tasks
 
+        for task_result_sink in task_result_sinks:
+            task_result_sink.start(amount_tasks)
 
-        # For now we only keep (probably) valid lyrics
-        tasks_with_lyrics_valid = [task for task in tasks_with_lyrics if task.lyric_payload.validity == LyricValidity.Valid]
+        try:
+            for task in loop_wrapper(tasks_completed, total=amount_tasks, desc="Fetching and aligning lyrics"):
+                logging.debug(f"Finished processing: {task.filename}")
 
+                task_result = TaskResult.from_task(task)
+                for task_result_sink in task_result_sinks:
+                    task_result_sink.add(task_result)
+        finally:
+            for task_result_sink in task_result_sinks:
+                task_result_sink.finish()
 
-        # Because lyric alignment is fairly time-consuming (~0.5 minute processing per 1 minute audio), we write the
-        # results to disk in the same loop to ensure nothing is lost in case of unexpected errors.
-        for task in loop_wrapper(tasks_with_lyrics_valid, desc="Align lyrics"):
-            logging.info(f"======================= Aligning Lyrics [{task.filename}] =======================")
 
-            lyric_align_task = self._align_lyrics(task, lyric_aligner, self.path_to_working_directory)
+    def _create_task_result_sinks(self,
+        settings: Settings,
+        worker_id: str = None,
+        batch_number: int = None) -> list[TaskResultSinkInterface]:
+        """ Creates the sinks writing the results of a run to disk, all named after the time the run started.
 
-            self._write_aligned_lyrics_to_disk(lyric_align_task, self.path_to_working_directory, settings.data.output.aligned_lyrics_formatting)
+        Args:
+            worker_id: If provided, also names the files, as several workers may start simultaneously.
+            batch_number: If provided, also numbers the files, as several batches may finish within the same second.
+        """
+        filename_prefix = datetime.now().strftime("%Y-%m-%d_%H.%M.%S")
+        if worker_id:
+            filename_prefix += f" {worker_id}"
+        if batch_number is not None:
+            filename_prefix += f" Batch {batch_number}"
 
-        self._create_aligned_lyrics_report(tasks_with_lyrics, tasks_with_lyrics_valid)
+        task_result_sinks = []
 
-        logging.info("Fetching and aligning lyrics finished.")
+        report_filename = f"{filename_prefix} Alignment Report.txt"
+        task_result_sinks.append(TaskResultSinkReport(self.path_to_reports / report_filename))
 
-        return tasks_with_lyrics
+        if settings.data.output.write_results_log:
+            results_log_filename = f"{filename_prefix} Results.jsonl"
+            task_result_sinks.append(TaskResultSinkJsonLines(self.path_to_reports / results_log_filename))
 
+        metrics_filename = f"{filename_prefix} Metrics.json"
+        task_result_sinks.append(TaskResultSinkMetrics(self.path_to_reports / metrics_filename, self.metrics))
 
-    def _get_audio_files_found_in_paths(self, all_paths: list[Path], recursive: bool) -> list[Path]:
-        """ Returns all files with an .mp3 extension in the paths provided, potentially scanning in sub-folders. """
-        all_audio_files = []
+        return task_result_sinks
 
-        for path in all_paths:
-            audio_files_in_path = []
 
-            if path.is_file():
-                if self._valid_audio_extension(path.name):
-                    all_audio_files.append(path)
-                    
-            elif path.is_dir():
+    def migrate_lyric_cache(self) -> int:
+        """ Imports all lyric cache sidecar files in the working directory into the Sqlite lyric cache.
 
-                if recursive:
-                    for dirpath, dirnames, filenames in os.walk(path):
-                        audio_files_in_dir = [Path(dirpath) / filename for filename in filenames if self._valid_audio_extension(filename)]
-                        audio_files_in_path.extend(audio_files_in_dir)
-                else:
-                    audio_files_in_path = [Path(entry.path) for entry in os.scandir(path) if self._valid_audio_extension(entry.name)]
+        The sidecar files are left untouched, and may be deleted once the Sqlite cache is in use.
 
-                # os.walk() apparently returns files in an arbitrary order. For clarity/debugging, we prefer they are sorted
-                # by name 
-                audio_files_in_path = sorted(audio_files_in_path)
+        Returns:
+            The number of cached songs imported.
+        """
+        logging.info(f"Importing lyric cache sidecar files from: {self.path_to_working_directory}")
 
-                all_audio_files.extend(audio_files_in_path)
+        with LyricCacheSqlite(self.path_to_working_directory / self.filename_lyric_cache) as lyric_cache:
+            amount_imported = lyric_cache.import_sidecar_files(LyricCacheSidecarFiles(self.path_to_working_directory))
+
+        logging.info(f"Imported {amount_imported} cached songs into: {self.filename_lyric_cache}")
+
+        return amount_imported
+
+
+    def resanitize_lyric_cache(self, settings: Settings) -> int:
+        """ Re-validates and re-sanitizes all cached lyric sources of the lyric fetchers defined by the settings.
+
+        Intended to apply improved sanitization rules to previously fetched lyrics, without fetching them again. No
+        lyric source is accessed, and only sanitized lyrics which changed are written to the lyric cache.
+
+        Returns:
+            The number of songs whose sanitized lyrics changed.
+        """
+        lyric_cache = self._create_lyric_cache(settings.lyric_fetching.cache)
+
+        amount_changed = 0
+
+        try:
+            for lyric_fetcher_type in settings.lyric_fetching.sources:
+                # Local files are sanitized every time they're read, and never cached
+                if lyric_fetcher_type == LyricFetcherType.LocalFile:
+                    continue
+
+                lyric_fetcher = self._create_lyric_fetcher(lyric_fetcher_type, settings, lyric_cache)
+                if not lyric_fetcher:
+                    continue
+
+                logging.info(f"{lyric_fetcher_type.name}: Re-sanitizing cached lyrics.")
+
+                try:
+                    result = resanitize_lyric_cache(lyric_fetcher, lyric_cache)
+                finally:
+                    lyric_fetcher.close()
+
+                logging.info(f"{lyric_fetcher_type.name}: Re-sanitized {result.get_amount_total()} cached songs - "
+                             f"{result.amount_updated} updated, {result.amount_removed} no longer valid, "
+                             f"{result.amount_unchanged} unchanged, {result.amount_skipped} skipped as their artist "
+                             f"and song name are unknown, {result.amount_failed} failed.")
+
+                amount_changed += result.amount_updated + result.amount_removed
+        finally:
+            lyric_cache.close()
+
+        return amount_changed
+
+
+    def _find_lyric_align_tasks(self, settings: Settings, use_library_index: bool) -> list[LyricAlignTask]:
+        """ Creates a LyricAlignTask for every audio file found in the paths to process. """
+        library_index = None
+        if use_library_index:
+            library_index = LibraryIndex(self.path_to_working_directory / self.filename_library_index)
+
+        try:
+            all_audio_files = self._get_audio_files_found_in_paths(
+                self._get_paths_to_process(settings),
+                settings,
+                library_index)
+
+            logging.info(f"Found {len(all_audio_files)} audio files to process.")
+
+            return self._create_lyric_align_tasks_from_paths(
+                settings.data.input.artist_song_name_source,
+                all_audio_files,
+                library_index,
+                settings.data.input.max_tag_reading_processes)
+        finally:
+            if library_index:
+                library_index.close()
+
+
+    def _get_audio_files_found_in_paths(self,
+        all_paths: list[Path],
+        settings: Settings,
+        library_index: LibraryIndex = None) -> list[Path]:
+        """ Returns all files with an audio extension in the paths provided, potentially scanning in sub-folders.
+
+        Args:
+            all_paths: Paths to audio files and/or folders containing audio files.
+            settings: Determines whether to scan sub-folders, and which folders and files to exclude.
+            library_index: If provided, unchanged folders are not re-scanned.
+        """
+        library_scanner = self._create_library_scanner(settings, library_index)
+
+        return library_scanner.scan(all_paths, settings.data.input.recursively_process_paths)
+
+
+    def _create_library_scanner(self, settings: Settings, library_index: LibraryIndex = None) -> LibraryScanner:
+        scan_rules = ScanRules(
+            tuple(self.recognized_audio_filename_extensions),
+            tuple(settings.data.input.folders_to_exclude or ()),
+            tuple(settings.data.input.files_to_include or ()),
+            tuple(settings.data.input.files_to_exclude or ()))
+
+        return LibraryScanner(scan_rules, library_index, self.metrics)
 
-        return all_audio_files
-    
 
     def _create_lyric_align_tasks_from_paths(self, 
                                              audio_song_name: AudioArtistAndSongNameSource,
-                                             paths_to_audio_files: list) -> list[LyricAlignTask]:
-        """ Turns a list of paths to audio files into AudioLyricAlignTask objects """
-        lyric_align_tasks = []
+                                             paths_to_audio_files: list,
+                                             library_index: LibraryIndex = None,
+                                             max_processes: int = 1) -> list[LyricAlignTask]:
+        """ Turns a list of paths to audio files into AudioLyricAlignTask objects
 
-        if audio_song_name == AudioArtistAndSongNameSource.FileName:
+        Args:
+            audio_song_name: Determines whether the artist and song name are preferably derived from filename or tags.
+            paths_to_audio_files: Paths to audio files.
+            library_index: If provided, artist and song names are only derived for audio files that have changed.
+            max_processes: Number of processes reading tags, if there are enough audio files to read the tags of. 0
+                uses as many processes as there are CPU cores.
+        """
+        all_tasks: list[Optional[LyricAlignTask]] = []
 
-            for path_to_audio_file in paths_to_audio_files:
+        # Indices into all_tasks of audio files whose artist and song name are yet to be derived
+        indices_to_derive = []
 
-                task = LyricAlignTask.create_prefer_artist_song_name_from_filename(path_to_audio_file)
+        for path_to_audio_file in paths_to_audio_files:
+            indexed_audio_file = None
+            if library_index:
+                indexed_audio_file = library_index.get_audio_file(path_to_audio_file, audio_song_name.name)
 
-                if not task:
-                    logging.warning("Invalid LyricAlignTask - Skipping.")
-                    continue
+            if not indexed_audio_file:
+                indices_to_derive.append(len(all_tasks))
+                all_tasks.append(None)
+                continue
+
+            self.metrics.increment("library_index.audio_file_hit")
 
-                lyric_align_tasks.append(task)
+            if indexed_audio_file.artist is None or indexed_audio_file.song_name is None:
+                all_tasks.append(None)
+                continue
 
-        elif audio_song_name == AudioArtistAndSongNameSource.FileTags:
+            all_tasks.append(LyricAlignTask(
+                path_to_audio_file,
+                artist=indexed_audio_file.artist,
+                song_name=indexed_audio_file.song_name))
 
-            for path_to_audio_file in paths_to_audio_files:
+        paths_to_derive = [paths_to_audio_files[index] for index in indices_to_derive]
+        tasks_derived = self._derive_lyric_align_tasks(audio_song_name, paths_to_derive, max_processes)
 
-                task = LyricAlignTask.create_prefer_artist_song_name_from_tags(path_to_audio_file)
+        for index, path_to_audio_file, task in zip(indices_to_derive, paths_to_derive, tasks_derived):
+            all_tasks[index] = task
 
-                if not task:
-                    logging.warning("Invalid LyricAlignTask - Skipping.")
-                    continue
+            if library_index:
+                # Failing to derive an artist and song name is also indexed, to avoid repeatedly re-reading the same tags.
+                if task:
+                    indexed_audio_file = IndexedAudioFile(task.artist, task.song_name)
+                else:
+                    indexed_audio_file = IndexedAudioFile(None, None)
+
+                library_index.set_audio_file(path_to_audio_file, audio_song_name.name, indexed_audio_file)
+
+        lyric_align_tasks = []
 
-                lyric_align_tasks.append(task)
+        for task in all_tasks:
+            if not task:
+                logging.warning("Invalid LyricAlignTask - Skipping.")
+                continue
+
+            lyric_align_tasks.append(task)
 
         return lyric_align_tasks
+
+
+    def _derive_lyric_align_tasks(self,
+                                  audio_song_name: AudioArtistAndSongNameSource,
+                                  paths_to_audio_files: list[Path],
+                                  max_processes: int = 1) -> list[Optional[LyricAlignTask]]:
+        """ Creates a LyricAlignTask per audio file, or None if its artist and song name couldn't be derived.
+
+        Reading the tags of a large library is mostly spent waiting on the disk, so is spread across several processes.
+        Filenames only fall back on reading tags, so deriving artist and song names from them is done in this process.
+        """
+        max_processes = max_processes or os.cpu_count() or 1
+
+        if audio_song_name != AudioArtistAndSongNameSource.FileTags \
+                or max_processes == 1 \
+                or len(paths_to_audio_files) < self.min_audio_files_for_parallel_tag_reading:
+            tasks = []
+
+            # Either derivation may fall back on reading the audio file's tags
+            for path_to_audio_file in paths_to_audio_files:
+                with self.metrics.time("derive_artist_song_name"):
+                    tasks.append(_derive_lyric_align_task(audio_song_name, path_to_audio_file))
+
+            return tasks
+
+        logging.info(f"Reading tags of {len(paths_to_audio_files)} audio files using {max_processes} processes.")
+
+        with self.metrics.time("derive_artist_song_names_in_processes"):
+            with ProcessPoolExecutor(max_processes, initializer=_init_tag_reading_worker) as executor:
+                return list(executor.map(
+                    partial(_derive_lyric_align_task, audio_song_name),
+                    paths_to_audio_files,
+                    chunksize=64))
     
 
     def _fetch_and_sanitize_lyrics(self, lyric_fetchers, lyric_align_task: LyricAlignTask):
@@ -364,6 +832,8 @@ class LyricManagerBase:
         
         The order of the lyric fetches matters as function will accept the first valid source available.
         """
+        logging.info(f"======================= Getting Lyrics [{lyric_align_task.filename}] =======================")
+
         lyric_fetcher: LyricFetcherBase
         lyric_fetcher_type = None
         lyrics_payload: LyricPayload = None
@@ -393,7 +863,8 @@ class LyricManagerBase:
         # We must detect multipliers before sanitizing the lyrics...
         lyric_align_task.detected_multiplier = self.lyric_sanitizer.contains_multipliers(lyric_align_task.lyric_payload.text_sanitized)
 
-        lyric_align_task.lyric_text_expanded = self.lyric_expander.expand_lyrics(lyric_align_task.path_to_audio_file.stem, lyric_align_task.lyric_payload.text_sanitized)
+        with self.metrics.time("expand"):
+            lyric_align_task.lyric_text_expanded = self.lyric_expander.expand_lyrics(lyric_align_task.path_to_audio_file.stem, lyric_align_task.lyric_payload.text_sanitized)
 
         # Separate full lyric string into a list of strings
         lyric_text_expanded_split = lyric_align_task.lyric_text_expanded.splitlines()
@@ -405,12 +876,98 @@ class LyricManagerBase:
         return lyric_align_task
     
 
-    def _align_lyrics(self, lyric_align_task: LyricAlignTask, lyric_aligner: LyricAlignerInterface, file_output_path: Path):
+    def _align_lyrics_and_write_to_disk(self,
+        lyric_align_task: LyricAlignTask,
+        lyric_aligner: LyricAlignerInterface,
+        settings: Settings,
+        output_fingerprints: OutputFingerprints = None) -> LyricAlignTask:
+        """ Aligns lyrics for a given task and writes the result to disk.
+
+        Args:
+            output_fingerprints: If provided, the task is skipped if its output is up-to-date with its inputs.
+        """
+        logging.info(f"======================= Aligning Lyrics [{lyric_align_task.filename}] =======================")
+
+        path_to_aligned_lyrics_file = self._get_path_to_aligned_lyrics_file(lyric_align_task, self.path_to_working_directory)
+
+        if output_fingerprints:
+            fingerprint = self._compute_output_fingerprint(lyric_align_task, lyric_aligner, settings)
+            output_record = output_fingerprints.get(path_to_aligned_lyrics_file)
+
+            if fingerprint and output_record and output_record.fingerprint == fingerprint and path_to_aligned_lyrics_file.exists():
+                logging.info(f"Aligned lyrics output is up-to-date, skipping: {path_to_aligned_lyrics_file}")
+                self._restore_task_from_output_record(lyric_align_task, output_record)
+                lyric_align_task.release_heavy_data()
+                return lyric_align_task
+
+        lyric_align_task = self._align_lyrics(
+            lyric_align_task,
+            lyric_aligner,
+            self.path_to_working_directory,
+            settings.lyric_alignment.matching_method)
+
+        self._write_aligned_lyrics_to_disk(lyric_align_task, self.path_to_working_directory, settings.data.output.aligned_lyrics_formatting)
+
+        # The fingerprint is re-computed, as alignment may have generated the aligner output it depends on.
+        if output_fingerprints and lyric_align_task.lyrics_aligned_automated:
+            fingerprint = self._compute_output_fingerprint(lyric_align_task, lyric_aligner, settings)
+
+            if fingerprint:
+                output_record = OutputRecord(
+                    fingerprint,
+                    lyric_align_task.match_result_automated.words_total,
+                    lyric_align_task.match_result_automated.words_matched,
+                    lyric_align_task.match_result_tweaked.words_total,
+                    lyric_align_task.match_result_tweaked.words_matched,
+                    lyric_align_task.final_output_type.name)
+                output_fingerprints.set(path_to_aligned_lyrics_file, output_record)
+
+        # Only a summary of the task is required from here on, so the task doesn't hold on to memory until the run ends.
+        lyric_align_task.release_heavy_data()
+
+        return lyric_align_task
+
+
+    def _compute_output_fingerprint(self,
+        lyric_align_task: LyricAlignTask,
+        lyric_aligner: LyricAlignerInterface,
+        settings: Settings) -> str:
+        """ Returns a fingerprint of all inputs to a task's aligned lyrics output, or None if alignment is required. """
+        path_to_automated, path_to_tweaked = lyric_aligner.get_preexisting_alignment_files(lyric_align_task.path_to_audio_file)
+
+        if not path_to_automated:
+            return None
+
+        # Audio files are large, and aren't expected to change without their modification time and size changing.
+        return OutputFingerprints.compute(
+            DeveloperOptions.json_schema_version,
+            settings.data.output.aligned_lyrics_formatting.name,
+            settings.lyric_alignment.matching_method.name,
+            OutputFingerprints.compute_from_file_stat(lyric_align_task.path_to_audio_file),
+            lyric_align_task.lyric_payload.text_sanitized,
+            path_to_automated,
+            path_to_tweaked)
+
+
+    def _restore_task_from_output_record(self, lyric_align_task: LyricAlignTask, output_record: OutputRecord):
+        """ Restores the results of a previous run to a task, so the task can be reported on without re-processing it. """
+        lyric_align_task.skipped_as_up_to_date = True
+        lyric_align_task.match_result_automated = MatchResult(output_record.words_total_automated, output_record.words_matched_automated)
+        lyric_align_task.match_result_tweaked = MatchResult(output_record.words_total_tweaked, output_record.words_matched_tweaked)
+        lyric_align_task.final_output_type = LyricAlignmentOutput[output_record.final_output_type]
+
+
+    def _align_lyrics(self,
+        lyric_align_task: LyricAlignTask,
+        lyric_aligner: LyricAlignerInterface,
+        file_output_path: Path,
+        matching_method: LyricMatchingMethod = LyricMatchingMethod.Greedy):
         """ A class for a user
 
         Args:
             - lyric_align_task -- The AudioLyricAlignTask to align, relies primarily on the .lyric_text_sanitized property.
             - file_output_path -- Folder into which the output should be produced.
+            - matching_method -- How aligned words are matched back to the structured lyrics.
             - use_preexisting_files -- ??? Not sure this is even currently respected.
         Returns:
             The same AudioLyricAlignTask object. Should probably be changed to return True/False for success.
@@ -426,6 +983,7 @@ class LyricManagerBase:
 
         # ["line 1", "line 2", ... "line n"] -> "line 1 line 2 ... line n"
         lyric_align_task.lyric_text_alignment_ready = self._string_list_to_string(lyrics_alignment_ready)
+        lyric_align_task.alignment_prepared = True
 
         # The only lyric aligner we currently support accepts input via on-disk files, therefore we must write an
         # 'alignment ready' file to disk in order to 'pass it' to the aligner.
@@ -437,11 +995,12 @@ class LyricManagerBase:
         # TODO: We should eventually check if the lyric aligner can manage utf-8 files or needs strictly ASCII
         FileOperations.write_utf8_string(path_to_alignment_ready_file, lyric_align_task.lyric_text_alignment_ready)
 
-        time_aligned_lyrics: AlignerOutput = lyric_aligner.align_lyrics(
-            lyric_align_task,
-            path_to_alignment_ready_file,
-            use_preexisting=True
-        )
+        with self.metrics.time("align"):
+            time_aligned_lyrics: AlignerOutput = lyric_aligner.align_lyrics(
+                lyric_align_task,
+                path_to_alignment_ready_file,
+                use_preexisting=True
+            )
 
         # If we received an empty list, something went awry with the lyric alignment
         if not time_aligned_lyrics.automated:
@@ -451,7 +1010,8 @@ class LyricManagerBase:
         ###
         # Manual alignment-tuning
 
-        lyrics_structured_aligned, match_result_automated = self.lyric_matcher.match_aligned_lyrics_with_structured_lyrics(time_aligned_lyrics.automated, alignment_lyrics)
+        with self.metrics.time("match"):
+            lyrics_structured_aligned, match_result_automated = self.lyric_matcher.match_aligned_lyrics_with_structured_lyrics(time_aligned_lyrics.automated, alignment_lyrics, matching_method)
         logging.info(f"Successfully matched words: {match_result_automated.get_string()})")
         lyric_align_task.lyrics_aligned_automated = lyrics_structured_aligned
         lyric_align_task.match_result_automated = match_result_automated
@@ -460,7 +1020,8 @@ class LyricManagerBase:
         #lyric_align_task.lyrics_aligned = self.lyric_matcher.convert_aligmentlyrics_to_dict(lyrics_structured_aligned)
 
         if time_aligned_lyrics.tweaked:
-            lyrics_tweaked_structured_aligned, match_result_tweaked = self.lyric_matcher.match_aligned_lyrics_with_structured_lyrics(time_aligned_lyrics.tweaked, alignment_lyrics)
+            with self.metrics.time("match"):
+                lyrics_tweaked_structured_aligned, match_result_tweaked = self.lyric_matcher.match_aligned_lyrics_with_structured_lyrics(time_aligned_lyrics.tweaked, alignment_lyrics, matching_method)
             lyric_align_task.lyrics_aligned_tweaked = lyrics_tweaked_structured_aligned
             lyric_align_task.match_result_tweaked = match_result_tweaked
 
@@ -474,22 +1035,32 @@ class LyricManagerBase:
         return lyric_align_task
     
 
+    def _get_path_to_aligned_lyrics_file(self, lyric_align_task: LyricAlignTask, file_output_path: Path) -> Path:
+        path_to_json_lyrics_file = lyric_align_task.path_to_audio_file.with_suffix(".aligned_lyrics")
+
+        if file_output_path:
+            path_to_json_lyrics_file = file_output_path / path_to_json_lyrics_file.name
+
+        return path_to_json_lyrics_file
+
+
     def _write_aligned_lyrics_to_disk(self,
         lyric_align_task: LyricAlignTask,
         file_output_path: Path,
         export_readable_json: bool):
         """ Writes LyricManagers final .aligned_lyrics file (to disk) for a given task. """
         
-        path_to_json_lyrics_file = lyric_align_task.path_to_audio_file.with_suffix(".aligned_lyrics")
-
-        if file_output_path:
-            path_to_json_lyrics_file = file_output_path / path_to_json_lyrics_file.name
+        path_to_json_lyrics_file = self._get_path_to_aligned_lyrics_file(lyric_align_task, file_output_path)
 
         formatting_indent = None
         if export_readable_json == AlignedLyricsFormatting.Readable:
             formatting_indent=4
 
-        lyric_align_task.lyrics_aligned_disk_output = lyric_align_task.convert_best_aligment_lyrics_to_dict()
+        with self.metrics.time("write_aligned_lyrics"):
+            lyric_align_task.lyrics_aligned_disk_output = lyric_align_task.convert_best_aligment_lyrics_to_dict()
+
+            with open(path_to_json_lyrics_file, 'w') as file:
+                json.dump(lyric_align_task.lyrics_aligned_disk_output, file, indent=formatting_indent)
 
         # match(lyric_align_task.final_output_type):
         #     case LyricAlignmentOutput.Automated:
@@ -497,8 +1068,7 @@ class LyricManagerBase:
         #     case LyricAlignmentOutput.Tweaked:
         #         lyric_align_task.lyrics_aligned_disk_output = self.lyric_matcher.convert_aligmentlyrics_to_dict(lyric_align_task.lyrics_aligned_tweaked)
 
-        with open(path_to_json_lyrics_file, 'w') as file:
-            json.dump(lyric_align_task.lyrics_aligned_disk_output, file, indent=formatting_indent)
+        lyric_align_task.aligned_lyrics_written = bool(lyric_align_task.lyrics_aligned_disk_output)
 
         logging.info(f"Wrote aligned lyrics file: {path_to_json_lyrics_file}")
 
@@ -508,68 +1078,3 @@ class LyricManagerBase:
         string = ' '.join(string_list)
         return ' '.join(string.split())
     
-
-    def _create_aligned_lyrics_report(self, all_tasks: list[LyricAlignTask], tasks_valid: list[LyricAlignTask]):
-        """ Creates a text with a lyric alignment report into the /reports folder. """
-
-        # Three-Step aligned lyrics report creation:
-        # 1. Calculate all the metrics that go into the report.
-        # 2. Format all the text to go into the report.
-        # 3. Write the report to a file
-
-        # _________________________________ ____ _ _ _
-        # ___ Step 1: Calculate all metrics
-        amount_tasks_total = len(all_tasks)
-        amount_tasks_valid = len(tasks_valid)
-
-        stat_valid_out_of_total = get_percentage_and_amount_string(amount_tasks_valid, amount_tasks_total)
-
-        songs_match_rate_100 = [task for task in tasks_valid if task.match_result_automated.match_percentage == 100.0]
-        songs_match_rate_90 = [task for task in tasks_valid if task.match_result_automated.match_percentage >= 90.0]
-
-        amount_songs_match_rate_100 = len(songs_match_rate_100)
-        amount_songs_match_rate_90 = len(songs_match_rate_90)
-
-        stat_match_rate_100_out_of_valid = get_percentage_and_amount_string(amount_songs_match_rate_100, amount_tasks_valid)
-        stat_match_rate_90_out_of_valid = get_percentage_and_amount_string(amount_songs_match_rate_90, amount_tasks_valid)
-
-        # Sources
-
-
-
-        # _________________________________ ____ _ _ _
-        # ___ Step 2: Format the report text
-        lines_to_write = []
-        lines_to_write.append("============------------ Executive Summary ------------============")
-        lines_to_write.append(f"* Songs with validated lyrics       {stat_valid_out_of_total:>30}")
-        lines_to_write.append(f"* Songs with 100% matched lyrics    {stat_match_rate_100_out_of_valid:>30}")
-        lines_to_write.append(f"* Songs with >90% matched lyrics    {stat_match_rate_90_out_of_valid:>30}")
-
-        lines_to_write.append("")
-        lines_to_write.append("============------------ - - - - - - - - - ------------============")
-        lines_to_write.append("")
-
-        lines_to_write.append("")
-        lines_to_write.append(f"============------------ Songs with validated Lyrics {stat_valid_out_of_total} ------------============")
-
-        for task in tasks_valid:
-            lines_to_write.append(f"{task.path_to_audio_file.stem[0:80] : <80} | {task.match_result_automated.get_string()}")
-
-        lines_to_write.append("")
-        lines_to_write.append(f"============------------ All songs ( {amount_tasks_total} ) ------------============")
-
-        for task in all_tasks:
-            lines_to_write.append(f"{task.path_to_audio_file.stem[0:80] : <80} | {task.lyric_payload.validity} | Mult: {task.detected_multiplier}")
-
-        text_to_write = "\n".join(lines_to_write)
-
-
-        # _________________________________ ____ _ _ _
-        # ___ Step 3: Write the report to a file
-        #Path.mkdir(self.path_to_reports, exist_ok=True)
-
-        now = datetime.now()
-        report_filename = now.strftime("%Y-%m-%d_%H.%M.%S Alignment Report.txt")
-        report_file = self.path_to_reports / report_filename
-
-        report_file.write_text(text_to_write, encoding="utf-8")
\ No newline at end of file
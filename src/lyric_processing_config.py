@@ -10,6 +10,8 @@ from omegaconf import MISSING
 # 1st Party
 from .lyric.dataclasses_and_types import LyricFetcherType
 from .lyric.dataclasses_and_types import LyricAlignerType
+from .lyric.dataclasses_and_types import LyricCacheType
+from .lyric.dataclasses_and_types import LyricMatchingMethod
 
 from .components import AudioArtistAndSongNameSource
 
@@ -33,6 +35,14 @@ class SettingsLyricFetching():
 
     google_custom_search_api_key: Optional[str] = None
     google_custom_search_engine_id: Optional[str] = None
+    # The free Google Custom Search plan allows 100 queries per day
+    google_custom_search_daily_quota: int = 100
+
+    # Fetching lyrics is mostly spent waiting on remote sources, so several songs are fetched simultaneously.
+    max_concurrent_fetches: int = 8
+
+    # Where fetched lyrics are cached. Sidecar files can be imported into Sqlite via the '--migrate-lyric-cache' option.
+    cache: LyricCacheType = LyricCacheType.SidecarFiles
 
 @dataclass
 class SettingsLyricAlignment():
@@ -42,16 +52,41 @@ class SettingsLyricAlignment():
 
     NUSAutoLyrixAlign_working_directory: Optional[Path] = field(default_factory=Path)
 
+    # Each alignment executes in its own sub-directory of NUSAutoLyrixAlign_working_directory, allowing several
+    # alignments to execute simultaneously.
+    max_concurrent_alignments: int = 1
+
+    # Aligner output is also cached by the content of the audio and lyrics, so it's re-used for renamed, moved or
+    # duplicate audio files.
+    use_alignment_cache: bool = True
+
+    # How aligned words are matched back to the structured lyrics
+    matching_method: LyricMatchingMethod = LyricMatchingMethod.Greedy
+
 @dataclass
 class SettingsDataInput():
     paths_to_process: List[Path] = field(default_factory=list)
 
-    folders_to_exclude: Optional[List] = field(default_factory=list)
+    # Glob patterns, or regular expressions prefixed with 're:', see ScanRules
+    folders_to_exclude: Optional[List[str]] = field(default_factory=list)
+    files_to_include: Optional[List[str]] = field(default_factory=list)
+    files_to_exclude: Optional[List[str]] = field(default_factory=list)
 
     recursively_process_paths: bool = False
 
     artist_song_name_source: AudioArtistAndSongNameSource = AudioArtistAndSongNameSource.FileName
 
+    # Tags of many audio files are read by several processes. 0 uses as many processes as there are CPU cores.
+    max_tag_reading_processes: int = 0
+
+    # Caches directory listings and audio file tags in the working directory, to speed up re-scanning the same folders.
+    use_library_index: bool = True
+
+    # When watching folders ('--watch'), new or changed audio files are processed once no further changes have
+    # occurred for this long. Without the optional watchdog package, folders are scanned for changes at an interval.
+    watch_debounce_seconds: float = 5.0
+    watch_polling_interval_seconds: float = 30.0
+
 
 
 @dataclass
@@ -66,8 +101,18 @@ class SettingsDataOutput():
 
     aligned_lyrics_formatting: AlignedLyricsFormatting = AlignedLyricsFormatting.Readable
 
+    # If False, songs whose aligned lyrics output is up-to-date with its inputs aren't processed again
     overwrite_existing_generated_files: bool = True
 
+    # If True, the result of each song is additionally logged as a line of Json next to the report
+    write_results_log: bool = False
+
+
+
+@dataclass
+class SettingsJobQueue():
+    # A worker's lease on a task expires unless renewed within this time, after which other workers may reclaim it
+    lease_seconds: float = 120.0
 
 
 @dataclass
@@ -84,4 +129,9 @@ class Settings():
     lyric_alignment: SettingsLyricAlignment = field(default_factory=SettingsLyricAlignment)
 
     data: SettingsData = field(default_factory=SettingsData)
+
+    job_queue: SettingsJobQueue = field(default_factory=SettingsJobQueue)
+
+    # If True, LyricManager checks GitHub for a newer release in the background, at most once a day
+    check_for_new_version: bool = True
     
\ No newline at end of file
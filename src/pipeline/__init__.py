@@ -0,0 +1,2 @@
+from .pipeline import Pipeline
+from .pipeline_stage import PipelineStage
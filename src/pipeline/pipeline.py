@@ -0,0 +1,101 @@
+# Python
+from __future__ import annotations
+import queue
+import threading
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+
+# 3rd Party
+
+
+# 1st Party
+from .pipeline_stage import PipelineStage
+
+if TYPE_CHECKING:
+    from ..lyric.dataclasses_and_types import LyricAlignTask
+
+
+class Pipeline():
+    """ Streams LyricAlignTasks through a series of PipelineStages.
+
+    Rather than processing every task in one stage before starting on the next stage, a task proceeds to the next
+    stage as soon as it has been processed. Stages therefore overlap, e.g., network-bound lyric fetching of one song
+    occurs while CPU-bound lyric alignment of another song is under way.
+    """
+
+    def __init__(self, stages: list[PipelineStage]):
+        self.stages = stages
+
+        self.queue_completed = queue.Queue()
+        self.event_cancelled = threading.Event()
+
+
+    def process(self,
+                lyric_align_tasks: Iterable[LyricAlignTask],
+                max_tasks_in_flight: Optional[int] = None) -> Iterator[LyricAlignTask]:
+        """ Yields each task once it has left the pipeline, in whichever order tasks complete.
+
+        A task leaves the pipeline once it has been processed by the final stage, or when a stage decides it shouldn't
+        proceed any further. If any stage raises an exception, the remaining tasks are discarded and the exception is
+        re-raised here.
+
+        Args:
+            lyric_align_tasks: The tasks to process. May be a generator, which is only advanced as tasks are let into
+                the pipeline.
+            max_tasks_in_flight: If provided, a task is only let into the pipeline while fewer tasks than this are in
+                it, rather than all tasks being let in at once.
+        """
+        iterator_tasks = iter(lyric_align_tasks)
+
+        # From here on, each task is only referenced until it has left the pipeline, so that the caller may release
+        # its own references to completed tasks.
+        del lyric_align_tasks
+
+        task = next(iterator_tasks, None)
+        if task is None:
+            return
+
+        self.event_cancelled.clear()
+
+        for stage in self.stages:
+            stage.start(self._forward_task, self.queue_completed.put, self.event_cancelled)
+
+        completed_normally = False
+
+        amount_tasks_in_flight = 0
+
+        try:
+            while True:
+                while task is not None and (max_tasks_in_flight is None or amount_tasks_in_flight < max_tasks_in_flight):
+                    self.stages[0].queue_input.put(task)
+                    amount_tasks_in_flight += 1
+                    task = next(iterator_tasks, None)
+
+                if amount_tasks_in_flight == 0:
+                    break
+
+                # Every task leaves the pipeline exactly once, either processed or as an exception
+                task_or_exception = self.queue_completed.get()
+                amount_tasks_in_flight -= 1
+
+                if isinstance(task_or_exception, Exception):
+                    raise task_or_exception
+
+                yield task_or_exception
+
+            completed_normally = True
+        finally:
+            if not completed_normally:
+                self.event_cancelled.set()
+
+            # Abandoned worker threads are daemons, and won't prevent LyricManager from exiting
+            for stage in self.stages:
+                stage.stop(wait=completed_normally)
+
+
+    def _forward_task(self, stage: PipelineStage, task: LyricAlignTask):
+        index_next_stage = self.stages.index(stage) + 1
+
+        if index_next_stage < len(self.stages):
+            self.stages[index_next_stage].queue_input.put(task)
+        else:
+            self.queue_completed.put(task)
@@ -0,0 +1,101 @@
+# Python
+from __future__ import annotations
+import queue
+import logging
+import threading
+from typing import TYPE_CHECKING, Callable, Optional
+
+# 3rd Party
+
+
+# 1st Party
+
+if TYPE_CHECKING:
+    from ..lyric.dataclasses_and_types import LyricAlignTask
+
+
+class PipelineStage():
+    """ A single, functionally independent, stage of a Pipeline.
+
+    Each stage drains its own input queue using a bounded number of worker threads. A processed task is either passed
+    on to the next stage, or - if it's the last stage or the task shouldn't proceed - handed back to the Pipeline as
+    completed.
+    """
+
+    # Placed in the input queue once per worker thread to stop it.
+    _sentinel = object()
+
+    def __init__(self,
+                 description: str,
+                 function: Callable[[LyricAlignTask], LyricAlignTask],
+                 max_concurrent_tasks: int = 1,
+                 passes_on: Optional[Callable[[LyricAlignTask], bool]] = None):
+        """
+        Args:
+            description: Human-readable description of the stage, also used to name its worker threads.
+            function: Accepts a single LyricAlignTask and returns it, processed.
+            max_concurrent_tasks: Maximum number of tasks this stage processes simultaneously.
+            passes_on: Determines whether a processed task proceeds to the next stage. If None, all tasks proceed.
+        """
+        self.description = description
+        self.function = function
+        self.max_concurrent_tasks = max(1, max_concurrent_tasks)
+        self.passes_on = passes_on
+
+        self.queue_input = queue.Queue()
+        self.worker_threads: list[threading.Thread] = []
+
+
+    def start(self, forward_task: Callable[[PipelineStage, LyricAlignTask], None],
+              complete_task: Callable[[object], None],
+              event_cancelled: threading.Event):
+        """ Starts the worker threads of this stage.
+
+        Args:
+            forward_task: Hands a processed task to whichever stage follows this one.
+            complete_task: Hands a task, or an exception raised while processing it, back to the Pipeline.
+            event_cancelled: If set, remaining tasks are discarded rather than processed.
+        """
+        for index in range(self.max_concurrent_tasks):
+            worker_thread = threading.Thread(
+                target=self._work,
+                args=(forward_task, complete_task, event_cancelled),
+                name=f"{self.description} {index}",
+                daemon=True)
+            worker_thread.start()
+            self.worker_threads.append(worker_thread)
+
+
+    def stop(self, wait: bool):
+        """ Stops the worker threads once they've drained the tasks currently in the input queue. """
+        for _ in self.worker_threads:
+            self.queue_input.put(self._sentinel)
+
+        if wait:
+            for worker_thread in self.worker_threads:
+                worker_thread.join()
+
+        self.worker_threads = []
+
+
+    def _work(self, forward_task, complete_task, event_cancelled: threading.Event):
+        while True:
+            task = self.queue_input.get()
+
+            if task is self._sentinel:
+                return
+
+            if event_cancelled.is_set():
+                continue
+
+            try:
+                task = self.function(task)
+            except Exception as exception:
+                logging.exception(f"Unexpected error during '{self.description}'.")
+                complete_task(exception)
+                continue
+
+            if self.passes_on is None or self.passes_on(task):
+                forward_task(self, task)
+            else:
+                complete_task(task)
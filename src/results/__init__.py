@@ -0,0 +1,7 @@
+from .task_result import TaskResult
+
+from .task_result_sink import TaskResultSinkInterface
+from .task_result_sink_report import TaskResultSinkReport
+from .task_result_sink_json_lines import TaskResultSinkJsonLines
+from .task_result_sink_metrics import TaskResultSinkMetrics
+from .task_result_sink_job_queue import TaskResultSinkJobQueue
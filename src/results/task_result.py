@@ -0,0 +1,61 @@
+# Python
+from __future__ import annotations
+from pathlib import Path
+from dataclasses import dataclass, field
+from typing import Optional
+
+# 3rd Party
+
+
+# 1st Party
+from ..lyric.dataclasses_and_types import LyricAlignTask
+from ..lyric.dataclasses_and_types import LyricFetcherType
+from ..lyric.dataclasses_and_types import LyricValidity
+from ..lyric.dataclasses_and_types.lyric_match import MatchResult
+
+
+@dataclass(slots=True)
+class TaskResult:
+    """ A summary of a completed LyricAlignTask, holding only what's needed to report on its result. """
+    path_to_audio_file: Path
+    filename: str                                       = ""
+    validity: LyricValidity                             = LyricValidity.NotSet
+    lyric_fetcher_type_source: Optional[LyricFetcherType] = None
+    detected_multiplier: bool                           = False
+    match_result_automated: MatchResult                 = field(default_factory=MatchResult)
+    match_result_tweaked: MatchResult                   = field(default_factory=MatchResult)
+    skipped_as_up_to_date: bool                         = False
+    description: str                                    = ""    # User-friendly description of the result
+
+
+    @classmethod
+    def from_task(cls, lyric_align_task: LyricAlignTask) -> TaskResult:
+        return cls(
+            path_to_audio_file=lyric_align_task.path_to_audio_file,
+            filename=lyric_align_task.filename,
+            validity=lyric_align_task.lyric_payload.validity,
+            lyric_fetcher_type_source=lyric_align_task.lyric_fetcher_type_source,
+            detected_multiplier=lyric_align_task.detected_multiplier,
+            match_result_automated=lyric_align_task.match_result_automated,
+            match_result_tweaked=lyric_align_task.match_result_tweaked,
+            skipped_as_up_to_date=lyric_align_task.skipped_as_up_to_date,
+            description=lyric_align_task.get_user_friendly_result())
+
+
+    def to_dict(self) -> dict:
+        """ Converts the result into a dict ready for Json conversion. """
+        return {
+            "path_to_audio_file": str(self.path_to_audio_file),
+            "filename": self.filename,
+            "validity": self.validity.name,
+            "lyric_source": self.lyric_fetcher_type_source.name if self.lyric_fetcher_type_source else None,
+            "detected_multiplier": self.detected_multiplier,
+            "words_total_automated": self.match_result_automated.words_total,
+            "words_matched_automated": self.match_result_automated.words_matched,
+            "match_percentage_automated": self.match_result_automated.match_percentage,
+            "words_total_tweaked": self.match_result_tweaked.words_total,
+            "words_matched_tweaked": self.match_result_tweaked.words_matched,
+            "match_percentage_tweaked": self.match_result_tweaked.match_percentage,
+            "skipped_as_up_to_date": self.skipped_as_up_to_date,
+            "description": self.description,
+        }
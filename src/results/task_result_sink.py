@@ -0,0 +1,31 @@
+# Python
+from abc import ABC, abstractmethod
+
+# 3rd Party
+
+
+# 1st Party
+from .task_result import TaskResult
+
+
+class TaskResultSinkInterface(ABC):
+    """ Consumes the result of each task as soon as it completes, so results needn't be held until a run has finished.
+
+    A sink is used for a single run: start() is called before the first result, add() once per completed task in
+    order of completion, and finish() once the run has ended - even if it ended due to an error, in which case the
+    sink has only received the results of tasks completed until then.
+
+    All calls are made from the thread executing the run.
+    """
+
+    def start(self, amount_tasks: int):
+        pass
+
+
+    @abstractmethod
+    def add(self, task_result: TaskResult):
+        raise NotImplementedError()
+
+
+    def finish(self):
+        pass
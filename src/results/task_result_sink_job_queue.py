@@ -0,0 +1,24 @@
+# Python
+
+
+# 3rd Party
+
+
+# 1st Party
+from ..components import JobQueue
+from .task_result import TaskResult
+from .task_result_sink import TaskResultSinkInterface
+
+
+class TaskResultSinkJobQueue(TaskResultSinkInterface):
+    """ Marks the job of each completed task as done in a job queue, whatever its result, so it isn't claimed again.
+
+    Jobs are keyed by the path to the task's audio file.
+    """
+
+    def __init__(self, job_queue: JobQueue):
+        self.job_queue = job_queue
+
+
+    def add(self, task_result: TaskResult):
+        self.job_queue.complete(JobQueue.get_key(str(task_result.path_to_audio_file)))
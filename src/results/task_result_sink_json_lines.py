@@ -0,0 +1,37 @@
+# Python
+import json
+from pathlib import Path
+
+# 3rd Party
+
+
+# 1st Party
+from .task_result import TaskResult
+from .task_result_sink import TaskResultSinkInterface
+
+
+class TaskResultSinkJsonLines(TaskResultSinkInterface):
+    """ Appends each task result as a single line of Json to a results log.
+
+    Each line is flushed as soon as it's written, so the log can be followed while a run is still in progress, and
+    holds every result completed until then should the run end unexpectedly.
+    """
+
+    def __init__(self, path_to_results_log: Path):
+        self.path_to_results_log = path_to_results_log
+        self.file = None
+
+
+    def start(self, amount_tasks: int):
+        self.file = open(self.path_to_results_log, "w", encoding="utf-8")
+
+
+    def add(self, task_result: TaskResult):
+        self.file.write(json.dumps(task_result.to_dict(), ensure_ascii=False) + "\n")
+        self.file.flush()
+
+
+    def finish(self):
+        if self.file:
+            self.file.close()
+            self.file = None
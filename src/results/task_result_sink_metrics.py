@@ -0,0 +1,33 @@
+# Python
+from pathlib import Path
+
+# 3rd Party
+
+
+# 1st Party
+from ..components import Metrics
+from .task_result import TaskResult
+from .task_result_sink import TaskResultSinkInterface
+
+
+class TaskResultSinkMetrics(TaskResultSinkInterface):
+    """ Counts task results by outcome, and writes all metrics collected during the run to a Json file once finished. """
+
+    def __init__(self, path_to_metrics: Path, metrics: Metrics):
+        self.path_to_metrics = path_to_metrics
+        self.metrics = metrics
+
+
+    def start(self, amount_tasks: int):
+        self.metrics.increment("tasks.total", amount_tasks)
+
+
+    def add(self, task_result: TaskResult):
+        self.metrics.increment(f"tasks.validity.{task_result.validity.name}")
+
+        if task_result.skipped_as_up_to_date:
+            self.metrics.increment("tasks.skipped_as_up_to_date")
+
+
+    def finish(self):
+        self.metrics.write_json(self.path_to_metrics)
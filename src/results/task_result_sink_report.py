@@ -0,0 +1,100 @@
+# Python
+import shutil
+import tempfile
+from pathlib import Path
+
+# 3rd Party
+
+
+# 1st Party
+from .task_result import TaskResult
+from .task_result_sink import TaskResultSinkInterface
+from ..components import get_percentage_and_amount_string
+from ..lyric.dataclasses_and_types import LyricValidity
+
+
+class TaskResultSinkReport(TaskResultSinkInterface):
+    """ Writes the alignment report, which tracks the quality of aligned lyrics over time.
+
+    The report opens with an executive summary, which can't be known until the run has finished. Hence, the song
+    listings are streamed to temporary files as results arrive, and only the summary's counters are kept in memory.
+    Once finished, the summary and listings are assembled into the report.
+
+    Songs are listed in the order in which they completed.
+    """
+
+    def __init__(self, path_to_report: Path):
+        self.path_to_report = path_to_report
+
+        self.file_songs_valid = None
+        self.file_songs_all = None
+
+        self.amount_tasks_total = 0
+        self.amount_tasks_valid = 0
+        self.amount_songs_match_rate_100 = 0
+        self.amount_songs_match_rate_90 = 0
+
+
+    def start(self, amount_tasks: int):
+        self.file_songs_valid = tempfile.TemporaryFile("w+", encoding="utf-8")
+        self.file_songs_all = tempfile.TemporaryFile("w+", encoding="utf-8")
+
+
+    def add(self, task_result: TaskResult):
+        song_name = task_result.path_to_audio_file.stem[0:80]
+
+        self.amount_tasks_total += 1
+        self.file_songs_all.write(f"\n{song_name : <80} | {task_result.validity} | Mult: {task_result.detected_multiplier}")
+
+        if task_result.validity != LyricValidity.Valid:
+            return
+
+        self.amount_tasks_valid += 1
+
+        match_percentage = task_result.match_result_automated.match_percentage
+        if match_percentage == 100.0:
+            self.amount_songs_match_rate_100 += 1
+        if match_percentage >= 90.0:
+            self.amount_songs_match_rate_90 += 1
+
+        self.file_songs_valid.write(f"\n{song_name : <80} | {task_result.match_result_automated.get_string()}")
+
+
+    def finish(self):
+        if not self.file_songs_all:
+            return
+
+        stat_valid_out_of_total = get_percentage_and_amount_string(self.amount_tasks_valid, self.amount_tasks_total)
+        stat_match_rate_100_out_of_valid = get_percentage_and_amount_string(self.amount_songs_match_rate_100, self.amount_tasks_valid)
+        stat_match_rate_90_out_of_valid = get_percentage_and_amount_string(self.amount_songs_match_rate_90, self.amount_tasks_valid)
+
+        lines_summary = []
+        lines_summary.append("============------------ Executive Summary ------------============")
+        lines_summary.append(f"* Songs with validated lyrics       {stat_valid_out_of_total:>30}")
+        lines_summary.append(f"* Songs with 100% matched lyrics    {stat_match_rate_100_out_of_valid:>30}")
+        lines_summary.append(f"* Songs with >90% matched lyrics    {stat_match_rate_90_out_of_valid:>30}")
+
+        lines_summary.append("")
+        lines_summary.append("============------------ - - - - - - - - - ------------============")
+        lines_summary.append("")
+
+        lines_summary.append("")
+        lines_summary.append(f"============------------ Songs with validated Lyrics {stat_valid_out_of_total} ------------============")
+
+        # Each listed song is preceded by a line break, so the listings are joined exactly like the summary lines.
+        with open(self.path_to_report, "w", encoding="utf-8") as file_report:
+            file_report.write("\n".join(lines_summary))
+
+            self.file_songs_valid.seek(0)
+            shutil.copyfileobj(self.file_songs_valid, file_report)
+
+            file_report.write("\n")
+            file_report.write(f"\n============------------ All songs ( {self.amount_tasks_total} ) ------------============")
+
+            self.file_songs_all.seek(0)
+            shutil.copyfileobj(self.file_songs_all, file_report)
+
+        self.file_songs_valid.close()
+        self.file_songs_all.close()
+        self.file_songs_valid = None
+        self.file_songs_all = None
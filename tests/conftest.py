@@ -0,0 +1,13 @@
+# Python
+import sys
+from pathlib import Path
+
+# 3rd Party
+
+
+# 1st Party
+
+
+# LyricManager is run from the repository root rather than installed, so the tests import it the same way, e.g.
+# 'from src.components import JobQueue', regardless of which directory pytest is run from.
+sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -0,0 +1,64 @@
+# Python
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.lyric.aligners import AlignmentCache
+
+
+@pytest.fixture
+def path_to_audio_file(tmp_path):
+    path_to_audio_file = tmp_path / "Artist - Song.mp3"
+    path_to_audio_file.write_bytes(b"\x01\x02\x03" * 1000)
+    return path_to_audio_file
+
+
+def test_key_depends_on_audio_and_lyrics(tmp_path, path_to_audio_file):
+    key = AlignmentCache.compute_key(path_to_audio_file, "hello world")
+
+    path_to_renamed_audio_file = tmp_path / "Artist - Renamed Song.mp3"
+    path_to_renamed_audio_file.write_bytes(path_to_audio_file.read_bytes())
+
+    path_to_other_audio_file = tmp_path / "Artist - Other Song.mp3"
+    path_to_other_audio_file.write_bytes(b"\x04\x05\x06" * 1000)
+
+    assert AlignmentCache.compute_key(path_to_renamed_audio_file, "hello world") == key
+    assert AlignmentCache.compute_key(path_to_audio_file, "hello there world") != key
+    assert AlignmentCache.compute_key(path_to_other_audio_file, "hello world") != key
+
+
+def test_key_of_missing_audio_file_is_none(tmp_path):
+    assert AlignmentCache.compute_key(tmp_path / "missing.mp3", "hello world") is None
+
+
+def test_added_output_is_found_by_key_and_extension(tmp_path, path_to_audio_file):
+    alignment_cache = AlignmentCache(tmp_path / "alignment_cache")
+    key = AlignmentCache.compute_key(path_to_audio_file, "hello world")
+
+    assert alignment_cache.get(key, ".nusalaoffline") is None
+
+    path_to_aligner_output = tmp_path / "Artist - Song.nusalaoffline"
+    path_to_aligner_output.write_text("0.0 0.5 HELLO\n0.5 1.0 WORLD\n")
+    alignment_cache.add(key, ".nusalaoffline", path_to_aligner_output)
+
+    path_to_cached_output = alignment_cache.get(key, ".nusalaoffline")
+    assert path_to_cached_output.read_text() == path_to_aligner_output.read_text()
+    assert path_to_cached_output.parent.name == key[:2]
+
+    assert alignment_cache.get(key, ".otheraligner") is None
+
+
+def test_adding_output_again_replaces_it(tmp_path, path_to_audio_file):
+    alignment_cache = AlignmentCache(tmp_path / "alignment_cache")
+    key = AlignmentCache.compute_key(path_to_audio_file, "hello world")
+
+    path_to_aligner_output = tmp_path / "output.nusalaoffline"
+    for text in ("0.0 0.5 HELLO\n", "0.0 0.6 HELLO\n"):
+        path_to_aligner_output.write_text(text)
+        alignment_cache.add(key, ".nusalaoffline", path_to_aligner_output)
+
+    assert alignment_cache.get(key, ".nusalaoffline").read_text() == "0.0 0.6 HELLO\n"
+
+    # No temporary files are left behind
+    assert [path.name for path in (tmp_path / "alignment_cache" / key[:2]).iterdir()] == [f"{key}.nusalaoffline"]
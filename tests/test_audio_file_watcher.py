@@ -0,0 +1,97 @@
+# Python
+import queue
+import threading
+from pathlib import Path
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.components import AudioFileWatcherPolling
+from src.components import LibraryScanner
+from src.components import audio_file_watcher
+
+
+class _FakeClock():
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _FakeEventStream():
+    """ Stands in for the watcher's queue, reporting a change every interval_seconds of fake time.
+
+    Once all changes have been reported, get() times out timeouts_until_stop times, and then stops the watcher.
+    """
+
+    def __init__(self, clock: _FakeClock, paths_changed: list[Path], interval_seconds: float, event_stop: threading.Event,
+                 timeouts_until_stop: int = 0):
+        self.clock = clock
+        self.paths_changed = list(paths_changed)
+        self.interval_seconds = interval_seconds
+        self.event_stop = event_stop
+        self.timeouts_until_stop = timeouts_until_stop
+
+    def get(self, timeout: float) -> Path:
+        if self.paths_changed:
+            self.clock.now += self.interval_seconds
+            return self.paths_changed.pop(0)
+
+        if self.timeouts_until_stop <= 0:
+            self.event_stop.set()
+        else:
+            self.clock.now += timeout
+            self.timeouts_until_stop -= 1
+
+        raise queue.Empty()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = _FakeClock()
+    monkeypatch.setattr(audio_file_watcher, "monotonic", clock)
+    return clock
+
+
+def _create_audio_files(path_to_folder: Path, amount: int) -> list[Path]:
+    paths_to_audio_files = [path_to_folder / f"Artist - Song {index:02}.mp3" for index in range(amount)]
+    for path_to_audio_file in paths_to_audio_files:
+        path_to_audio_file.touch()
+
+    return paths_to_audio_files
+
+
+def test_steady_changes_are_batched_by_max_batch_delay(tmp_path, clock):
+    watcher = AudioFileWatcherPolling([tmp_path], recursive=True, library_scanner=LibraryScanner(), debounce_seconds=1.0)
+    event_stop = threading.Event()
+
+    # A change every 0.25 seconds never lets the 0.5 second timeout of get() elapse, nor the changes settle
+    paths_to_audio_files = _create_audio_files(tmp_path, 100)
+    watcher.queue_changed = _FakeEventStream(clock, paths_to_audio_files, 0.25, event_stop, timeouts_until_stop=10)
+
+    batches = list(watcher.get_batches(event_stop))
+
+    # Batches are reported once their oldest change is max_batch_delay_seconds, i.e. 10 seconds, old
+    assert [len(batch) for batch in batches] == [41, 41, 18]
+    assert [path for batch in batches for path in batch] == paths_to_audio_files
+
+
+def test_changes_are_batched_once_settled(tmp_path, clock):
+    watcher = AudioFileWatcherPolling([tmp_path], recursive=True, library_scanner=LibraryScanner(), debounce_seconds=1.0)
+    event_stop = threading.Event()
+
+    paths_to_audio_files = _create_audio_files(tmp_path, 3)
+    (tmp_path / "cover.jpg").touch()
+    watcher.queue_changed = _FakeEventStream(clock, paths_to_audio_files + [tmp_path / "cover.jpg"], 0.25, event_stop,
+                                             timeouts_until_stop=1)
+
+    # Stopped before the changes have settled
+    assert list(watcher.get_batches(event_stop)) == []
+
+    event_stop.clear()
+    watcher.queue_changed = _FakeEventStream(clock, paths_to_audio_files + [tmp_path / "cover.jpg"], 0.25, event_stop,
+                                             timeouts_until_stop=2)
+
+    assert list(watcher.get_batches(event_stop)) == [paths_to_audio_files]
@@ -0,0 +1,96 @@
+# Python
+import random
+from pathlib import Path
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.components.audio_fingerprint import compute_audio_fingerprint
+
+
+def _create_audio_data(size: int, seed: int = 0) -> bytes:
+    return random.Random(seed).randbytes(size)
+
+
+def _create_id3v2_tag(title: str, padding: int = 0) -> bytes:
+    data = b"\x00" + title.encode("latin1")
+    body = b"TIT2" + len(data).to_bytes(4, "big") + b"\x00\x00" + data + b"\x00" * padding
+    size = len(body)
+    return b"ID3\x03\x00\x00" + bytes([(size >> 21) & 0x7f, (size >> 14) & 0x7f, (size >> 7) & 0x7f, size & 0x7f]) + body
+
+
+def _create_id3v1_tag(title: str) -> bytes:
+    return b"TAG" + title.encode("latin1").ljust(30, b"\x00") + b"\x00" * 95
+
+
+@pytest.mark.parametrize("size", [0, 1000, 1_000_000])
+def test_renamed_or_moved_file_has_same_fingerprint(tmp_path, size):
+    audio_data = _create_audio_data(size)
+
+    path_to_audio_file = tmp_path / "Artist - Song.mp3"
+    path_to_audio_file.write_bytes(audio_data)
+
+    (tmp_path / "album").mkdir()
+    path_to_moved_audio_file = tmp_path / "album" / "Artist - Another Name.mp3"
+    path_to_moved_audio_file.write_bytes(audio_data)
+
+    assert compute_audio_fingerprint(path_to_audio_file) == compute_audio_fingerprint(path_to_moved_audio_file)
+
+
+@pytest.mark.parametrize("size", [1000, 1_000_000])
+def test_retagged_mp3_has_same_fingerprint(tmp_path, size):
+    audio_data = _create_audio_data(size)
+
+    path_to_audio_file = tmp_path / "untagged.mp3"
+    path_to_audio_file.write_bytes(audio_data)
+
+    path_to_tagged_audio_file = tmp_path / "tagged.mp3"
+    path_to_tagged_audio_file.write_bytes(_create_id3v2_tag("Title") + audio_data + _create_id3v1_tag("Title"))
+
+    path_to_retagged_audio_file = tmp_path / "retagged.mp3"
+    path_to_retagged_audio_file.write_bytes(
+        _create_id3v2_tag("Corrected title", padding=2048) + audio_data + _create_id3v1_tag("Corrected title"))
+
+    fingerprint = compute_audio_fingerprint(path_to_audio_file)
+    assert compute_audio_fingerprint(path_to_tagged_audio_file) == fingerprint
+    assert compute_audio_fingerprint(path_to_retagged_audio_file) == fingerprint
+
+
+def test_tags_of_other_formats_are_fingerprinted(tmp_path):
+    audio_data = _create_audio_data(1000)
+
+    path_to_audio_file = tmp_path / "untagged.wav"
+    path_to_audio_file.write_bytes(audio_data)
+
+    path_to_tagged_audio_file = tmp_path / "tagged.wav"
+    path_to_tagged_audio_file.write_bytes(_create_id3v2_tag("Title") + audio_data)
+
+    assert compute_audio_fingerprint(path_to_audio_file) != compute_audio_fingerprint(path_to_tagged_audio_file)
+
+
+@pytest.mark.parametrize("position", [0, 500_000, 999_999])
+def test_changed_audio_has_different_fingerprint(tmp_path, position):
+    audio_data = bytearray(_create_audio_data(1_000_000))
+
+    path_to_audio_file = tmp_path / "original.mp3"
+    path_to_audio_file.write_bytes(audio_data)
+
+    audio_data[position] ^= 0xff
+    path_to_changed_audio_file = tmp_path / "changed.mp3"
+    path_to_changed_audio_file.write_bytes(audio_data)
+
+    assert compute_audio_fingerprint(path_to_audio_file) != compute_audio_fingerprint(path_to_changed_audio_file)
+
+
+def test_truncated_audio_has_different_fingerprint(tmp_path):
+    audio_data = _create_audio_data(1_000_000)
+
+    path_to_audio_file = tmp_path / "original.mp3"
+    path_to_audio_file.write_bytes(audio_data)
+
+    # Truncating mid-file keeps the start and end samples equal, but not the size
+    path_to_truncated_audio_file = tmp_path / "truncated.mp3"
+    path_to_truncated_audio_file.write_bytes(audio_data[:400_000] + audio_data[400_001:])
+
+    assert compute_audio_fingerprint(path_to_audio_file) != compute_audio_fingerprint(path_to_truncated_audio_file)
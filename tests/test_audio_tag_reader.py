@@ -0,0 +1,124 @@
+# Python
+import os
+import logging
+from pathlib import Path
+
+# 3rd Party
+import pytest
+
+eyed3 = pytest.importorskip("eyed3")
+from eyed3.id3 import Tag, ID3_V1_1, ID3_V2_3, ID3_V2_4
+
+# 1st Party
+from src.components import audio_tag_reader
+from src.components import read_artist_and_title
+
+
+# A few silent MPEG1 layer III frames, so the file is recognized as mp3
+_audio_data = (bytes.fromhex("FFFB9064") + b"\x00" * 413) * 20
+
+_versions = {"v23": ID3_V2_3, "v24": ID3_V2_4, "v1": ID3_V1_1}
+
+
+def _write_tagged_audio_file(path: Path, version: str, artist, title, encoding=None, cover_art=False, comments=False):
+    path.write_bytes(_audio_data)
+
+    tag = Tag()
+    if artist is not None:
+        tag.artist = artist
+    if title is not None:
+        tag.title = title
+    tag.album = "Album"
+
+    # Large frames preceding or following the artist and title frames are skipped by the parser
+    if cover_art:
+        tag.images.set(3, os.urandom(300_000), "image/jpeg", "cover")
+    if comments:
+        for index in range(5):
+            tag.comments.set("x" * 5000, f"description {index}")
+
+    tag_save_arguments = {"version": _versions[version]}
+    if encoding:
+        tag_save_arguments["encoding"] = encoding
+
+    tag.save(str(path), **tag_save_arguments)
+
+
+def _write_id3v22_tagged_audio_file(path: Path):
+    """ eyed3 can't write ID3v2.2 tags, so the tag is assembled by hand. """
+    def create_frame(frame_id: bytes, text: str) -> bytes:
+        data = b"\x00" + text.encode("latin1")
+        return frame_id + len(data).to_bytes(3, "big") + data
+
+    body = create_frame(b"TAL", "Album") + create_frame(b"TP1", "Old Artist") + create_frame(b"TT2", "Old Title") + b"\x00" * 50
+    header = b"ID3\x02\x00\x00" + bytes([0, 0, (len(body) >> 7) & 0x7f, len(body) & 0x7f])
+
+    path.write_bytes(header + body + _audio_data)
+
+
+_tagged_audio_files = {
+    "v23_latin1":       dict(version="v23", artist="Björk", title="Jóga", encoding="latin1"),
+    "v23_utf16":        dict(version="v23", artist="Björk", title="Jóga", encoding="utf16"),
+    "v23_utf16_art":    dict(version="v23", artist="Sigur Rós", title="Hoppípolla ♪", encoding="utf16", cover_art=True),
+    "v24_latin1":       dict(version="v24", artist="Björk", title="Jóga", encoding="latin1"),
+    "v24_utf16":        dict(version="v24", artist="Björk", title="Jóga", encoding="utf16"),
+    "v24_utf8":         dict(version="v24", artist="Björk", title="Jóga", encoding="utf8"),
+    "v24_utf8_art":     dict(version="v24", artist="Sigur Rós", title="Hoppípolla ♪", encoding="utf8", cover_art=True),
+    "v23_no_artist":    dict(version="v23", artist=None, title="Title"),
+    "v24_empty_artist": dict(version="v24", artist="", title="Title"),
+    "v24_comments":     dict(version="v24", artist="Artist", title="Title", comments=True),
+    "v1":               dict(version="v1", artist="Artist v1", title="Title v1"),
+}
+
+
+_read_artist_and_title_with_eyed3 = audio_tag_reader._read_artist_and_title_with_eyed3
+
+
+@pytest.fixture
+def paths_read_with_eyed3(monkeypatch) -> list[Path]:
+    """ Records the paths of the files the parser couldn't read, and left to eyed3. """
+    eyed3.log.setLevel(logging.ERROR)
+
+    paths = []
+    monkeypatch.setattr(audio_tag_reader, "_read_artist_and_title_with_eyed3",
+        lambda path: paths.append(path) or _read_artist_and_title_with_eyed3(path))
+
+    return paths
+
+
+@pytest.mark.parametrize("name", _tagged_audio_files)
+def test_matches_eyed3(tmp_path, paths_read_with_eyed3, name):
+    path_to_audio_file = tmp_path / f"{name}.mp3"
+    _write_tagged_audio_file(path_to_audio_file, **_tagged_audio_files[name])
+
+    assert read_artist_and_title(path_to_audio_file) == _read_artist_and_title_with_eyed3(path_to_audio_file)
+    assert paths_read_with_eyed3 == []
+
+
+def test_reads_id3v22_tag(tmp_path, paths_read_with_eyed3):
+    path_to_audio_file = tmp_path / "v22.mp3"
+    _write_id3v22_tagged_audio_file(path_to_audio_file)
+
+    assert read_artist_and_title(path_to_audio_file) == ("Old Artist", "Old Title")
+    assert read_artist_and_title(path_to_audio_file) == _read_artist_and_title_with_eyed3(path_to_audio_file)
+    assert paths_read_with_eyed3 == []
+
+
+@pytest.mark.parametrize("data", [_audio_data, b"ab", b""], ids=["untagged", "tiny", "empty"])
+def test_untagged_file_matches_eyed3(tmp_path, paths_read_with_eyed3, data):
+    path_to_audio_file = tmp_path / "untagged.mp3"
+    path_to_audio_file.write_bytes(data)
+
+    assert read_artist_and_title(path_to_audio_file) == _read_artist_and_title_with_eyed3(path_to_audio_file)
+
+
+def test_unsynchronised_tag_is_read_by_eyed3(tmp_path, paths_read_with_eyed3):
+    path_to_audio_file = tmp_path / "unsynchronised.mp3"
+    _write_tagged_audio_file(path_to_audio_file, version="v23", artist="Artist", title="Title")
+
+    data = bytearray(path_to_audio_file.read_bytes())
+    data[5] |= 0x80
+    path_to_audio_file.write_bytes(bytes(data))
+
+    assert read_artist_and_title(path_to_audio_file) == _read_artist_and_title_with_eyed3(path_to_audio_file)
+    assert paths_read_with_eyed3 == [path_to_audio_file]
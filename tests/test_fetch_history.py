@@ -0,0 +1,57 @@
+# Python
+import time
+
+# 3rd Party
+import pytest
+
+pytest.importorskip("jsons")
+
+# 1st Party
+from src.lyric.fetchers.fetch_history import FetchHistory
+from src.lyric.fetchers.fetch_history import FetchErrorType
+
+
+def test_errors_persist_across_runs(tmp_path):
+    fetch_history = FetchHistory(tmp_path / "fetch_history.genius")
+    fetch_history.record_error("Artist - Song", FetchErrorType.NotFound)
+    fetch_history.close()
+
+    fetch_history = FetchHistory(tmp_path / "fetch_history.genius")
+    assert not fetch_history.is_due_for_retry("Artist - Song")
+    assert fetch_history.is_due_for_retry("Artist - Other Song")
+    assert fetch_history.get_retry_after("Artist - Song") > time.time()
+
+
+def test_journal_left_by_crash_is_replayed(tmp_path):
+    fetch_history = FetchHistory(tmp_path / "fetch_history.genius", batch_size=1)
+    fetch_history.record_error("Artist - Song", FetchErrorType.TimeOut)
+
+    # Without close(), only the journal holds the error
+    assert (tmp_path / "fetch_history.genius.journal").exists()
+
+    fetch_history = FetchHistory(tmp_path / "fetch_history.genius")
+    assert not fetch_history.is_due_for_retry("Artist - Song")
+    assert not (tmp_path / "fetch_history.genius.journal").exists()
+
+
+def test_errors_of_simultaneous_processes_are_merged(tmp_path):
+    """ Workers sharing a job queue share the fetch history files, each with a FetchHistory of its own. """
+    fetch_history_a = FetchHistory(tmp_path / "fetch_history.genius", batch_size=2, compaction_threshold=4)
+    fetch_history_b = FetchHistory(tmp_path / "fetch_history.genius", batch_size=2, compaction_threshold=4)
+
+    for index in range(10):
+        fetch_history_a.record_error(f"a{index}", FetchErrorType.NotFound)
+        fetch_history_b.record_error(f"b{index}", FetchErrorType.TimeOut)
+
+    # A worker starting meanwhile compacts the journal the others are appending to
+    FetchHistory(tmp_path / "fetch_history.genius").close()
+
+    fetch_history_a.close()
+    fetch_history_b.close()
+
+    fetch_history = FetchHistory(tmp_path / "fetch_history.genius")
+    filenames_with_errors = {filename for filename in fetch_history.fetch_errors if not fetch_history.is_due_for_retry(filename)}
+    assert filenames_with_errors == {f"a{index}" for index in range(10)} | {f"b{index}" for index in range(10)}
+
+    # Compaction picks up the errors recorded by other processes
+    assert not fetch_history_a.is_due_for_retry("b0")
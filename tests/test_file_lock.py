@@ -0,0 +1,56 @@
+# Python
+import os
+import time
+import threading
+
+# 3rd Party
+
+
+# 1st Party
+from src.components import FileLock
+
+
+def test_lock_excludes_other_holders(tmp_path):
+    path_to_counter = tmp_path / "counter"
+    path_to_counter.write_text("0")
+
+    def increment(amount: int):
+        # Each thread uses its own FileLock, as would each process
+        file_lock = FileLock(tmp_path / "counter.lock", poll_seconds=0.001)
+        for _ in range(amount):
+            with file_lock:
+                value = int(path_to_counter.read_text())
+                path_to_counter.write_text(str(value + 1))
+
+    threads = [threading.Thread(target=increment, args=(50,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert path_to_counter.read_text() == "200"
+    assert not (tmp_path / "counter.lock").exists()
+
+
+def test_stale_lock_is_removed(tmp_path):
+    path_to_lock = tmp_path / "file.lock"
+    path_to_lock.touch()
+
+    time_stale = time.time() - 60.0
+    os.utime(path_to_lock, (time_stale, time_stale))
+
+    with FileLock(path_to_lock, stale_seconds=30.0):
+        assert path_to_lock.exists()
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fresh_lock_is_waited_for(tmp_path):
+    path_to_lock = tmp_path / "file.lock"
+    path_to_lock.touch()
+
+    threading.Timer(0.3, path_to_lock.unlink).start()
+
+    time_start = time.monotonic()
+    with FileLock(path_to_lock, stale_seconds=30.0, poll_seconds=0.01):
+        assert time.monotonic() - time_start >= 0.25
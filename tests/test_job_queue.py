@@ -0,0 +1,162 @@
+# Python
+import os
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.components import JobQueue
+
+
+@pytest.fixture
+def path_to_queue_directory(tmp_path):
+    return tmp_path / "job_queue"
+
+
+def _expire_lease(job_queue: JobQueue, key: str):
+    time_expired = time.time() - job_queue.lease_seconds - 1.0
+    os.utime(job_queue._get_path_to_lease(key), (time_expired, time_expired))
+
+
+def test_job_is_claimed_by_a_single_worker(path_to_queue_directory):
+    job_queue_a = JobQueue(path_to_queue_directory, worker_id="a")
+    job_queue_b = JobQueue(path_to_queue_directory, worker_id="b")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue_a.try_claim(key)
+    assert not job_queue_b.try_claim(key)
+    assert not job_queue_a.try_claim(key)
+
+
+def test_completed_job_isnt_claimed_again(path_to_queue_directory):
+    job_queue_a = JobQueue(path_to_queue_directory, worker_id="a")
+    job_queue_b = JobQueue(path_to_queue_directory, worker_id="b")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue_a.try_claim(key)
+    job_queue_a.complete(key)
+
+    assert job_queue_b.is_done(key)
+    assert job_queue_b.get_keys_done() == {key}
+    assert not job_queue_b.try_claim(key)
+    assert list(job_queue_a.path_to_leases.iterdir()) == []
+
+
+def test_released_job_is_claimed_by_another_worker(path_to_queue_directory):
+    job_queue_a = JobQueue(path_to_queue_directory, worker_id="a")
+    job_queue_b = JobQueue(path_to_queue_directory, worker_id="b")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue_a.try_claim(key)
+    job_queue_a.release(key)
+
+    assert job_queue_b.try_claim(key)
+
+    # Releasing a job leased by another worker leaves its lease in place
+    job_queue_a.release(key)
+    assert not job_queue_a.try_claim(key)
+
+
+def test_expired_lease_is_reclaimed(path_to_queue_directory):
+    job_queue_a = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="a")
+    job_queue_b = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="b")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue_a.try_claim(key)
+    _expire_lease(job_queue_a, key)
+
+    assert job_queue_b.try_claim(key)
+    assert job_queue_b._read_worker_id(job_queue_b._get_path_to_lease(key)) == "b"
+    assert job_queue_b.metrics.counters["job_queue.leases_reclaimed"] == 1
+
+    # Worker a learns it lost the lease once it tries to renew it
+    job_queue_a._renew_leases()
+    assert key not in job_queue_a.keys_leased
+    assert job_queue_a.metrics.counters["job_queue.leases_lost"] == 1
+
+
+def test_seconds_until_lease_expiry(path_to_queue_directory):
+    job_queue = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="a")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue.get_seconds_until_lease_expiry([key]) is None
+
+    job_queue.try_claim(key)
+    assert 59.0 < job_queue.get_seconds_until_lease_expiry([key]) <= 60.0
+
+    _expire_lease(job_queue, key)
+    assert job_queue.get_seconds_until_lease_expiry([key]) == 0.0
+
+
+def test_heartbeat_keeps_lease_from_expiring(path_to_queue_directory):
+    job_queue_b = JobQueue(path_to_queue_directory, lease_seconds=0.4, worker_id="b")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    with JobQueue(path_to_queue_directory, lease_seconds=0.4, worker_id="a") as job_queue_a:
+        assert job_queue_a.try_claim(key)
+
+        time.sleep(1.0)
+        assert not job_queue_b.try_claim(key)
+
+    # Stopping releases the leases of jobs that weren't completed
+    assert job_queue_b.try_claim(key)
+
+
+def test_fresh_lease_found_while_reclaiming_doesnt_replace_newer_lease(path_to_queue_directory, monkeypatch):
+    """ Worker a finds b's lease expired, but b renews it before a renames it away, and c claims the job in between. """
+    job_queue_a = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="a")
+    job_queue_b = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="b")
+    job_queue_c = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="c")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue_b.try_claim(key)
+    monkeypatch.setattr(job_queue_a, "_get_lease_age_seconds", lambda key: 61.0)
+
+    rename = os.rename
+    def rename_then_claim(source, destination):
+        rename(source, destination)
+        assert job_queue_c._create_lease(key)
+    monkeypatch.setattr(os, "rename", rename_then_claim)
+
+    assert not job_queue_a._reclaim_expired_lease(key)
+
+    assert job_queue_a._read_worker_id(job_queue_a._get_path_to_lease(key)) == "c"
+    assert [path.name for path in job_queue_a.path_to_leases.iterdir()] == [f"{key}.lease"]
+
+
+def test_fresh_lease_found_while_reclaiming_is_restored(path_to_queue_directory, monkeypatch):
+    job_queue_a = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="a")
+    job_queue_b = JobQueue(path_to_queue_directory, lease_seconds=60.0, worker_id="b")
+    key = JobQueue.get_key("/music/Artist - Song.mp3")
+
+    assert job_queue_b.try_claim(key)
+    monkeypatch.setattr(job_queue_a, "_get_lease_age_seconds", lambda key: 61.0)
+
+    assert not job_queue_a._reclaim_expired_lease(key)
+
+    assert job_queue_a._read_worker_id(job_queue_a._get_path_to_lease(key)) == "b"
+    assert [path.name for path in job_queue_a.path_to_leases.iterdir()] == [f"{key}.lease"]
+
+
+def test_simultaneous_workers_claim_each_job_once(path_to_queue_directory):
+    keys = [JobQueue.get_key(f"/music/Artist - Song {index}.mp3") for index in range(200)]
+    job_queues = [JobQueue(path_to_queue_directory, worker_id=f"worker {index}") for index in range(8)]
+
+    barrier = threading.Barrier(len(job_queues))
+
+    def claim_all(job_queue: JobQueue) -> list[str]:
+        barrier.wait()
+        keys_claimed = [key for key in keys if job_queue.try_claim(key)]
+        for key in keys_claimed:
+            job_queue.complete(key)
+        return keys_claimed
+
+    with ThreadPoolExecutor(max_workers=len(job_queues)) as executor:
+        keys_claimed_per_worker = list(executor.map(claim_all, job_queues))
+
+    keys_claimed = [key for keys_claimed in keys_claimed_per_worker for key in keys_claimed]
+    assert sorted(keys_claimed) == sorted(keys)
+    assert job_queues[0].get_keys_done() == set(keys)
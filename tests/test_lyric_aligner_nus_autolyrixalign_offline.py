@@ -0,0 +1,120 @@
+# Python
+import os
+import sys
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.developer_options import DeveloperOptions
+from src.lyric.aligners import LyricAlignerNUSAutoLyrixAlignOffline
+from src.lyric.aligners import AlignmentCache
+from src.lyric.dataclasses_and_types import LyricAlignTask
+
+
+pytestmark = pytest.mark.skipif(sys.platform == "win32", reason="The stub aligner is a shell script.")
+
+
+def _create_stub_aligner(path_to_aligner: Path) -> Path:
+    """ Creates a RunAlignment.sh that 'aligns' each word of the lyric file to a second of audio, after a short delay. """
+    path_to_aligner.mkdir()
+
+    path_to_script = path_to_aligner / "RunAlignment.sh"
+    path_to_script.write_text(
+        "#!/bin/sh\n"
+        "sleep 0.2\n"
+        "t=0\n"
+        "for word in $(cat \"$2\"); do\n"
+        "  echo \"$t.0 $t.5 $word\" >> \"$3\"\n"
+        "  t=$((t+1))\n"
+        "done\n")
+    os.chmod(path_to_script, 0o755)
+
+    return path_to_aligner
+
+
+@pytest.fixture
+def aligner(tmp_path, monkeypatch):
+    monkeypatch.setattr(DeveloperOptions, "model_execution_application", DeveloperOptions.ModelExecutionApplication.Native)
+
+    path_to_output = tmp_path / "output"
+    path_to_output.mkdir()
+
+    return LyricAlignerNUSAutoLyrixAlignOffline(
+        tmp_path / "scratch",
+        _create_stub_aligner(tmp_path / "aligner"),
+        path_to_output)
+
+
+def test_simultaneous_alignments_use_separate_job_directories(aligner, tmp_path):
+    path_to_library = tmp_path / "library"
+    path_to_library.mkdir()
+
+    tasks_and_lyrics = []
+    for index in range(8):
+        path_to_audio_file = path_to_library / f"Artist {index} - Song {index}.mp3"
+        path_to_audio_file.write_bytes(bytes([index]) * 64)
+
+        path_to_lyric_input = path_to_library / f"Artist {index} - Song {index}.txt"
+        path_to_lyric_input.write_text(f"song{index} word{index}\n")
+
+        tasks_and_lyrics.append((LyricAlignTask(path_to_audio_file), path_to_lyric_input))
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        aligner_outputs = list(executor.map(lambda task_and_lyric: aligner.align_lyrics(*task_and_lyric), tasks_and_lyrics))
+
+    # Each alignment's output stems from its own lyrics, rather than those of an alignment executing alongside it
+    for index, aligner_output in enumerate(aligner_outputs):
+        assert aligner_output.automated.get_words_lowercase() == [f"song{index}", f"word{index}"]
+
+    assert list((tmp_path / "scratch").iterdir()) == []
+
+
+def test_failed_alignment_returns_empty_output(aligner, tmp_path):
+    (tmp_path / "aligner" / "RunAlignment.sh").write_text("#!/bin/sh\nexit 1\n")
+
+    path_to_audio_file = tmp_path / "Artist - Song.mp3"
+    path_to_audio_file.write_bytes(b"\0" * 64)
+    path_to_lyric_input = tmp_path / "Artist - Song.txt"
+    path_to_lyric_input.write_text("hello\n")
+
+    aligner_output = aligner.align_lyrics(LyricAlignTask(path_to_audio_file), path_to_lyric_input)
+
+    assert aligner_output.automated is None
+    assert list((tmp_path / "scratch").iterdir()) == []
+
+
+def test_renamed_audio_file_reuses_output_from_alignment_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(DeveloperOptions, "model_execution_application", DeveloperOptions.ModelExecutionApplication.Native)
+
+    path_to_output = tmp_path / "output"
+    path_to_output.mkdir()
+
+    aligner = LyricAlignerNUSAutoLyrixAlignOffline(
+        tmp_path / "scratch",
+        _create_stub_aligner(tmp_path / "aligner"),
+        path_to_output,
+        alignment_cache=AlignmentCache(tmp_path / "alignment_cache"))
+
+    path_to_lyric_input = tmp_path / "lyrics.txt"
+    path_to_lyric_input.write_text("hello world\n")
+
+    path_to_audio_file = tmp_path / "Artist - Song.mp3"
+    path_to_audio_file.write_bytes(b"\x01" * 64)
+
+    task = LyricAlignTask(path_to_audio_file, lyric_text_alignment_ready="hello world")
+    aligner_output = aligner.align_lyrics(task, path_to_lyric_input)
+
+    # The model mustn't execute again
+    (tmp_path / "aligner" / "RunAlignment.sh").write_text("#!/bin/sh\nexit 1\n")
+
+    path_to_renamed_audio_file = path_to_audio_file.rename(tmp_path / "Artist - Song (Remastered).mp3")
+
+    task_renamed = LyricAlignTask(path_to_renamed_audio_file, lyric_text_alignment_ready="hello world")
+    aligner_output_renamed = aligner.align_lyrics(task_renamed, path_to_lyric_input)
+
+    assert aligner_output_renamed.automated.get_words_lowercase() == aligner_output.automated.get_words_lowercase()
+    assert aligner.metrics.counters["aligner.alignment_cache_hit"] == 1
+    assert (path_to_output / "Artist - Song (Remastered).nusalaoffline").exists()
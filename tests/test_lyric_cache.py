@@ -0,0 +1,76 @@
+# Python
+import sqlite3
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.lyric.fetchers import LyricCacheSidecarFiles
+from src.lyric.fetchers import LyricCacheSqlite
+
+
+@pytest.fixture(params=["SidecarFiles", "Sqlite"])
+def lyric_cache(request, tmp_path):
+    if request.param == "Sqlite":
+        lyric_cache = LyricCacheSqlite(tmp_path / "lyric_cache.sqlite")
+    else:
+        lyric_cache = LyricCacheSidecarFiles(tmp_path)
+
+    yield lyric_cache
+
+    lyric_cache.close()
+
+
+def test_cached_lyrics_are_retrieved(lyric_cache):
+    assert lyric_cache.get(".genius", "Artist - Song.2.0").source is None
+
+    lyric_cache.set_source(".genius", "Artist - Song.2.0", "source", "Artist", "Song 2.0")
+    lyric_cache.set_text_sanitized(".genius", "Artist - Song.2.0", "sanitized ♪")
+
+    cached_lyrics = lyric_cache.get(".genius", "Artist - Song.2.0")
+    assert (cached_lyrics.source, cached_lyrics.text_sanitized) == ("source", "sanitized ♪")
+    assert (cached_lyrics.artist, cached_lyrics.song_name) == ("Artist", "Song 2.0")
+
+    lyric_cache.remove_text_sanitized(".genius", "Artist - Song.2.0")
+    assert lyric_cache.get(".genius", "Artist - Song.2.0").text_sanitized is None
+
+
+def test_song_names_are_retrieved_with_all_sources(lyric_cache):
+    lyric_cache.set_source(".genius", "01 Track", "source", "Artist", "Song")
+    lyric_cache.set_source(".genius", "02 Track", "source")
+    lyric_cache.set_source(".other", "03 Track", "source", "Artist", "Song")
+
+    cached_songs = {key: (cached.artist, cached.song_name) for key, cached in lyric_cache.get_all_with_source(".genius")}
+
+    assert cached_songs == {"01 Track": ("Artist", "Song"), "02 Track": (None, None)}
+
+
+def test_sidecar_files_are_imported_with_song_names(tmp_path):
+    sidecar_files = LyricCacheSidecarFiles(tmp_path)
+    sidecar_files.set_source(".genius", "01 Track", "source", "Artist", "Song")
+    sidecar_files.set_text_sanitized(".genius", "01 Track", "sanitized")
+
+    with LyricCacheSqlite(tmp_path / "lyric_cache.sqlite") as lyric_cache:
+        assert lyric_cache.import_sidecar_files(sidecar_files) == 1
+
+        cached_lyrics = lyric_cache.get(".genius", "01 Track")
+        assert cached_lyrics.text_sanitized == "sanitized"
+        assert (cached_lyrics.artist, cached_lyrics.song_name) == ("Artist", "Song")
+
+
+def test_database_predating_song_names_is_upgraded(tmp_path):
+    connection = sqlite3.connect(tmp_path / "lyric_cache.sqlite")
+    connection.execute("CREATE TABLE lyrics (namespace TEXT NOT NULL, key TEXT NOT NULL, source TEXT, "
+                       "text_sanitized TEXT, PRIMARY KEY (namespace, key))")
+    connection.execute("INSERT INTO lyrics VALUES ('.genius', 'Artist - Song', 'source', 'sanitized')")
+    connection.commit()
+    connection.close()
+
+    with LyricCacheSqlite(tmp_path / "lyric_cache.sqlite") as lyric_cache:
+        cached_lyrics = lyric_cache.get(".genius", "Artist - Song")
+        assert (cached_lyrics.source, cached_lyrics.artist) == ("source", None)
+
+        # Re-caching the source without song names keeps those recorded
+        lyric_cache.set_source(".genius", "Artist - Song", "source", "Artist", "Song")
+        lyric_cache.set_source(".genius", "Artist - Song", "source updated")
+        assert lyric_cache.get(".genius", "Artist - Song").song_name == "Song"
@@ -0,0 +1,79 @@
+# Python
+
+# 3rd Party
+import pytest
+
+jsonpickle = pytest.importorskip("jsonpickle")
+pytest.importorskip("lyricsgenius")
+from lyricsgenius.song import Song
+
+# 1st Party
+from src.lyric.fetchers import LyricCacheSidecarFiles
+from src.lyric.fetchers import LyricCacheSqlite
+from src.lyric.fetchers import ResanitizationResult
+from src.lyric.fetchers.lyric_cache_resanitizer import resanitize_lyric_cache
+from src.lyric.fetchers.lyric_fetcher_pypi_lyricsgenius import LyricFetcherPyPiLyricsGenius
+
+
+def _create_genius_source(artist: str, title: str) -> str:
+    lyrics = f"{title} Lyrics[Intro]\nIs this the real life?\nIs this just fantasy?\n\n[Verse 1]\nCaught in a landslide, no escape from reality82Embed"
+    song = Song({"url": "https://genius.com/", "api_path": "/songs/1", "id": 1, "title": title,
+                 "primary_artist": {"name": artist}}, lyrics)
+    return jsonpickle.encode(song)
+
+
+@pytest.fixture(params=["SidecarFiles", "Sqlite"])
+def lyric_cache(request, tmp_path):
+    if request.param == "Sqlite":
+        lyric_cache = LyricCacheSqlite(tmp_path / "lyric_cache.sqlite")
+    else:
+        lyric_cache = LyricCacheSidecarFiles(tmp_path)
+
+    yield lyric_cache
+
+    lyric_cache.close()
+
+
+@pytest.fixture
+def lyric_fetcher(tmp_path, lyric_cache):
+    lyric_fetcher = LyricFetcherPyPiLyricsGenius("token", tmp_path, lyric_cache)
+    yield lyric_fetcher
+    lyric_fetcher.close()
+
+
+def test_resanitize_lyric_cache(lyric_fetcher, lyric_cache):
+    namespace = lyric_fetcher.file_extension
+    text_sanitized_expected = "Is this the real life?\nIs this just fantasy?\nCaught in a landslide, no escape from reality"
+    text_sanitized_outdated = "Is this the real life?\n[Verse 1]"
+
+    # Unchanged
+    lyric_cache.set_source(namespace, "Queen - Bohemian Rhapsody", _create_genius_source("Queen", "Bohemian Rhapsody"))
+    lyric_cache.set_text_sanitized(namespace, "Queen - Bohemian Rhapsody", text_sanitized_expected)
+
+    # Changed, named by file tags, so the key doesn't reveal the artist and song name
+    lyric_cache.set_source(namespace, "01 Track", _create_genius_source("Queen", "Bohemian Rhapsody"), "Queen", "Bohemian Rhapsody")
+    lyric_cache.set_text_sanitized(namespace, "01 Track", text_sanitized_outdated)
+
+    # No longer valid, as the source is of another song
+    lyric_cache.set_source(namespace, "Queen - Killer Queen", _create_genius_source("Someone Else", "Another Song"))
+    lyric_cache.set_text_sanitized(namespace, "Queen - Killer Queen", text_sanitized_outdated)
+
+    # Cached before the artist and song name were recorded, and not revealed by the key
+    lyric_cache.set_source(namespace, "02 Track", _create_genius_source("Queen", "Bohemian Rhapsody"))
+    lyric_cache.set_text_sanitized(namespace, "02 Track", text_sanitized_outdated)
+
+    result = resanitize_lyric_cache(lyric_fetcher, lyric_cache, max_workers=1, batch_size=2)
+
+    assert result == ResanitizationResult(amount_unchanged=1, amount_updated=1, amount_removed=1, amount_skipped=1)
+
+    assert lyric_cache.get(namespace, "Queen - Bohemian Rhapsody").text_sanitized == text_sanitized_expected
+    assert lyric_cache.get(namespace, "01 Track").text_sanitized == text_sanitized_expected
+    assert lyric_cache.get(namespace, "Queen - Killer Queen").text_sanitized is None
+    assert lyric_cache.get(namespace, "02 Track").text_sanitized == text_sanitized_outdated
+
+    # Sources are kept regardless
+    assert lyric_cache.get(namespace, "Queen - Killer Queen").source is not None
+
+    # Re-sanitizing again changes nothing
+    result = resanitize_lyric_cache(lyric_fetcher, lyric_cache, max_workers=1)
+    assert result == ResanitizationResult(amount_unchanged=3, amount_skipped=1)
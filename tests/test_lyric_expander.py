@@ -0,0 +1,63 @@
+# Python
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.lyric import LyricExpander
+
+
+@pytest.fixture
+def lyric_expander():
+    return LyricExpander()
+
+
+def test_lyrics_without_multipliers_are_unchanged(lyric_expander):
+    assert lyric_expander.expand_lyrics("song", "Hello world\nGood-bye now") == "Hello world\nGood-bye now"
+
+
+def test_multiplier_is_repeated_on_separate_lines(lyric_expander):
+    assert lyric_expander.expand_lyrics("song", "a {la|3} b") == "a la\nla\nla\n b"
+
+
+def test_several_multipliers_are_expanded(lyric_expander):
+    assert lyric_expander.expand_lyrics("song", "{q|2} {r|0}") == "q\nq\n "
+
+
+def test_nested_multipliers_are_expanded_innermost_first(lyric_expander):
+    assert lyric_expander.expand_lyrics("song", "{x {y|2}|2}") == "x y\ny\n\nx y\ny\n\n"
+
+
+@pytest.mark.parametrize("lyrics", [
+    "open {la la",
+    "close la|2} x",
+])
+def test_unmatched_braces_are_kept(lyric_expander, lyrics):
+    assert lyric_expander.expand_lyrics("song", lyrics) == lyrics
+
+
+def test_unclosed_multiplier_keeps_enclosed_multipliers_expanded(lyric_expander):
+    assert lyric_expander.expand_lyrics("song", "{open {la|2} la") == "{open la\nla\n la"
+
+
+def test_multipliers_nested_too_deeply_are_kept_as_is():
+    lyric_expander = LyricExpander(max_nesting_depth=2)
+
+    assert lyric_expander.expand_lyrics("song", "{a{b{c|2}|2}|2}") == "ab{c|2}\nb{c|2}\n\nab{c|2}\nb{c|2}\n\n"
+
+
+@pytest.mark.parametrize("lyrics", [
+    "{" + "z" * 10 + "|50}",
+    "{ab|1234567890}",
+    "{{{{{{{la|99}|99}|99}|99}|99}|99}|99}",
+])
+def test_expanded_length_is_capped(lyrics):
+    lyric_expander = LyricExpander(max_expanded_length=1000)
+
+    assert len(lyric_expander.expand_lyrics("song", lyrics)) <= 1000
+
+
+def test_multipliers_beyond_length_cap_are_expanded_once():
+    lyric_expander = LyricExpander(max_expanded_length=100)
+
+    assert lyric_expander.expand_lyrics("song", "{" + "z" * 10 + "|50}") == "z" * 10 + "\n"
@@ -0,0 +1,99 @@
+# Python
+import random
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.lyric import LyricMatcher
+from src.lyric.aligners import WordTimings
+from src.lyric.dataclasses_and_types import LyricMatchingMethod
+
+
+def _get_longest_common_subsequence_length(words_a: list[str], words_b: list[str]) -> int:
+    """ Unbanded reference implementation. """
+    lengths_previous = [0] * (len(words_b) + 1)
+
+    for word_a in words_a:
+        lengths = [0]
+        for column, word_b in enumerate(words_b, start=1):
+            if word_a == word_b:
+                lengths.append(lengths_previous[column - 1] + 1)
+            else:
+                lengths.append(max(lengths_previous[column], lengths[column - 1]))
+        lengths_previous = lengths
+
+    return lengths_previous[-1]
+
+
+def _assert_valid_match(match_indices, words_aligned: list[str], words_structured: list[str]) -> int:
+    """ Asserts each match pairs identical words, in order and at most once, and returns the number of matches. """
+    matched = [(index_structured, index_aligned) for index_structured, index_aligned in enumerate(match_indices) if index_aligned >= 0]
+
+    for index_structured, index_aligned in matched:
+        assert words_aligned[index_aligned] == words_structured[index_structured]
+
+    indices_aligned = [index_aligned for _, index_aligned in matched]
+    assert indices_aligned == sorted(set(indices_aligned))
+
+    return len(matched)
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_global_alignment_matches_longest_common_subsequence(seed):
+    randomizer = random.Random(seed)
+    vocabulary = ["la", "love", "you", "me", "now", "breath*", "oh"][:randomizer.randint(2, 7)]
+
+    words_structured = [randomizer.choice(vocabulary) for _ in range(randomizer.randint(0, 40))]
+    words_aligned = [randomizer.choice(vocabulary) for _ in range(randomizer.randint(0, 40))]
+
+    # A band exceeding both word counts considers every alignment, so the result must be optimal
+    lyric_matcher = LyricMatcher("1.0", band_radius=64)
+    match_indices = lyric_matcher._match_global_alignment(words_aligned, words_structured)
+
+    assert len(match_indices) == len(words_structured)
+    assert _assert_valid_match(match_indices, words_aligned, words_structured) == \
+        _get_longest_common_subsequence_length(words_aligned, words_structured)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_narrow_band_still_returns_valid_match(seed):
+    randomizer = random.Random(seed)
+    vocabulary = ["la", "love", "you", "me", "now"]
+
+    words_structured = [randomizer.choice(vocabulary) for _ in range(randomizer.randint(1, 300))]
+    words_aligned = [randomizer.choice(vocabulary) for _ in range(randomizer.randint(1, 300))]
+
+    lyric_matcher = LyricMatcher("1.0", band_radius=4)
+    match_indices = lyric_matcher._match_global_alignment(words_aligned, words_structured)
+
+    _assert_valid_match(match_indices, words_aligned, words_structured)
+
+
+def test_global_alignment_recovers_from_inserted_and_skipped_words():
+    words_structured = "time to settle the score man it's time to play".split()
+    # The aligner inserted a breath and skipped 'man'
+    words_aligned = "time to breath* settle the score it's time to play".split()
+
+    match_indices = LyricMatcher("1.0")._match_global_alignment(words_aligned, words_structured)
+
+    assert list(match_indices) == [0, 1, 3, 4, 5, -1, 6, 7, 8, 9]
+
+
+def test_global_alignment_of_no_aligned_words_matches_nothing():
+    assert list(LyricMatcher("1.0")._match_global_alignment([], ["la", "la"])) == [-1, -1]
+
+
+def test_match_aligned_lyrics_applies_timings_of_matched_words():
+    lyric_matcher = LyricMatcher("1.0")
+
+    lyrics_structured = lyric_matcher.convert_lyrics_string_to_match_lyrics(["Hello world", "Good-bye now"])
+    lyrics_time_aligned = WordTimings.from_text("1.0 1.5 HELLO\n1.5 1.8 BREATH*\n2.0 2.5 WORLD\n3.0 3.5 GOOD\n4.0 4.5 NOW\n")
+
+    lyrics_matched, match_result = lyric_matcher.match_aligned_lyrics_with_structured_lyrics(
+        lyrics_time_aligned, lyrics_structured, LyricMatchingMethod.GlobalAlignment)
+
+    timings = [(lyric.word_alignment.lower(), lyric.time_start, lyric.time_end) for lyric in lyrics_matched]
+    assert timings[:2] == [("hello", 1.0, 1.5), ("world", 2.0, 2.5)]
+    assert timings[-1] == ("now", 4.0, 4.5)
+    assert (match_result.words_matched, match_result.words_total) == (4, 5)
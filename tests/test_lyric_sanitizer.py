@@ -0,0 +1,42 @@
+# Python
+
+# 3rd Party
+import pytest
+
+# 1st Party
+from src.lyric import LyricSanitizer
+from src.lyric.lyric_sanitizer import SanitizationRules
+
+
+@pytest.mark.parametrize("lyrics_raw", [
+    "Hello world\nGood-bye now2Embed",
+    "Hello world\nGood-bye nowEmbed",
+    "Hello world\nGood-bye nowYou might also like82Embed",
+    "Hello world\nGood-bye now82Embed\n",
+    "Hello world\nGood-bye nowYou might also likeEmbed \n\n",
+    "Hello world\nGood-bye now\n",
+])
+def test_trailing_embed_is_removed(lyrics_raw):
+    lyric_sanitizer = LyricSanitizer(SanitizationRules(remove_trailing_embed=True))
+
+    assert lyric_sanitizer.sanitize(lyrics_raw) == "Hello world\nGood-bye now"
+
+
+def test_embed_within_lyrics_is_kept():
+    lyric_sanitizer = LyricSanitizer(SanitizationRules(remove_trailing_embed=True))
+
+    assert lyric_sanitizer.sanitize("Embed me\nYou might also like it\nlast") == "Embed me\nYou might also like it\nlast"
+
+
+def test_trailing_embed_is_kept_unless_requested():
+    assert LyricSanitizer().sanitize("Good-bye now2Embed") == "Good-bye now2Embed"
+
+
+def test_bracketed_text_and_empty_lines_are_removed():
+    lyrics_raw = "[Verse 1]\n  Hello  there \n\n[Chorus]\nwhite’s [x2] home\n"
+
+    assert LyricSanitizer().sanitize(lyrics_raw) == "Hello  there\nwhite's  home"
+
+
+def test_bracketed_text_doesnt_span_lines():
+    assert LyricSanitizer().sanitize("[unclosed\nline]") == "[unclosed\nline]"
@@ -0,0 +1,63 @@
+# Python
+import time
+import threading
+
+# 3rd Party
+
+
+# 1st Party
+from src.components import RateLimit
+from src.components import RateLimiter
+
+
+def test_burst_is_granted_immediately_then_rate_applies():
+    rate_limiter = RateLimiter(RateLimit(requests_per_second=20.0, burst=5))
+
+    time_start = time.monotonic()
+    for _ in range(5):
+        assert rate_limiter.acquire()
+    assert time.monotonic() - time_start < 0.1
+
+    for _ in range(5):
+        assert rate_limiter.acquire()
+    assert time.monotonic() - time_start >= 0.2
+
+
+def test_daily_quota_persists_across_runs(tmp_path):
+    rate_limit = RateLimit(requests_per_second=1000.0, burst=1000, daily_quota=10)
+
+    rate_limiter = RateLimiter(rate_limit, tmp_path / "quota_usage.json")
+    assert sum(rate_limiter.acquire() for _ in range(6)) == 6
+
+    rate_limiter = RateLimiter(rate_limit, tmp_path / "quota_usage.json")
+    assert rate_limiter.get_quota_remaining() == 4
+    assert sum(rate_limiter.acquire() for _ in range(6)) == 4
+
+
+def test_quota_marked_exhausted_refuses_requests(tmp_path):
+    rate_limiter = RateLimiter(RateLimit(requests_per_second=1000.0, daily_quota=10), tmp_path / "quota_usage.json")
+
+    rate_limiter.mark_quota_exhausted()
+
+    assert rate_limiter.get_quota_remaining() == 0
+    assert not rate_limiter.acquire()
+
+
+def test_daily_quota_is_shared_by_simultaneous_processes(tmp_path):
+    """ Workers sharing a job queue share the quota usage file, each with a RateLimiter of its own. """
+    rate_limit = RateLimit(requests_per_second=1000.0, burst=1000, daily_quota=50)
+    rate_limiters = [RateLimiter(rate_limit, tmp_path / "quota_usage.json") for _ in range(4)]
+
+    amounts_granted = [0] * len(rate_limiters)
+
+    def acquire_all(index: int):
+        amounts_granted[index] = sum(rate_limiters[index].acquire() for _ in range(30))
+
+    threads = [threading.Thread(target=acquire_all, args=(index,)) for index in range(len(rate_limiters))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sum(amounts_granted) == 50
+    assert all(rate_limiter.get_quota_remaining() == 0 for rate_limiter in rate_limiters)